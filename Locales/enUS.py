@@ -30,7 +30,7 @@ TRANSLATIONS = {
         "fresh": "Fresh",
         "fresh_tooltip": "Create a fresh log file on each export (overwrites existing).",
         "append": "Append",
-        "append_tooltip": "Append each export to the existing log file (keeps up to 10-20 sessions based on verbosity).",
+        "append_tooltip": "Add each export as a new session to a log archive (keeps up to 10-20 sessions based on verbosity; older sessions are compressed).",
         "check_updates": "Check for updates",
         "check_updates_tooltip": "When enabled, check for new releases on GitHub at startup.",
         "restore_defaults": "Restore Defaults",
@@ -123,6 +123,8 @@ TRANSLATIONS = {
         "log_exported": "Log exported successfully to:\n{}",
         "export_error": "Export Error",
         "export_failed": "Failed to export log:\n{}",
+        "log_archive_files": "Log Archives",
+        "log_archive_invalid": "This file is not a log archive:\n{}\n\nChoose a new file name or an archive created by Append mode.",
         "addons_rebuilt": "Rebuilt AddOns.txt entries.\nTotal written: {}\nTotal removed: {}",
 
         # Log messages
@@ -154,6 +156,10 @@ TRANSLATIONS = {
         "preview_label": "Preview",
         "preview_hint": "(Click image to enlarge • Click again or press Esc to close)",
         "screenshots_not_found": "Screenshots folder not found for this version.",
+        "folder_section": "Folders",
+        "screenshots_section": "Screenshots",
+        "no_cleanable_folders": "No cleanable folders found for this version.",
+        "screenshots_selected": "Selected: {} of {} screenshot(s), {}",
 
         # Optimization Suggestions tab - detailed content
         "opt_sug_header": "Manual Optimization Suggestions",
@@ -271,6 +277,8 @@ TRANSLATIONS = {
         "perf_moved_trash": "[{}] Moved to trash: {}",
         "perf_deleted": "[{}] Deleted: {}",
         "perf_error_deleting": "[{}] ERROR deleting {}: {}",
+        "perf_removed_empty_dir": "[{}] Removed empty folder: {}",
+        "empty_dirs_removed": "Removed {} empty folder(s)",
 
         "select_valid_wow_optimizer": "Select a valid World of Warcraft folder in Options to enable per-version views.",
         "select_valid_wow_folder_cleaner": "Select a valid World of Warcraft folder in Options to enable Folder Cleaner.",
@@ -310,6 +318,17 @@ TRANSLATIONS = {
 
         # Orphan Cleaner
         "found_orphans_count": "Found {} orphan SavedVariable(s).",
+        "tree_group_summary": "{}  ({} file(s), {})",
+        "filter_label": "Filter:",
+        "filter_clear": "Clear",
+        "filter_showing": "Showing {} of {} file(s)",
+        "filter_help": "Type to filter the results; every term must match:\n"
+                       "• text: part of the file name\n"
+                       "• * and ?: wildcards, e.g. *Bagnon*.lua\n"
+                       "• ext:lua,bak: file extensions\n"
+                       "• v:retail: version\n"
+                       "• size:>1MB, size:<10KB, size:10KB-2MB: size range\n"
+                       "Select all and version checkboxes only affect the shown files.",
         "no_orphans_found": "No orphaned SavedVariables found.",
         "no_orphans_selected": "No orphaned files selected.",
         "confirm_action_orphans": "Are you sure you want to {} {} orphaned SavedVariables?",
@@ -400,5 +419,126 @@ TRANSLATIONS = {
         # Folder Cleaner - Log messages
         "folder_cleaner_found": "[FolderCleaner] Found: {}",
         "folder_cleaner_total": "[FolderCleaner] Total cleanable folders: {}",
+
+        # Analytics tab
+        "analytics": "Analytics",
+        "analytics_description": "Read-only reports that show which addons and files are worth cleaning up. Nothing is deleted from this tab.",
+        "analytics_col_name": "Name",
+        "analytics_col_detail": "Details",
+        "analytics_col_size": "Size",
+        "analytics_item_count": "{} item(s)",
+        "analytics_done": "{}: {} item(s) found.",
+        "analytics_nothing_found": "{}: nothing found.",
+        "analytics_failed": "{} failed: {}",
+        "analytics_unused_addons": "Unused AddOns",
+        "analytics_disabled_everywhere": "Disabled on every character",
+        "analytics_enabled_nowhere": "Not enabled on any character",
+        "analytics_storage_breakdown": "Storage Breakdown",
+        "analytics_storage_detail": "{} file(s), {} on disk",
+        "analytics_storage_progress": "Scanning {}: {} file(s), {} so far…",
+        "analytics_largest_file": "Largest file: {}",
+        "analytics_largest_saved_variables": "Largest SavedVariables: {}",
+        "analytics_addon_usage": "AddOn Disk Usage",
+        "analytics_addon_usage_detail": "{} file(s), newest {}",
+        "analytics_duplicate_libraries": "Duplicate Libraries",
+        "analytics_library_copies": "{} ({} identical copies)",
+        "analytics_file_count": "{} file(s)",
+        "analytics_redundant": "{} redundant file(s)",
+        "analytics_stale_addons": "Stale AddOns",
+        "analytics_months": "months",
+        "analytics_last_written": "SavedVariables last written {}",
+
+        # Analytics - Log messages
+        "addon_matrix_unused": "[AddonMatrix] {}: not enabled on any character: {}",
+        "addon_matrix_total_unused": "[AddonMatrix] Total unused addons: {}",
+        "addon_stale_found": "[AddonAnalytics] {}: {} last written {}",
+        "addon_stale_total": "[AddonAnalytics] Total addons unused for {1}+ months: {0}",
+        "dedupe_library_group": "[Dedupe] {0}: {1} identical copies, {2} redundant",
+        "dedupe_library_total": "[Dedupe] Redundant embedded library copies: {0} ({1})",
+        "dedupe_file_group": "[Dedupe] {0}: {1} identical copies, {2} reclaimable",
+        "dedupe_file_total": "[Dedupe] Cross-version duplicate groups: {0} ({1} reclaimable)",
+
+        # Duplicates tab
+        "duplicates": "Duplicates",
+        "duplicates_description": "Finds files that are identical across your installed WoW versions (AddOns, Screenshots and WTF). Only screenshot copies can be removed; each version loads its own AddOns and WTF files, so those duplicates are report-only. At least one copy of every group is always kept.",
+        "duplicates_select_extra": "Select Extra Copies",
+        "duplicates_min_size": "Minimum size:",
+        "duplicates_col_file": "File",
+        "duplicates_col_reclaimable": "Reclaimable",
+        "duplicates_report_only": "Report only",
+        "duplicates_group": "{} ({} identical copies)",
+        "duplicates_found": "Duplicate groups found: {} ({} reclaimable)",
+        "duplicates_selected": "Selected: {} file(s), {}",
+        "duplicates_all_copies_selected": "Every copy of at least one group is selected. Leave one copy of each file unchecked.",
+        "duplicates_processed": "Duplicates: processed {} file(s).",
+
+        # Screenshot optimizer
+        "screenshot_optimizer": "Optimize Screenshots",
+        "screenshot_optimizer_description": "Shrink screenshots instead of deleting them. Converted or archived originals are then deleted or moved to the recycle bin according to the File Action option.",
+        "screenshot_mode_convert": "Convert TGA/BMP/PNG to",
+        "screenshot_quality": "Quality:",
+        "screenshot_mode_archive": "Archive screenshots older than",
+        "screenshot_days_old": "days (zip in Screenshots/Archive)",
+        "screenshot_start": "Start",
+        "close": "Close",
+        "screenshot_progress": "Processed {} of {}",
+        "screenshot_nothing_to_do": "No TGA, BMP or PNG screenshots to convert.",
+        "screenshot_confirm_convert": "Convert {} screenshot(s) to {} (quality {}) and remove the originals?",
+        "screenshot_confirm_archive": "Archive screenshots older than {} days and remove the originals?",
+        "screenshot_result_line": "{}: {} screenshot(s), saved {}",
+        "screenshot_convert_done": "Screenshots converted: {} original(s) removed, {} saved",
+        "screenshot_archive_done": "Screenshots archived: {} original(s) removed, {} saved",
+
+        # Similar screenshots
+        "similar_select": "Select Similar",
+        "similar_selected": "{}: {} cluster(s) of similar screenshots, {} selected for removal",
+        "similar_failed": "{}: similar screenshot detection failed: {}",
+        "similar_cluster": "[Screenshots] {} similar screenshots starting at {}",
+        "similar_total": "[Screenshots] Similar clusters: {}, redundant screenshots: {}",
+
+        # Retention policies
+        "retention_policies": "Retention Policies",
+        "retention_description": "Remove old files instead of whole folders. Each rule is evaluated per version; the newest files you choose to keep are never removed.",
+        "retention_keep_days": "Keep last (days)",
+        "retention_cap_mb": "Size cap (MB)",
+        "retention_keep_newest": "Always keep newest",
+        "retention_zero_off": "0 turns a rule off.",
+        "retention_col_folder": "Version / Folder",
+        "retention_col_files": "Files",
+        "retention_col_freed": "Freed",
+        "retention_col_kept": "Kept",
+        "retention_preview": "Preview",
+        "retention_apply": "Apply",
+        "retention_preview_done": "{} file(s) would be removed, freeing {}",
+        "retention_applying": "Removing {} file(s)...",
+        "retention_applied": "Retention: processed {} file(s), freed {}",
+        "retention_folder_plan": "[Retention] {} {}: remove {} file(s) ({}), keep {}",
+        "retention_total_plan": "[Retention] Total: {} file(s), {}",
+
+        # Cache cleaner
+        "cache_cleaner": "Cache Cleaner",
+        "cache_description": "The client rebuilds its caches on launch, but WDB/ADB folders for locales you no longer play and stale subfolders keep growing and slow startup. Select entries by hand or by age; each is removed as a whole folder.",
+        "cache_col_entry": "Version / Cache entry",
+        "cache_col_size": "Size",
+        "cache_col_files": "Files",
+        "cache_col_last_used": "Last used",
+        "cache_select_unused": "Select entries unused for",
+        "cache_days": "days (0 = all)",
+        "cache_select": "Select",
+        "cache_rescan": "Rescan",
+        "cache_clean_selected": "Clean Selected",
+        "cache_selected": "{} entr(ies) selected, {}",
+        "cache_none_found": "No Cache folders found.",
+        "cache_confirm_clean": "Are you sure you want to {} {} cache entr(ies) ({})?",
+        "cache_cleaned": "Cache: processed {} entr(ies), freed {}",
+        "cache_scan_done": "Cache: {} entr(ies) totalling {}",
+        "cache_entry_found": "[Cache] {}: {} in {} file(s)",
+
+        # Screenshot optimizer - Log messages
+        "screenshot_converted": "[Screenshots] Converted {}: {} -> {}",
+        "screenshot_convert_failed": "[Screenshots] Could not convert {}: {}",
+        "screenshot_convert_summary": "[Screenshots] {}: converted {} screenshot(s), saved {}",
+        "screenshot_archived": "[Screenshots] Archived {} screenshot(s) into {} (saved {})",
+        "screenshot_archive_failed": "[Screenshots] Could not archive {}: {}",
     },
 }
\ No newline at end of file
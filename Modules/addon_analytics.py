@@ -0,0 +1,233 @@
+"""
+Addon usage analytics.
+
+This module answers "which installed addons are worth removing?" using data
+the other cleaners already collect:
+- SavedVariables modification times gathered during the orphan scan
+- Per-addon disk size of Interface/AddOns folders
+
+It contains zero Tkinter/UI logic.
+
+Functions:
+    find_stale_addons: Report installed addons nobody has written data for in N months
+    get_addon_usage: Size, file count and newest mtime of every installed addon (cached)
+    clear_addon_usage_cache: Drop the in-memory and on-disk addon usage cache
+"""
+import os
+import json
+import time
+import threading
+from Modules.log_adapter import DEBUG, enabled
+from Modules.orphan_cleaner import scan_orphans
+from Modules.settings import get_cache_dir
+from Modules.version_utils import get_folder_sizes_parallel, get_folder_stats_parallel, get_version_addons_path
+
+# Months are approximated as 30 days; the threshold is a coarse user setting
+SECONDS_PER_MONTH = 30 * 24 * 60 * 60
+
+def find_stale_addons(versions, months=6, now=None, logger=None, sv_mtimes=None):
+    """
+    Find installed addons whose SavedVariables nobody has written in `months` months.
+
+    The client rewrites an addon's SavedVariables every time a character that
+    has the addon loaded logs out, so an old newest-mtime across every
+    account and character is strong evidence the addon is unused. Addons that
+    never store SavedVariables have no such evidence and are not reported.
+
+    The mtimes come from the same SavedVariables pass as the orphan scan;
+    pass the sv_mtimes of an earlier scan_orphans call to skip the rescan.
+
+    Parameters:
+        versions: Iterable of (version_path, version_label) tuples
+        months: Staleness threshold in months
+        now: Optional reference timestamp (defaults to time.time())
+        logger: Optional object with .debug() and .info() methods
+        sv_mtimes: Optional mapping filled by scan_orphans(versions, sv_mtimes=...);
+                   SavedVariables are scanned again when omitted
+
+    Returns:
+        dict: Mapping of version_label -> list of (addon_name, last_written_ts, size_bytes)
+              tuples sorted oldest first; only versions with stale addons are included
+    """
+    versions = list(versions)
+    now = time.time() if now is None else now
+    cutoff = now - months * SECONDS_PER_MONTH
+
+    if sv_mtimes is None:
+        sv_mtimes = {}
+        scan_orphans(versions, sv_mtimes=sv_mtimes)
+
+    stale_by_version = {}
+    for vpath, vlabel in versions:
+        mtimes = sv_mtimes.get(vlabel)
+        if not mtimes:
+            continue
+        addons_dir = os.path.join(vpath, "Interface", "AddOns")
+        try:
+            with os.scandir(addons_dir) as entries:
+                installed = {
+                    entry.name.casefold(): entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and not entry.name.lower().startswith("blizzard_")
+                }
+        except (OSError, PermissionError):
+            continue
+
+        stale = [
+            (installed[name_cf], mtime)
+            for name_cf, mtime in mtimes.items()
+            if name_cf in installed and mtime < cutoff
+        ]
+        if stale:
+            stale_by_version[vlabel] = stale
+
+    # Size every stale addon folder in one parallel batch
+    sizes = get_folder_sizes_parallel(
+        [path for stale in stale_by_version.values() for path, _mtime in stale]
+    )
+
+    results = {}
+    total = 0
+    for vlabel, stale in stale_by_version.items():
+        rows = sorted(
+            (
+                (os.path.basename(path), mtime, sizes.get(path, 0))
+                for path, mtime in stale
+            ),
+            key=lambda row: row[1],
+        )
+        if enabled(logger, DEBUG):
+            for name, mtime, _size in rows:
+                logger.debug("addon_stale_found", vlabel, name, time.strftime("%Y-%m-%d", time.localtime(mtime)))
+        results[vlabel] = rows
+        total += len(rows)
+
+    if logger:
+        logger.info("addon_stale_total", total, months)
+    return results
+
+# ============================================================
+# PER-ADDON DISK USAGE
+# ============================================================
+# Results are cached per addon folder, keyed by a cheap signature, and
+# persisted under the user cache directory so reopening the view is instant.
+
+_USAGE_CACHE_NAME = "addon_usage.json"
+_usage_cache = None  # addon_path -> {"sig": [...], "stats": [size, files, newest]}
+_usage_lock = threading.Lock()
+
+def _addon_signature(addon_path, dir_mtime_ns):
+    """
+    Return the cache signature of an addon folder.
+
+    The folder mtime changes when files are added, removed or renamed at the
+    top level. Addon updates always rewrite the .toc files, so their newest
+    mtime catches in-place updates that leave the folder mtime untouched.
+    """
+    newest_toc = 0
+    try:
+        with os.scandir(addon_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".toc"):
+                    try:
+                        mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                    except OSError:
+                        continue
+                    if mtime_ns > newest_toc:
+                        newest_toc = mtime_ns
+    except (OSError, PermissionError):
+        pass
+    return [dir_mtime_ns, newest_toc]
+
+def _load_usage_cache():
+    global _usage_cache
+    if _usage_cache is None:
+        _usage_cache = {}
+        try:
+            with open(os.path.join(get_cache_dir(), _USAGE_CACHE_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                _usage_cache = data
+        except Exception:
+            pass
+    return _usage_cache
+
+def _save_usage_cache():
+    try:
+        path = os.path.join(get_cache_dir(), _USAGE_CACHE_NAME)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_usage_cache, f)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def clear_addon_usage_cache():
+    """Drop the in-memory and on-disk addon usage cache."""
+    global _usage_cache
+    with _usage_lock:
+        _usage_cache = {}
+        _save_usage_cache()
+
+def get_addon_usage(version_path, max_workers=None):
+    """
+    Return disk usage of every installed addon in a version's Interface/AddOns.
+
+    Unchanged addons are served from the cache; only addons whose signature
+    changed are walked again, in parallel.
+
+    Parameters:
+        version_path: Path to a WoW version (e.g., _retail_)
+        max_workers: Optional thread count for the parallel walk
+
+    Returns:
+        list: (addon_name, size_bytes, file_count, newest_mtime) tuples, largest first
+    """
+    addons_dir = get_version_addons_path(version_path)
+    try:
+        with os.scandir(addons_dir) as entries:
+            addons = [
+                (entry.name, entry.path, entry.stat(follow_symlinks=False).st_mtime_ns)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.lower().startswith("blizzard_")
+            ]
+    except (OSError, PermissionError):
+        return []
+
+    signatures = {
+        path: _addon_signature(path, dir_mtime_ns)
+        for _name, path, dir_mtime_ns in addons
+    }
+    with _usage_lock:
+        cache = _load_usage_cache()
+        stale = [
+            path
+            for path, sig in signatures.items()
+            if cache.get(path, {}).get("sig") != sig
+        ]
+
+    fresh = get_folder_stats_parallel(stale, max_workers=max_workers) if stale else {}
+
+    with _usage_lock:
+        cache = _load_usage_cache()
+        for path, stats in fresh.items():
+            cache[path] = {"sig": signatures[path], "stats": list(stats)}
+
+        # Forget addons that were removed from this AddOns folder
+        prefix = os.path.join(addons_dir, "")
+        removed = [p for p in cache if p.startswith(prefix) and p not in signatures]
+        for path in removed:
+            del cache[path]
+
+        if fresh or removed:
+            _save_usage_cache()
+
+        rows = [
+            (name, *cache.get(path, {}).get("stats", (0, 0, 0)))
+            for name, path, _mtime in addons
+        ]
+
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows
@@ -0,0 +1,211 @@
+"""
+Account-wide addon enablement matrix.
+
+Every character's AddOns.txt records which addons are enabled for that
+character. This module folds all of those files for one WoW version into a
+single characters x addons bitset, so questions such as "which addons are
+disabled on every character" become a handful of integer operations instead
+of a walk over per-file dictionaries.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    AddonMatrix: Compact bitset-backed enablement matrix for one version
+
+Functions:
+    build_addon_matrix: Parse all AddOns.txt files of a version into an AddonMatrix
+    find_unused_addons: Report uninstall candidates for many versions
+"""
+import os
+from Modules.orphan_cleaner import collect_addon_names, iter_character_dirs, read_addons_txt
+
+class AddonMatrix:
+    """
+    Characters x addons enablement matrix for a single WoW version.
+
+    Each character owns one fixed-width row in two bytearrays:
+    - listed:  the addon appears in the character's AddOns.txt
+    - enabled: the addon is marked "enabled" in that file
+
+    Bit `col` of a row lives in byte `col >> 3`, bit `col & 7`, so a row
+    read with int.from_bytes(..., "little") is a Python int whose bit `col`
+    is the addon in column `col`. Column aggregates are then plain int
+    OR/AND operations done in C.
+
+    Attributes:
+        characters: List of "ACCOUNT/REALM/CHARACTER" labels (row order)
+        addons: List of addon display names (column order)
+        installed: Set of installed addon names (casefolded)
+    """
+
+    def __init__(self, characters, addons, installed):
+        self.characters = list(characters)
+        self.addons = list(addons)
+        self.installed = set(installed)
+        self.index = {name.casefold(): col for col, name in enumerate(self.addons)}
+        self.row_bytes = (len(self.addons) + 7) // 8
+        size = self.row_bytes * len(self.characters)
+        self.listed = bytearray(size)
+        self.enabled = bytearray(size)
+
+    def set_state(self, row, addon_name, state):
+        """Record an AddOns.txt entry for the character in `row`."""
+        col = self.index.get(addon_name.casefold())
+        if col is None:
+            return
+        offset = row * self.row_bytes + (col >> 3)
+        bit = 1 << (col & 7)
+        self.listed[offset] |= bit
+        if state == "enabled":
+            self.enabled[offset] |= bit
+        else:
+            self.enabled[offset] &= ~bit & 0xFF
+
+    def _row(self, bits, row):
+        start = row * self.row_bytes
+        return int.from_bytes(bits[start:start + self.row_bytes], "little")
+
+    def _union(self, bits):
+        mask = 0
+        for row in range(len(self.characters)):
+            mask |= self._row(bits, row)
+        return mask
+
+    def _intersection(self, bits):
+        if not self.characters:
+            return 0
+        mask = (1 << len(self.addons)) - 1
+        for row in range(len(self.characters)):
+            mask &= self._row(bits, row)
+            if not mask:
+                break
+        return mask
+
+    def installed_mask(self):
+        """Return a column mask of addons installed in Interface/AddOns."""
+        mask = 0
+        for name_cf in self.installed:
+            col = self.index.get(name_cf)
+            if col is not None:
+                mask |= 1 << col
+        return mask
+
+    def enabled_anywhere(self):
+        """Return a column mask of addons enabled on at least one character."""
+        return self._union(self.enabled)
+
+    def disabled_everywhere(self):
+        """Return a column mask of addons every character lists as disabled."""
+        return self._intersection(self.listed) & ~self.enabled_anywhere()
+
+    def enabled_nowhere(self):
+        """
+        Return a column mask of installed addons no character has enabled.
+
+        Installed addons missing from every AddOns.txt count as not enabled:
+        the client writes every installed addon to AddOns.txt on logout, so
+        an addon that never shows up has not been loaded by any character.
+        """
+        return self.installed_mask() & ~self.enabled_anywhere()
+
+    def names(self, mask):
+        """Return addon display names for every set bit in `mask`, in column order."""
+        result = []
+        while mask:
+            low = mask & -mask
+            result.append(self.addons[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+def build_addon_matrix(version_root, installed_addons=None):
+    """
+    Parse every character's AddOns.txt for one version into an AddonMatrix.
+
+    Blizzard_* entries are core game addons and are left out of the matrix.
+
+    Parameters:
+        version_root: Path to the WoW version (e.g., _retail_)
+        installed_addons: Optional set of installed addon names (casefolded);
+                          collected from Interface/AddOns when omitted
+
+    Returns:
+        AddonMatrix: The enablement matrix (empty if the version has no characters)
+    """
+    addons_dir = os.path.join(version_root, "Interface", "AddOns")
+    if installed_addons is None:
+        installed_addons = collect_addon_names(addons_dir)
+
+    # Real folder names give nicer display names than casefolded keys
+    try:
+        with os.scandir(addons_dir) as entries:
+            display_by_cf = {
+                entry.name.casefold(): entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except (OSError, IOError):
+        display_by_cf = {}
+
+    account_root = os.path.join(version_root, "WTF", "Account")
+    characters = []
+    parsed = []
+    addon_names = {cf: display_by_cf.get(cf, cf) for cf in installed_addons}
+
+    # First pass: read every file once so the column count is known up front
+    if os.path.isdir(account_root):
+        for char_path in iter_character_dirs(account_root):
+            entries = [
+                (name, state)
+                for name, state in read_addons_txt(os.path.join(char_path, "AddOns.txt"))
+                if not name.lower().startswith("blizzard_")
+            ]
+            characters.append(os.path.relpath(char_path, account_root).replace(os.sep, "/"))
+            parsed.append(entries)
+            for name, _state in entries:
+                addon_names.setdefault(name.casefold(), name)
+
+    matrix = AddonMatrix(
+        characters,
+        sorted(addon_names.values(), key=str.casefold),
+        installed_addons,
+    )
+
+    # Second pass: fill the bitsets; the parsed entries are dropped afterwards
+    for row, entries in enumerate(parsed):
+        for name, state in entries:
+            matrix.set_state(row, name, state)
+
+    return matrix
+
+def find_unused_addons(versions, logger=None):
+    """
+    Report addons that are installed but never enabled, for many versions.
+
+    Parameters:
+        versions: Iterable of (version_path, version_label) tuples
+        logger: Optional object with .debug() and .info() methods
+
+    Returns:
+        dict: Mapping of version_label -> list of (addon_name, disabled_everywhere_flag)
+              tuples; only versions with candidates are included
+    """
+    results = {}
+    total = 0
+    for vpath, vlabel in versions:
+        matrix = build_addon_matrix(vpath)
+        if not matrix.characters:
+            continue
+        explicit = matrix.disabled_everywhere()
+        candidates = []
+        for name in matrix.names(matrix.enabled_nowhere()):
+            col = matrix.index[name.casefold()]
+            candidates.append((name, bool(explicit >> col & 1)))
+            if logger:
+                logger.debug("addon_matrix_unused", vlabel, name)
+        if candidates:
+            results[vlabel] = candidates
+            total += len(candidates)
+
+    if logger:
+        logger.info("addon_matrix_total_unused", total)
+    return results
@@ -0,0 +1,385 @@
+"""
+Analytics tab for WoW Cleanup Tool.
+
+Read-only reports that help users decide what to clean before they pick a
+cleaner. Each report runs on a background thread and fills one shared
+Treeview, grouped by WoW version.
+
+Functions:
+    build_analytics_tab: Build the Analytics tab UI
+    run_report: Run a report worker and show its rows in the tree
+    run_unused_addons_report: Show installed addons no character has enabled
+    run_stale_addons_report: Show addons whose SavedVariables are months old
+    run_addon_usage_report: Show size, file count and newest file of every addon
+    run_duplicate_libraries_report: Show embedded libraries shipped identically by many addons
+    run_storage_breakdown_report: Show where each version's disk space goes
+"""
+
+import os
+import time
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+from Modules import localization
+from Modules.addon_analytics import find_stale_addons, get_addon_usage
+from Modules.addon_matrix import find_unused_addons
+from Modules.dedupe import find_duplicate_libraries
+from Modules.disk_usage import storage_breakdown
+from Modules.settings import save_settings
+from Modules.ui_scheduler import get_scheduler
+from Modules.version_utils import format_size
+
+def build_analytics_tab(app, parent):
+    """Build the Analytics tab.
+
+    Args:
+        app: The WoWCleanupTool instance
+        parent: The tab frame to build into
+    """
+    frame = ttk.Frame(parent, padding=10)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(
+        frame,
+        text=localization._("analytics_description"),
+        wraplength=700,
+        justify="left",
+    ).pack(anchor="w", pady=(0, 8))
+
+    # Report buttons; later reports add their own controls to this row
+    app.analytics_buttons = ttk.Frame(frame)
+    app.analytics_buttons.pack(fill="x", pady=(0, 6))
+    ttk.Button(
+        app.analytics_buttons,
+        text=localization._("analytics_storage_breakdown"),
+        command=lambda: run_storage_breakdown_report(app),
+    ).pack(side="left", padx=(0, 6))
+
+    ttk.Button(
+        app.analytics_buttons,
+        text=localization._("analytics_unused_addons"),
+        command=lambda: run_unused_addons_report(app),
+    ).pack(side="left", padx=(0, 6))
+
+    ttk.Button(
+        app.analytics_buttons,
+        text=localization._("analytics_addon_usage"),
+        command=lambda: run_addon_usage_report(app),
+    ).pack(side="left", padx=(0, 6))
+
+    ttk.Button(
+        app.analytics_buttons,
+        text=localization._("analytics_duplicate_libraries"),
+        command=lambda: run_duplicate_libraries_report(app),
+    ).pack(side="left", padx=(0, 6))
+
+    ttk.Button(
+        app.analytics_buttons,
+        text=localization._("analytics_stale_addons"),
+        command=lambda: run_stale_addons_report(app),
+    ).pack(side="left", padx=(0, 4))
+    try:
+        start_months = int(app.settings.get("stale_addon_months", 6))
+    except Exception:
+        start_months = 6
+    app.stale_months_var = tk.IntVar(value=min(max(start_months, 1), 60))
+    ttk.Spinbox(
+        app.analytics_buttons, from_=1, to=60, width=4, textvariable=app.stale_months_var,
+    ).pack(side="left")
+    ttk.Label(app.analytics_buttons, text=localization._("analytics_months")).pack(side="left", padx=(4, 6))
+
+    app.analytics_status = ttk.Label(frame, text="")
+    app.analytics_status.pack(anchor="w", pady=(0, 4))
+
+    tree_frame = ttk.Frame(frame)
+    tree_frame.pack(fill="both", expand=True)
+    app.analytics_tree = ttk.Treeview(tree_frame, columns=("detail", "size"), show="tree headings")
+    app.analytics_tree.heading("#0", text=localization._("analytics_col_name"), anchor="w")
+    app.analytics_tree.heading("detail", text=localization._("analytics_col_detail"), anchor="w")
+    app.analytics_tree.heading("size", text=localization._("analytics_col_size"), anchor="e")
+    app.analytics_tree.column("#0", width=280, stretch=True)
+    app.analytics_tree.column("detail", width=320, stretch=True)
+    app.analytics_tree.column("size", width=100, stretch=False, anchor="e")
+    scroll_y = ttk.Scrollbar(tree_frame, orient="vertical", command=app.analytics_tree.yview)
+    app.analytics_tree.configure(yscrollcommand=scroll_y.set)
+    app.analytics_tree.pack(side="left", fill="both", expand=True)
+    scroll_y.pack(side="right", fill="y")
+
+def run_report(app, title_key, compute, summarize=None):
+    """Run a report worker in the background and show its rows in the tree.
+
+    Args:
+        app: The WoWCleanupTool instance
+        title_key: Localization key of the report title (used in status and log)
+        compute: Callable taking the list of (version_path, version_label) tuples
+                 and returning {group_label: [(name, detail, size_or_None), ...]};
+                 groups are shown in insertion order
+        summarize: Optional callable (group_label, rows) -> (detail, size_or_None)
+                   for the group row (defaults to item count and summed size)
+    """
+    if getattr(app, "_analytics_in_progress", False):
+        return
+
+    base = app.wow_path_var.get().strip()
+    if not base or not os.path.isdir(base):
+        messagebox.showerror(localization._("invalid_folder"), localization._("select_valid_wow_first"))
+        return
+
+    app._analytics_in_progress = True
+    versions = app._enumerate_versions(base)
+    title = localization._(title_key)
+
+    for n in app.analytics_tree.get_children(""):
+        app.analytics_tree.delete(n)
+    try:
+        app.analytics_status.configure(text=localization._("scanning"))
+    except Exception:
+        pass
+
+    def worker():
+        try:
+            rows = compute(versions) or {}
+            error = None
+        except Exception as e:
+            rows, error = {}, e
+
+        parent = {"pid": ""}
+
+        def work_items():
+            """Yield (vlabel, v_rows) for each version header, then (None, row) for its rows."""
+            for vlabel, v_rows in rows.items():
+                if v_rows:
+                    yield vlabel, v_rows
+                    for row in v_rows:
+                        yield None, row
+
+        def insert_item(item):
+            vlabel, data = item
+            if vlabel is None:
+                name, detail, size = data
+                app.analytics_tree.insert(
+                    parent["pid"], "end",
+                    text=f"  {name}",
+                    values=(detail, format_size(size) if size is not None else ""),
+                )
+                return
+            if summarize:
+                detail, size = summarize(vlabel, data)
+            else:
+                sizes = [size for _name, _detail, size in data if size is not None]
+                detail = localization._("analytics_item_count").format(len(data))
+                size = sum(sizes) if sizes else None
+            parent["pid"] = app.analytics_tree.insert(
+                "", "end",
+                text=f"  {vlabel}",
+                values=(detail, format_size(size) if size is not None else ""),
+                open=True,
+            )
+
+        def fail(e):
+            nonlocal error
+            error = e
+
+        def finish():
+            total = sum(len(v_rows) for v_rows in rows.values() if v_rows)
+            if error is not None:
+                status = localization._("analytics_failed").format(title, error)
+            elif total:
+                status = localization._("analytics_done").format(title, total)
+            else:
+                status = localization._("analytics_nothing_found").format(title)
+            try:
+                app.analytics_status.configure(text=status)
+            except Exception:
+                pass
+            app.log(status)
+            app._analytics_in_progress = False
+
+        def apply_rows():
+            # Rows are inserted in frame-budgeted slices; the status follows the last one
+            get_scheduler(app.analytics_tree).run(work_items(), insert_item, finish, fail)
+
+        try:
+            app.root.after(0, apply_rows)
+        except Exception:
+            app._analytics_in_progress = False
+
+    threading.Thread(target=worker, daemon=True).start()
+
+def run_unused_addons_report(app):
+    """Show installed addons that no character has enabled.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    logger = app.backend_logger()
+    disabled_text = localization._("analytics_disabled_everywhere")
+    never_text = localization._("analytics_enabled_nowhere")
+
+    def compute(versions):
+        unused = find_unused_addons(versions, logger=logger)
+        return {
+            vlabel: [
+                (name, disabled_text if explicit else never_text, None)
+                for name, explicit in candidates
+            ]
+            for vlabel, candidates in unused.items()
+        }
+
+    run_report(app, "analytics_unused_addons", compute)
+
+def run_stale_addons_report(app):
+    """Show installed addons whose SavedVariables nobody wrote in N months.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    try:
+        months = min(max(int(app.stale_months_var.get()), 1), 60)
+    except Exception:
+        months = 6
+    app.stale_months_var.set(months)
+    app.settings["stale_addon_months"] = months
+    save_settings(app.settings)
+
+    logger = app.backend_logger()
+    template = localization._("analytics_last_written")
+
+    def compute(versions):
+        # Reuse the Orphan Cleaner's SavedVariables pass when it covered the same versions
+        cached = getattr(app, "orphan_sv_mtimes", None)
+        sv_mtimes = cached[1] if cached and cached[0] == versions else None
+        stale = find_stale_addons(versions, months=months, logger=logger, sv_mtimes=sv_mtimes)
+        return {
+            vlabel: [
+                (name, template.format(time.strftime("%Y-%m-%d", time.localtime(mtime))), size)
+                for name, mtime, size in rows
+            ]
+            for vlabel, rows in stale.items()
+        }
+
+    run_report(app, "analytics_stale_addons", compute)
+
+def run_addon_usage_report(app):
+    """Show size, file count and newest file mtime of every installed addon.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    template = localization._("analytics_addon_usage_detail")
+
+    def compute(versions):
+        results = {}
+        for vpath, vlabel in versions:
+            usage = get_addon_usage(vpath)
+            if usage:
+                results[vlabel] = [
+                    (
+                        name,
+                        template.format(
+                            files,
+                            time.strftime("%Y-%m-%d", time.localtime(newest)) if newest else "-",
+                        ),
+                        size,
+                    )
+                    for name, size, files, newest in usage
+                ]
+        return results
+
+    run_report(app, "analytics_addon_usage", compute)
+
+def run_duplicate_libraries_report(app):
+    """Show embedded library trees that several addons ship byte-identically.
+
+    Each group lists every copy; the group row shows how many redundant
+    files the client loads and how many bytes the extra copies take.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    logger = app.backend_logger()
+    files_text = localization._("analytics_file_count")
+    copies_text = localization._("analytics_library_copies")
+    redundant = {}
+
+    def compute(versions):
+        results = {}
+        for group in find_duplicate_libraries(versions, logger=logger):
+            label = copies_text.format(group["name"], len(group["copies"]))
+            if label in results:
+                # Different releases of the same library, each duplicated
+                label = f"{label} #{sum(1 for key in results if key.startswith(label)) + 1}"
+            extra = len(group["copies"]) - 1
+            redundant[label] = (group["files"] * extra, group["size"] * extra)
+            results[label] = [
+                (f"{vlabel}: {rel_path}", files_text.format(group["files"]), group["size"])
+                for vlabel, rel_path, _path in group["copies"]
+            ]
+        return results
+
+    def summarize(label, _rows):
+        files, size = redundant[label]
+        return localization._("analytics_redundant").format(files), size
+
+    run_report(app, "analytics_duplicate_libraries", compute, summarize)
+
+def run_storage_breakdown_report(app, top_n=10):
+    """Show where each version's disk space goes.
+
+    Lists the size of Cache, Logs, Errors, Screenshots, Interface/AddOns,
+    WTF and everything else, followed by the largest files and the largest
+    SavedVariables, all from one traversal per version.
+
+    Args:
+        app: The WoWCleanupTool instance
+        top_n: Number of largest files and SavedVariables to list
+    """
+    usage_text = localization._("analytics_storage_detail")
+    largest_text = localization._("analytics_largest_file")
+    saved_text = localization._("analytics_largest_saved_variables")
+    progress_text = localization._("analytics_storage_progress")
+    totals = {}
+
+    def show_progress(vlabel, usage):
+        text = progress_text.format(vlabel, usage.files, format_size(usage.size))
+
+        def update():
+            try:
+                app.analytics_status.configure(text=text)
+            except Exception:
+                pass
+
+        try:
+            app.root.after(0, update)
+        except Exception:
+            pass
+
+    def compute(versions):
+        results = {}
+        for vpath, vlabel in versions:
+            breakdown = storage_breakdown(
+                vpath, top_n=top_n, progress=lambda usage, vlabel=vlabel: show_progress(vlabel, usage),
+            )
+            if not breakdown["total"].files:
+                continue
+            totals[vlabel] = breakdown["total"]
+            rows = [
+                (name, usage_text.format(usage.files, format_size(usage.allocated)), usage.size)
+                for name, usage in breakdown["categories"].items()
+            ]
+            rows.extend(
+                (largest_text.format(os.path.relpath(path, vpath)), "", size)
+                for size, path in breakdown["largest"]
+            )
+            rows.extend(
+                (saved_text.format(os.path.relpath(path, vpath)), "", size)
+                for size, path in breakdown["saved_variables"]
+            )
+            results[vlabel] = rows
+        return results
+
+    def summarize(vlabel, _rows):
+        total = totals[vlabel]
+        return usage_text.format(total.files, format_size(total.allocated)), total.size
+
+    run_report(app, "analytics_storage_breakdown", compute, summarize)
@@ -0,0 +1,197 @@
+"""
+Cache cleaner dialog for WoW Cleanup Tool.
+
+Shows every version's Cache folder broken down into WDB/ADB locales and
+other subfolders with their size, file count and last use, lets the user
+pick entries by hand or by age, and removes them as whole folders.
+
+Functions:
+    open_cache_dialog: Show the cache cleaner dialog
+"""
+
+import os
+import time
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+from Modules import localization
+from Modules.folder_cleaner import clean_folders, scan_cache, select_stale_cache_entries
+from Modules.game_validation import is_game_version_valid, show_game_validation_warning
+from Modules.settings import save_settings
+from Modules.version_utils import format_size
+
+def open_cache_dialog(app):
+    """Show the cache cleaner dialog.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    base = app.wow_path_var.get().strip()
+    if not base or not os.path.isdir(base):
+        messagebox.showerror(localization._("invalid_folder"), localization._("select_valid_wow_first"))
+        return
+    versions = app._enumerate_versions(base)
+
+    dlg = tk.Toplevel(app.root)
+    dlg.title(localization._("cache_cleaner"))
+    dlg.transient(app.root)
+    frame = ttk.Frame(dlg, padding=12)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(
+        frame, text=localization._("cache_description"), wraplength=520, justify="left",
+    ).grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
+
+    tree = ttk.Treeview(frame, columns=("size", "files", "used"), show="tree headings", height=12, selectmode="extended")
+    tree.heading("#0", text=localization._("cache_col_entry"), anchor="w")
+    tree.heading("size", text=localization._("cache_col_size"), anchor="e")
+    tree.heading("files", text=localization._("cache_col_files"), anchor="e")
+    tree.heading("used", text=localization._("cache_col_last_used"), anchor="e")
+    tree.column("#0", width=240)
+    tree.column("size", width=90, anchor="e", stretch=False)
+    tree.column("files", width=70, anchor="e", stretch=False)
+    tree.column("used", width=120, anchor="e", stretch=False)
+    tree.grid(row=1, column=0, columnspan=2, sticky="nsew")
+    frame.rowconfigure(1, weight=1)
+    frame.columnconfigure(1, weight=1)
+
+    try:
+        saved_days = max(int(app.settings.get("cache_min_age_days", 0)), 0)
+    except Exception:
+        saved_days = 0
+    days_var = tk.IntVar(value=saved_days)
+    age_frame = ttk.Frame(frame)
+    age_frame.grid(row=2, column=0, columnspan=2, sticky="w", pady=(8, 0))
+    ttk.Label(age_frame, text=localization._("cache_select_unused")).pack(side="left")
+    ttk.Spinbox(age_frame, from_=0, to=3650, width=5, textvariable=days_var).pack(side="left", padx=(4, 4))
+    ttk.Label(age_frame, text=localization._("cache_days")).pack(side="left")
+    select_btn = ttk.Button(age_frame, text=localization._("cache_select"))
+    select_btn.pack(side="left", padx=(8, 0))
+
+    status = ttk.Label(frame, text="")
+    status.grid(row=3, column=0, columnspan=2, sticky="w", pady=(6, 0))
+
+    buttons = ttk.Frame(frame)
+    buttons.grid(row=4, column=0, columnspan=2, sticky="e", pady=(8, 0))
+    refresh_btn = ttk.Button(buttons, text=localization._("cache_rescan"))
+    clean_btn = ttk.Button(buttons, text=localization._("cache_clean_selected"), state="disabled")
+    refresh_btn.pack(side="left", padx=(0, 6))
+    clean_btn.pack(side="left", padx=(0, 6))
+    ttk.Button(buttons, text=localization._("close"), command=dlg.destroy).pack(side="left")
+
+    state = {"entries": {}, "items": {}}  # vlabel -> scan_cache() result, item id -> (vpath, entry)
+
+    def update_status(*_args):
+        paths = [state["items"][iid][1][1] for iid in tree.selection() if iid in state["items"]]
+        size = sum(state["items"][iid][1][2] for iid in tree.selection() if iid in state["items"])
+        clean_btn.configure(state="normal" if paths else "disabled")
+        status.configure(text=localization._("cache_selected").format(len(paths), format_size(size)))
+
+    def show(results):
+        if not dlg.winfo_exists():
+            return  # Closed during the scan
+        for n in tree.get_children(""):
+            tree.delete(n)
+        state["entries"] = {}
+        state["items"] = {}
+        total = 0
+        for vpath, vlabel in versions:
+            entries = results.get(vlabel)
+            if not entries:
+                continue
+            state["entries"][vlabel] = entries
+            size = sum(e[2] for e in entries)
+            files = sum(e[3] for e in entries)
+            pid = tree.insert("", "end", text=f"  {vlabel}", values=(format_size(size), files, ""), open=True)
+            for entry in entries:
+                label, _path, entry_size, count, newest = entry
+                used = time.strftime("%Y-%m-%d", time.localtime(newest)) if newest else ""
+                iid = tree.insert(pid, "end", text=f"  {label}", values=(format_size(entry_size), count, used))
+                state["items"][iid] = (vpath, entry)
+            total += size
+        refresh_btn.configure(state="normal")
+        if not state["items"]:
+            status.configure(text=localization._("cache_none_found"))
+            clean_btn.configure(state="disabled")
+            return
+        update_status()
+        app.log(localization._("cache_scan_done").format(len(state["items"]), format_size(total)))
+
+    def scan():
+        refresh_btn.configure(state="disabled")
+        clean_btn.configure(state="disabled")
+        status.configure(text=localization._("scanning"))
+        logger = app.backend_logger()
+
+        def worker():
+            results = {}
+            for vpath, vlabel in versions:
+                entries = scan_cache(vpath, logger=logger)
+                if entries:
+                    results[vlabel] = entries
+            try:
+                app.root.after(0, lambda: show(results))
+            except Exception:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def select_by_age():
+        try:
+            days = max(int(days_var.get()), 0)
+        except Exception:
+            days = 0
+        app.settings["cache_min_age_days"] = days
+        save_settings(app.settings)
+        chosen = set()
+        for entries in state["entries"].values():
+            chosen.update(select_stale_cache_entries(entries, days))
+        tree.selection_set([iid for iid, (_vpath, entry) in state["items"].items() if entry[1] in chosen])
+        update_status()
+
+    def clean():
+        selected = [state["items"][iid] for iid in tree.selection() if iid in state["items"]]
+        if not selected:
+            return
+        for vpath in {vpath for vpath, _entry in selected}:
+            if not is_game_version_valid(vpath):
+                show_game_validation_warning(app.root)
+                return
+        use_trash = app.delete_mode.get() == "trash"
+        action = localization._("move_to_trash") if use_trash else localization._("delete_permanently_action")
+        size = sum(entry[2] for _vpath, entry in selected)
+        if not messagebox.askyesno(
+            localization._("confirm"),
+            localization._("cache_confirm_clean").format(action, len(selected), format_size(size)),
+            parent=dlg,
+        ):
+            return
+        clean_btn.configure(state="disabled")
+        refresh_btn.configure(state="disabled")
+        paths = [entry[1] for _vpath, entry in selected]
+        logger = app.backend_logger()
+
+        def worker():
+            processed, _permanent, _trash = clean_folders(paths, use_trash=use_trash, logger=logger)
+
+            def done():
+                summary = localization._("cache_cleaned").format(processed, format_size(size))
+                app.log(summary)
+                app._sweep_empty_dirs(paths, "Cache")
+                if not dlg.winfo_exists():
+                    return  # Closed while the entries were removed
+                messagebox.showinfo(localization._("completed"), summary, parent=dlg)
+                scan()
+
+            try:
+                app.root.after(0, done)
+            except Exception:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    tree.bind("<<TreeviewSelect>>", update_status)
+    select_btn.configure(command=select_by_age)
+    refresh_btn.configure(command=scan)
+    clean_btn.configure(command=clean)
+    scan()
@@ -0,0 +1,490 @@
+"""
+Content-hash duplicate detection.
+
+Finding identical content is done in three increasingly expensive stages,
+so most candidates are ruled out without reading them:
+1. Size buckets - only items sharing an exact size (or tree shape) survive
+2. Partial hash  - the first PARTIAL_BYTES of every surviving file
+3. Full hash     - only for items whose partial hashes still collide
+
+Hashes are cached on disk keyed by (path, size, mtime), so repeat runs only
+read files that changed since the last run.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    HashCache: Persistent (path, size, mtime) -> hash cache
+
+Functions:
+    get_hash_cache: Return the HashCache shared by all scans in this process
+    iter_library_dirs: Yield embedded library folders (Libs/*) of every addon
+    find_duplicate_libraries: Report identical embedded library trees across addons and versions
+    iter_files: Yield (path, size, mtime_ns) for every file under some folders
+    find_duplicate_files: Group identical files across WoW versions with bounded memory
+"""
+import os
+import json
+import hashlib
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from Modules.log_adapter import DEBUG, enabled
+from Modules.settings import get_cache_dir
+from Modules.version_utils import format_size, get_version_addons_path
+
+# Bytes read for the partial hash; files this small are fully hashed by it
+PARTIAL_BYTES = 64 * 1024
+_READ_CHUNK = 1024 * 1024
+
+# Folder names addons use for embedded libraries (compared casefolded)
+LIBRARY_FOLDER_NAMES = ("libs", "lib", "libraries")
+
+# Per-version folders compared by the cross-version duplicate finder
+DUPLICATE_SCAN_FOLDERS = (
+    ("Interface", "AddOns"),
+    ("Screenshots",),
+    ("WTF",),
+)
+
+# Folders whose duplicate copies may be removed. Every version loads its own
+# AddOns and WTF files, so duplicates there are only reported.
+REMOVABLE_DUPLICATE_FOLDERS = (
+    ("Screenshots",),
+)
+
+def _hash_file(path, limit=None):
+    """Return the BLAKE2b hex digest of a file (or its first `limit` bytes), None on error."""
+    h = hashlib.blake2b(digest_size=16)
+    remaining = limit
+    try:
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(_READ_CHUNK if remaining is None else min(_READ_CHUNK, remaining))
+                if not chunk:
+                    break
+                h.update(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+                    if remaining <= 0:
+                        break
+    except (OSError, PermissionError):
+        return None
+    return h.hexdigest()
+
+class HashCache:
+    """
+    Persistent file hash cache.
+
+    Entries are keyed by path and are only trusted while the file's size and
+    mtime_ns still match, so a changed file is simply hashed again.
+    Thread-safe; call save() once a run is finished.
+    """
+
+    MAX_ENTRIES = 200000
+
+    def __init__(self, filename="file_hashes.json"):
+        self.filename = filename
+        self._entries = None  # path -> [size, mtime_ns, partial, full]
+        self._touched = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(os.path.join(get_cache_dir(), self.filename), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self._entries = data
+            except Exception:
+                pass
+        return self._entries
+
+    def _lookup(self, path, size, mtime_ns):
+        with self._lock:
+            entry = self._load().get(path)
+            self._touched.add(path)
+        if entry and entry[0] == size and entry[1] == mtime_ns:
+            return entry
+        return None
+
+    def _store(self, path, size, mtime_ns, partial, full):
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(path)
+            if not entry or entry[0] != size or entry[1] != mtime_ns:
+                entry = [size, mtime_ns, None, None]
+                entries[path] = entry
+            if partial is not None:
+                entry[2] = partial
+            if full is not None:
+                entry[3] = full
+            self._dirty = True
+
+    def partial_hash(self, path, size, mtime_ns):
+        """Return the hash of the first PARTIAL_BYTES of a file (the full hash for small files)."""
+        entry = self._lookup(path, size, mtime_ns)
+        if entry and entry[2]:
+            return entry[2]
+        digest = _hash_file(path, PARTIAL_BYTES)
+        if digest is not None:
+            self._store(path, size, mtime_ns, digest, digest if size <= PARTIAL_BYTES else None)
+        return digest
+
+    def full_hash(self, path, size, mtime_ns):
+        """Return the hash of the whole file."""
+        if size <= PARTIAL_BYTES:
+            return self.partial_hash(path, size, mtime_ns)
+        entry = self._lookup(path, size, mtime_ns)
+        if entry and entry[3]:
+            return entry[3]
+        digest = _hash_file(path)
+        if digest is not None:
+            self._store(path, size, mtime_ns, None, digest)
+        return digest
+
+    def save(self):
+        """Write the cache to disk, dropping untouched entries once it grows too large."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            if len(self._entries) > self.MAX_ENTRIES:
+                self._entries = {p: e for p, e in self._entries.items() if p in self._touched}
+            try:
+                path = os.path.join(get_cache_dir(), self.filename)
+                tmp = path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(tmp, path)
+                self._dirty = False
+            except Exception:
+                pass
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def get_hash_cache():
+    """Return the HashCache shared by all scans, so hashes are reused between them."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HashCache()
+        return _shared_cache
+
+def _hash_many(files, hash_fn, max_workers=None):
+    """Hash (path, size, mtime_ns) tuples in parallel; returns {path: digest}."""
+    files = list(files)
+    if not files:
+        return {}
+    workers = max_workers or min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda f: hash_fn(*f), files)
+        return {f[0]: digest for f, digest in zip(files, digests)}
+
+def _walk_files(root):
+    """Return sorted (relative_path, path, size, mtime_ns) tuples for every file under root."""
+    files = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            rel = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                            files.append((rel, entry.path, st.st_size, st.st_mtime_ns))
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except (OSError, PermissionError):
+                        continue
+        except (OSError, PermissionError):
+            continue
+    files.sort()
+    return files
+
+def iter_library_dirs(addons_dir):
+    """
+    Yield the embedded library folders of every addon in an AddOns folder.
+
+    Parameters:
+        addons_dir: Path to Interface/AddOns
+
+    Yields:
+        tuple: (addon_name, library_name, library_path, relative_path)
+               where relative_path is e.g. "MyAddon/Libs/LibStub"
+    """
+    try:
+        with os.scandir(addons_dir) as addons:
+            addon_dirs = sorted(
+                (entry.name, entry.path)
+                for entry in addons
+                if entry.is_dir(follow_symlinks=False)
+                and not entry.name.lower().startswith("blizzard_")
+            )
+    except (OSError, PermissionError):
+        return
+
+    for addon_name, addon_path in addon_dirs:
+        try:
+            with os.scandir(addon_path) as children:
+                lib_roots = [
+                    (entry.name, entry.path)
+                    for entry in children
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.name.casefold() in LIBRARY_FOLDER_NAMES
+                ]
+        except (OSError, PermissionError):
+            continue
+        for libs_name, libs_path in lib_roots:
+            try:
+                with os.scandir(libs_path) as libs:
+                    lib_dirs = sorted(
+                        (entry.name, entry.path)
+                        for entry in libs
+                        if entry.is_dir(follow_symlinks=False)
+                    )
+            except (OSError, PermissionError):
+                continue
+            for lib_name, lib_path in lib_dirs:
+                yield addon_name, lib_name, lib_path, f"{addon_name}/{libs_name}/{lib_name}"
+
+def _regroup(groups, file_digests):
+    """Split tree groups by the digest of their files' hashes; drop singletons."""
+    result = []
+    for trees in groups:
+        by_digest = defaultdict(list)
+        for tree in trees:
+            h = hashlib.blake2b(digest_size=16)
+            for rel, path, _size, _mtime in tree["files"]:
+                digest = file_digests.get(path)
+                if digest is None:
+                    # Unreadable file: the tree cannot be proven identical
+                    h = None
+                    break
+                h.update(rel.casefold().encode("utf-8"))
+                h.update(digest.encode("ascii"))
+            if h is not None:
+                by_digest[h.hexdigest()].append(tree)
+        result.extend(g for g in by_digest.values() if len(g) > 1)
+    return result
+
+def find_duplicate_libraries(versions, cache=None, max_workers=None, logger=None):
+    """
+    Find embedded library trees that are byte-identical across addons and versions.
+
+    Trees are first bucketed by shape (relative paths and file sizes), so
+    libraries with a unique layout are never read. Surviving buckets are
+    split by partial hashes and then full hashes of their files.
+
+    Parameters:
+        versions: Iterable of (version_path, version_label) tuples
+        cache: Optional HashCache (a shared default cache is used when omitted)
+        max_workers: Optional thread count for hashing
+        logger: Optional object with .debug() and .info() methods
+
+    Returns:
+        list: Groups sorted by redundant bytes, largest first. Each group is a dict with
+              "name", "size" and "files" of one copy, and "copies": a list of
+              (version_label, relative_path, library_path) tuples
+    """
+    cache = cache or get_hash_cache()
+
+    # Stage 1: bucket library trees by shape
+    buckets = defaultdict(list)
+    for vpath, vlabel in versions:
+        for _addon, lib_name, lib_path, rel_path in iter_library_dirs(get_version_addons_path(vpath)):
+            files = _walk_files(lib_path)
+            if not files:
+                continue
+            shape = tuple((rel.casefold(), size) for rel, _path, size, _mtime in files)
+            buckets[shape].append({
+                "name": lib_name,
+                "files": files,
+                "size": sum(size for _rel, _path, size, _mtime in files),
+                "copy": (vlabel, rel_path, lib_path),
+            })
+    groups = [trees for trees in buckets.values() if len(trees) > 1]
+    buckets.clear()
+
+    # Stage 2 and 3: partial hashes, then full hashes of what still collides
+    for hash_fn in (cache.partial_hash, cache.full_hash):
+        pending = {
+            path: (path, size, mtime)
+            for trees in groups
+            for tree in trees
+            for _rel, path, size, mtime in tree["files"]
+        }
+        groups = _regroup(groups, _hash_many(pending.values(), hash_fn, max_workers))
+    cache.save()
+
+    results = []
+    for trees in groups:
+        first = trees[0]
+        results.append({
+            "name": first["name"],
+            "size": first["size"],
+            "files": len(first["files"]),
+            "copies": [tree["copy"] for tree in trees],
+        })
+    results.sort(key=lambda g: g["size"] * (len(g["copies"]) - 1), reverse=True)
+
+    if logger:
+        redundant_bytes = 0
+        redundant_copies = 0
+        for group in results:
+            extra = len(group["copies"]) - 1
+            redundant_bytes += group["size"] * extra
+            redundant_copies += extra
+            logger.debug("dedupe_library_group", group["name"], len(group["copies"]), format_size(group["size"] * extra))
+        logger.info("dedupe_library_total", redundant_copies, format_size(redundant_bytes))
+    return results
+
+def iter_files(roots, min_size=1):
+    """
+    Yield every regular file under the given folders.
+
+    Parameters:
+        roots: Iterable of folder paths
+        min_size: Files smaller than this many bytes are skipped
+
+    Yields:
+        tuple: (path, size, mtime_ns)
+    """
+    for root in roots:
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                if st.st_size >= min_size:
+                                    yield entry.path, st.st_size, st.st_mtime_ns
+                            elif entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except (OSError, PermissionError):
+                            continue
+            except (OSError, PermissionError):
+                continue
+
+def _drop_hardlinks(files):
+    """Keep one of several paths that are the same file (same st_dev and st_ino).
+
+    Removing a hard-linked copy frees nothing, so such copies are not
+    duplicates. File systems without inode numbers report 0 and are kept.
+    """
+    seen = set()
+    kept = []
+    for f in files:
+        try:
+            st = os.stat(f[0])
+            key = (st.st_dev, st.st_ino) if st.st_ino else None
+        except OSError:
+            continue
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(f)
+    return kept
+
+def find_duplicate_files(versions, folders=DUPLICATE_SCAN_FOLDERS, min_size=1024,
+                         cross_version_only=True, cache=None, max_workers=None, logger=None,
+                         removable_folders=REMOVABLE_DUPLICATE_FOLDERS):
+    """
+    Group byte-identical files found in the given folders of several WoW versions.
+
+    Memory stays bounded by the number of *candidate* files rather than all
+    files: a first walk only counts how many files share each size, and the
+    second walk keeps paths whose size occurs more than once. Size buckets
+    are then split by partial and full hashes one bucket at a time. Paths
+    that are hard links of the same file count as one copy.
+
+    Parameters:
+        versions: Iterable of (version_path, version_label) tuples
+        folders: Tuples of path parts below each version to scan
+        min_size: Ignore files smaller than this many bytes
+        cross_version_only: Only report groups whose copies span two or more versions
+        cache: Optional HashCache (a shared default cache is used when omitted)
+        max_workers: Optional thread count for hashing
+        logger: Optional object with .debug() and .info() methods
+        removable_folders: Entries of `folders` whose copies may be removed
+
+    Returns:
+        list: Groups sorted by reclaimable bytes, largest first. Each group is a dict
+              with "size" (bytes per copy), "reclaimable" (size * (copies - 1)),
+              "removable" (True if every copy lies in a removable folder; other
+              groups are report-only) and "copies": a list of
+              (version_label, relative_path, path) tuples
+    """
+    versions = list(versions)
+    cache = cache or get_hash_cache()
+    removable_folders = {tuple(parts) for parts in removable_folders}
+    roots = []
+    for vpath, vlabel in versions:
+        for parts in folders:
+            root = os.path.join(vpath, *parts)
+            if os.path.isdir(root):
+                roots.append((root, vpath, vlabel, tuple(parts) in removable_folders))
+    root_paths = [root for root, _vpath, _vlabel, _removable in roots]
+
+    # Pass 1: count sizes only
+    size_counts = Counter(size for _path, size, _mtime in iter_files(root_paths, min_size))
+    shared_sizes = {size for size, count in size_counts.items() if count > 1}
+    size_counts.clear()
+
+    # Pass 2: keep files whose size is shared, with their version
+    buckets = defaultdict(list)
+    for root, vpath, vlabel, removable in roots:
+        for path, size, mtime in iter_files([root], min_size):
+            if size in shared_sizes:
+                rel = os.path.relpath(path, vpath).replace(os.sep, "/")
+                buckets[size].append((path, size, mtime, vlabel, rel, removable))
+    shared_sizes.clear()
+
+    def spans_versions(files):
+        return len({f[3] for f in files}) > 1
+
+    results = []
+    workers = max_workers or min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Largest sizes first: they dominate the reclaimable total
+        for size in sorted(buckets, reverse=True):
+            groups = [buckets.pop(size)]
+            for hash_fn in (cache.partial_hash, cache.full_hash):
+                next_groups = []
+                for files in groups:
+                    if cross_version_only and not spans_versions(files):
+                        continue
+                    by_digest = defaultdict(list)
+                    digests = executor.map(lambda f: hash_fn(f[0], f[1], f[2]), files)
+                    for f, digest in zip(files, digests):
+                        if digest is not None:
+                            by_digest[digest].append(f)
+                    next_groups.extend(g for g in by_digest.values() if len(g) > 1)
+                groups = next_groups
+            for files in groups:
+                files = _drop_hardlinks(files)
+                if len(files) < 2 or (cross_version_only and not spans_versions(files)):
+                    continue
+                results.append({
+                    "size": size,
+                    "reclaimable": size * (len(files) - 1),
+                    "removable": all(f[5] for f in files),
+                    "copies": [(vlabel, rel, path) for path, _size, _mtime, vlabel, rel, _removable in files],
+                })
+    cache.save()
+
+    results.sort(key=lambda g: g["reclaimable"], reverse=True)
+
+    if logger:
+        if enabled(logger, DEBUG):
+            for group in results:
+                logger.debug("dedupe_file_group", group["copies"][0][1], len(group["copies"]), format_size(group["reclaimable"]))
+        logger.info("dedupe_file_total", len(results), format_size(sum(g["reclaimable"] for g in results)))
+    return results
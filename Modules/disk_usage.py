@@ -0,0 +1,252 @@
+"""
+Parallel disk-usage engine.
+
+Walks folder trees the way `du` does, but with a thread pool: every
+directory is one os.scandir task, and the subdirectories it finds are
+queued as new tasks, so a single deep tree is spread across all workers
+and no Python recursion is involved.
+
+- Hardlinks are counted once: files with more than one link are tracked
+  by (st_dev, st_ino) across every folder of a run.
+- Both the apparent size (st_size) and the allocated size (st_blocks *
+  512) are reported. Platforms without st_blocks (Windows) report the
+  apparent size for both, and their scandir results carry no inode
+  numbers, so hardlink tracking only applies where inodes are available.
+- Running totals can be streamed to a progress callback (the Storage
+  Breakdown report shows them while a version is walked).
+- storage_breakdown() sizes a whole version by category (Cache, Logs,
+  AddOns, WTF, ...) in one traversal while keeping bounded min-heaps of
+  the largest files and the largest SavedVariables.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    DiskUsage: Result tuple (size, allocated, files, dirs, newest)
+
+Functions:
+    disk_usage: Measure several folders in one parallel walk
+    storage_breakdown: Size one version by category and find its largest files
+"""
+import os
+import time
+import heapq
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Breakdown categories in display order; anything else is "Other"
+STORAGE_CATEGORIES = ("Cache", "Logs", "Errors", "Screenshots", "Interface/AddOns", "WTF", "Other")
+
+DiskUsage = namedtuple("DiskUsage", "size allocated files dirs newest")
+DiskUsage.__doc__ = """Usage of a folder tree.
+
+size: apparent bytes, allocated: bytes on disk, files/dirs: counts below
+the folder, newest: newest file mtime (0 for empty folders)."""
+
+def _scan_dir(path, seen, lock):
+    """Scan one directory; return (size, allocated, files, newest, subdirs)."""
+    size = allocated = files = 0
+    newest = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_nlink > 1 and st.st_ino:
+                        key = (st.st_dev, st.st_ino)
+                        with lock:
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                    size += st.st_size
+                    blocks = getattr(st, "st_blocks", None)
+                    allocated += st.st_size if blocks is None else blocks * 512
+                    files += 1
+                    if st.st_mtime > newest:
+                        newest = st.st_mtime
+                except (OSError, PermissionError):
+                    continue
+    except (OSError, PermissionError):
+        pass
+    return size, allocated, files, newest, subdirs
+
+def disk_usage(folder_paths, max_workers=None, progress=None, progress_interval=0.1):
+    """
+    Measure several folder trees in one parallel walk.
+
+    Hardlinked files are counted once per run, under whichever folder
+    reaches them first.
+
+    Parameters:
+        folder_paths: Iterable of folder paths
+        max_workers: Optional thread count (defaults to min(8, CPU count))
+        progress: Optional callable(DiskUsage) receiving the running total of
+                  all folders, called from the calling thread
+        progress_interval: Minimum seconds between progress calls
+
+    Returns:
+        dict: Mapping of folder_path -> DiskUsage (missing folders report zeros)
+    """
+    roots = list(dict.fromkeys(folder_paths))
+    totals = {root: [0, 0, 0, 0, 0] for root in roots}
+    if not roots:
+        return {}
+
+    seen = set()
+    lock = threading.Lock()
+    finished = queue.Queue()
+    workers = max_workers or min(8, os.cpu_count() or 4)
+    last_report = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def submit(path, root):
+            future = executor.submit(_scan_dir, path, seen, lock)
+            future.add_done_callback(lambda f: finished.put((root, f)))
+
+        pending = 0
+        for root in roots:
+            submit(root, root)
+            pending += 1
+
+        while pending:
+            root, future = finished.get()
+            pending -= 1
+            try:
+                size, allocated, files, newest, subdirs = future.result()
+            except Exception:
+                continue
+            total = totals[root]
+            total[0] += size
+            total[1] += allocated
+            total[2] += files
+            total[3] += len(subdirs)
+            if newest > total[4]:
+                total[4] = newest
+            for sub in subdirs:
+                submit(sub, root)
+                pending += 1
+
+            if progress and pending and time.monotonic() - last_report >= progress_interval:
+                last_report = time.monotonic()
+                progress(_combine(totals.values()))
+
+    if progress:
+        progress(_combine(totals.values()))
+    return {root: DiskUsage(*total) for root, total in totals.items()}
+
+def _combine(totals):
+    """Sum per-folder totals into one DiskUsage."""
+    size = allocated = files = dirs = newest = 0
+    for total in totals:
+        size += total[0]
+        allocated += total[1]
+        files += total[2]
+        dirs += total[3]
+        newest = max(newest, total[4])
+    return DiskUsage(size, allocated, files, dirs, newest)
+
+def _category(name, parent_category):
+    """Return the breakdown category of a directory directly below a version or Interface."""
+    if parent_category is None:
+        if name == "Interface":
+            return "Interface"
+        return name if name in STORAGE_CATEGORIES else "Other"
+    if parent_category == "Interface":
+        return "Interface/AddOns" if name == "AddOns" else "Other"
+    return parent_category
+
+def _push_top(heap, top_n, item):
+    """Keep the `top_n` largest (size, path) items in a min-heap."""
+    if len(heap) < top_n:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+def storage_breakdown(version_path, top_n=10, progress=None, progress_interval=0.1):
+    """
+    Size one WoW version by category in a single traversal.
+
+    Every file is stat'ed once: its size goes to the category of the
+    top-level folder it lives in, and it competes for a place in two
+    bounded min-heaps (largest files overall and largest SavedVariables),
+    so memory stays O(top_n) however many files the version has.
+
+    Parameters:
+        version_path: Absolute path to a WoW version root
+        top_n: Number of largest files (and SavedVariables) to keep
+        progress: Optional callable(DiskUsage) receiving the running total of
+                  the version, called from the calling thread
+        progress_interval: Minimum seconds between progress calls
+
+    Returns:
+        dict: {
+            "categories": {category: DiskUsage} in STORAGE_CATEGORIES order (empty ones omitted),
+            "total": DiskUsage of the whole version,
+            "largest": [(size, path), ...] largest first,
+            "saved_variables": [(size, path), ...] largest first,
+        }
+    """
+    totals = {}
+    largest = []
+    saved_variables = []
+    seen = set()
+    stack = [(version_path, None, False)]  # (path, category, inside a SavedVariables folder)
+    last_report = time.monotonic()
+    while stack:
+        if progress and time.monotonic() - last_report >= progress_interval:
+            last_report = time.monotonic()
+            progress(_combine(totals.values()))
+        current, category, in_saved = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            sub = _category(entry.name, category)
+                            if sub != "Interface":
+                                totals.setdefault(sub, [0, 0, 0, 0, 0])[3] += 1
+                            stack.append((entry.path, sub, in_saved or entry.name == "SavedVariables"))
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if st.st_nlink > 1 and st.st_ino:
+                            key = (st.st_dev, st.st_ino)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                        file_category = category if category not in (None, "Interface") else "Other"
+                        total = totals.setdefault(file_category, [0, 0, 0, 0, 0])
+                        blocks = getattr(st, "st_blocks", None)
+                        total[0] += st.st_size
+                        total[1] += st.st_size if blocks is None else blocks * 512
+                        total[2] += 1
+                        if st.st_mtime > total[4]:
+                            total[4] = st.st_mtime
+                        if top_n:
+                            item = (st.st_size, entry.path)
+                            _push_top(largest, top_n, item)
+                            if in_saved and category == "WTF" and entry.name.lower().endswith(".lua"):
+                                _push_top(saved_variables, top_n, item)
+                    except (OSError, PermissionError):
+                        continue
+        except (OSError, PermissionError):
+            continue
+
+    if progress:
+        progress(_combine(totals.values()))
+    return {
+        "categories": {
+            name: DiskUsage(*totals[name]) for name in STORAGE_CATEGORIES if name in totals
+        },
+        "total": _combine(totals.values()),
+        "largest": sorted(largest, reverse=True),
+        "saved_variables": sorted(saved_variables, reverse=True),
+    }
@@ -0,0 +1,294 @@
+"""
+Duplicates tab for WoW Cleanup Tool.
+
+Finds files that are byte-identical across installed WoW versions (retail,
+classic, classic era and their PTR/beta variants) and lets the user pick
+which copies to remove. Each group lists every copy with the bytes that
+removing all but one would reclaim.
+
+Only Screenshots groups can be selected. Every version loads its own
+AddOns and WTF files, so removing an "extra" copy there breaks the addon
+in that version; those groups are listed as report-only.
+
+Check state lives in a ResultStore (app.dup_store) with one group per
+removable duplicate group, and rows show it through the check tags of
+Modules.virtual_tree, like the File and Orphan Cleaner trees; report-only
+rows carry no tag.
+
+Functions:
+    build_duplicates_tab: Build the Duplicates tab UI
+    scan_duplicates: Run the cross-version duplicate scan in the background
+    select_extra_copies: Check every copy except the first of each removable group
+    process_selected_duplicates: Delete or trash the checked copies
+    on_dup_tree_click: Toggle a row (or a whole group) on click
+"""
+
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+from Modules import localization
+from Modules.dedupe import find_duplicate_files
+from Modules.game_validation import is_game_version_valid, show_game_validation_warning
+from Modules.performance import delete_files_batch
+from Modules.result_store import ResultStore
+from Modules.settings import save_settings
+from Modules.ui_scheduler import get_scheduler
+from Modules.version_utils import format_size
+from Modules.virtual_tree import UNCHECKED_TAG, configure_check_tags, set_check_tags
+
+def build_duplicates_tab(app, parent):
+    """Build the Duplicates tab.
+
+    Args:
+        app: The WoWCleanupTool instance
+        parent: The tab frame to build into
+    """
+    app.dup_store = ResultStore()
+    app.dup_rows = {}  # iid -> (store group, ordinal); ordinal is None for group rows
+    app.dup_group_rows = []  # store group -> group row iid
+
+    frame = ttk.Frame(parent, padding=10)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(
+        frame,
+        text=localization._("duplicates_description"),
+        wraplength=700,
+        justify="left",
+    ).pack(anchor="w", pady=(0, 8))
+
+    buttons = ttk.Frame(frame)
+    buttons.pack(fill="x", pady=(0, 6))
+    ttk.Button(buttons, text=localization._("scan"), command=lambda: scan_duplicates(app)).pack(side="left", padx=(0, 6))
+    ttk.Button(
+        buttons, text=localization._("duplicates_select_extra"), command=lambda: select_extra_copies(app),
+    ).pack(side="left", padx=(0, 6))
+    ttk.Button(
+        buttons, text=localization._("process_selected"), command=lambda: process_selected_duplicates(app),
+    ).pack(side="left", padx=(0, 12))
+
+    ttk.Label(buttons, text=localization._("duplicates_min_size")).pack(side="left", padx=(0, 4))
+    try:
+        start_kb = int(app.settings.get("duplicates_min_kb", 64))
+    except Exception:
+        start_kb = 64
+    app.dup_min_kb_var = tk.IntVar(value=max(start_kb, 1))
+    ttk.Spinbox(buttons, from_=1, to=1048576, width=8, textvariable=app.dup_min_kb_var).pack(side="left")
+    ttk.Label(buttons, text="KB").pack(side="left", padx=(4, 0))
+
+    app.dup_status = ttk.Label(frame, text="")
+    app.dup_status.pack(anchor="w", pady=(0, 4))
+
+    tree_frame = ttk.Frame(frame)
+    tree_frame.pack(fill="both", expand=True)
+    app.dup_tree = ttk.Treeview(tree_frame, columns=("size", "reclaimable"), show="tree headings")
+    app.dup_tree.heading("#0", text=localization._("duplicates_col_file"), anchor="w")
+    app.dup_tree.heading("size", text=localization._("analytics_col_size"), anchor="e")
+    app.dup_tree.heading("reclaimable", text=localization._("duplicates_col_reclaimable"), anchor="e")
+    app.dup_tree.column("#0", width=480, stretch=True)
+    app.dup_tree.column("size", width=100, stretch=False, anchor="e")
+    app.dup_tree.column("reclaimable", width=110, stretch=False, anchor="e")
+    scroll_y = ttk.Scrollbar(tree_frame, orient="vertical", command=app.dup_tree.yview)
+    app.dup_tree.configure(yscrollcommand=scroll_y.set)
+    app.dup_tree.pack(side="left", fill="both", expand=True)
+    scroll_y.pack(side="right", fill="y")
+    configure_check_tags(app.dup_tree, (getattr(app, "chk_checked", None), getattr(app, "chk_unchecked", None)))
+    app.dup_tree.bind("<Button-1>", lambda e: on_dup_tree_click(app, e))
+
+def _update_selection_status(app):
+    store = app.dup_store
+    try:
+        app.dup_status.configure(
+            text=localization._("duplicates_selected").format(
+                store.checked_count(), format_size(store.checked_size()),
+            )
+        )
+    except Exception:
+        pass
+
+def _group_items(app, group):
+    """Return the group row and the copy rows of a store group."""
+    pid = app.dup_group_rows[group]
+    return (pid,) + app.dup_tree.get_children(pid)
+
+def on_dup_tree_click(app, event):
+    """Toggle a copy, or every copy of a group when its parent row is clicked."""
+    elem = app.dup_tree.identify("element", event.x, event.y)
+    if elem in ("Treeitem.indicator", "treeitem.indicator", "indicator"):
+        return
+    iid = app.dup_tree.identify_row(event.y)
+    row = app.dup_rows.get(iid)
+    if row is None:
+        # Report-only rows have no checkbox
+        return "break" if iid else None
+    store = app.dup_store
+    group, ordinal = row
+    if ordinal is None:
+        state = not store.group_checked(group)
+        store.set_group_checked(group, state)
+        set_check_tags(app.dup_tree, _group_items(app, group), state)
+    else:
+        set_check_tags(app.dup_tree, (iid,), store.toggle(ordinal))
+        set_check_tags(app.dup_tree, (app.dup_group_rows[group],), store.group_checked(group))
+    _update_selection_status(app)
+    return "break"
+
+def select_extra_copies(app):
+    """Check every copy except the first one of each removable group, so one copy always survives."""
+    store = app.dup_store
+    store.set_all(False)
+    set_check_tags(app.dup_tree, None, False)
+    extra = []
+    for group in range(store.group_count()):
+        r = store.group_range(group)
+        store.selection.set_range(r.start + 1, r.stop, True)
+        extra.extend(_group_items(app, group)[2:])
+    set_check_tags(app.dup_tree, extra, True)
+    _update_selection_status(app)
+
+def scan_duplicates(app):
+    """Scan all versions for cross-version duplicates on a background thread.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    if getattr(app, "_dup_scan_in_progress", False):
+        return
+
+    base = app.wow_path_var.get().strip()
+    if not base or not os.path.isdir(base):
+        messagebox.showerror(localization._("invalid_folder"), localization._("select_valid_wow_first"))
+        return
+
+    try:
+        min_kb = max(int(app.dup_min_kb_var.get()), 1)
+    except Exception:
+        min_kb = 64
+    app.dup_min_kb_var.set(min_kb)
+    app.settings["duplicates_min_kb"] = min_kb
+    save_settings(app.settings)
+
+    app._dup_scan_in_progress = True
+    for n in app.dup_tree.get_children(""):
+        app.dup_tree.delete(n)
+    app.dup_store = ResultStore()
+    app.dup_rows = {}
+    app.dup_group_rows = []  # store group -> group row iid
+    app.dup_status.configure(text=localization._("scanning"))
+
+    versions = app._enumerate_versions(base)
+    logger = app.backend_logger()
+
+    def worker():
+        try:
+            groups = find_duplicate_files(versions, min_size=min_kb * 1024, logger=logger)
+            error = None
+        except Exception as e:
+            groups, error = [], e
+
+        copies_text = localization._("duplicates_group")
+        report_only_text = localization._("duplicates_report_only")
+
+        def insert_group(group):
+            copies = group["copies"]
+            removable = group.get("removable", False)
+            tags = (UNCHECKED_TAG,) if removable else ()
+            pid = app.dup_tree.insert(
+                "", "end",
+                text=f"  {copies_text.format(os.path.basename(copies[0][2]), len(copies))}",
+                values=(
+                    format_size(group["size"]),
+                    format_size(group["reclaimable"]) if removable else report_only_text,
+                ),
+                open=False,
+                tags=tags,
+            )
+            if removable:
+                paths = [path for _vlabel, _rel, path in copies]
+                index = app.dup_store.add_group(
+                    os.path.basename(paths[0]), paths, dict.fromkeys(paths, group["size"]),
+                )
+                app.dup_rows[pid] = (index, None)
+                app.dup_group_rows.append(pid)
+                first = app.dup_store.group_range(index).start
+            for position, (vlabel, rel, _path) in enumerate(copies):
+                iid = app.dup_tree.insert(
+                    pid, "end", text=f"  {vlabel}: {rel}", values=(format_size(group["size"]), ""), tags=tags,
+                )
+                if removable:
+                    app.dup_rows[iid] = (index, first + position)
+
+        def fail(e):
+            nonlocal error
+            error = e
+
+        def finish():
+            total = sum(g["reclaimable"] for g in groups if g.get("removable"))
+            if error is not None:
+                status = localization._("analytics_failed").format(localization._("duplicates"), error)
+            else:
+                status = localization._("duplicates_found").format(len(groups), format_size(total))
+            app.dup_status.configure(text=status)
+            app.log(status)
+            app._dup_scan_in_progress = False
+
+        def apply_groups():
+            # Rows are inserted in frame-budgeted slices; the status follows the last one
+            get_scheduler(app.dup_tree).run(groups, insert_group, finish, fail)
+
+        try:
+            app.root.after(0, apply_groups)
+        except Exception:
+            app._dup_scan_in_progress = False
+
+    threading.Thread(target=worker, daemon=True).start()
+
+def process_selected_duplicates(app):
+    """Delete or trash the checked copies after validation and confirmation.
+
+    Groups with every copy checked are refused: the tool only removes
+    redundant copies, never the last one.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    store = app.dup_store
+    selected = store.checked_paths()
+    if not selected:
+        messagebox.showinfo(localization._("no_selection"), localization._("no_files_selected"))
+        return
+
+    if any(store.group_checked(group) for group in range(store.group_count())):
+        messagebox.showerror(localization._("confirm"), localization._("duplicates_all_copies_selected"))
+        return
+
+    base = app.wow_path_var.get().strip()
+    for vpath, _vlabel in app._enumerate_versions(base):
+        if not is_game_version_valid(vpath):
+            show_game_validation_warning(app.root)
+            return
+
+    use_trash_requested = (app.delete_mode.get() == "trash")
+    action = (
+        localization._("move_to_trash")
+        if use_trash_requested
+        else localization._("delete_permanently_action")
+    )
+    if not messagebox.askyesno(
+        localization._("confirm"),
+        localization._("confirm_action_files").format(action, len(selected))
+    ):
+        return
+
+    processed, _permanently_deleted, _used_trash = delete_files_batch(
+        selected,
+        use_trash=use_trash_requested,
+        logger=app.backend_logger(),
+        module_name="Duplicates",
+    )
+
+    app.log(localization._("duplicates_processed").format(processed))
+    app._sweep_empty_dirs(selected, "Duplicates")
+    messagebox.showinfo(localization._("completed"), localization._("processed_files_count").format(processed))
+    scan_duplicates(app)
@@ -11,7 +11,6 @@ Functions:
 import os
 import os.path
 import re
-from Modules import localization  # Removed localization.get_text references
 from send2trash import send2trash
 
 # Compiled pattern for .bak/.old (performance)
@@ -35,7 +34,7 @@ def scan_bak_old_in_version(version_path, logger=None):
                 fpath = os.path.join(rootd, fname)
                 matches.append(fpath)
                 if logger:
-                    logger.debug("file_cleaner_found_file: {}".format(fpath))  # Removed localization
+                    logger.debug("file_cleaner_found_file", fpath)
     return matches
 
 def find_bak_old_files(versions, logger=None):
@@ -52,7 +51,7 @@ def find_bak_old_files(versions, logger=None):
                             if _BAK_OLD_PATTERN.search(entry.name):
                                 out_list.append(entry.path)
                                 if logger:
-                                    logger.debug("file_cleaner_found: {}".format(entry.path))  # Removed localization
+                                    logger.debug("file_cleaner_found", entry.path)
                         elif entry.is_dir(follow_symlinks=False):
                             _scan_dir(entry.path, out_list)
                     except (OSError, PermissionError):
@@ -70,7 +69,7 @@ def find_bak_old_files(versions, logger=None):
             total += len(vlabel_files)
 
     if logger:
-        logger.info("file_cleaner_total_found: {}".format(total))  # Removed localization
+        logger.info("file_cleaner_total_found", total)
     return results
 
 def delete_files(paths, use_trash=False, logger=None):
@@ -102,15 +101,15 @@ def delete_files(paths, use_trash=False, logger=None):
                 send2trash(fp)
                 used_trash = True
                 if logger:
-                    logger.info("file_cleaner_moved_trash: {}".format(fp))  # Removed localization
+                    logger.info("file_cleaner_moved_trash", fp)
             else:
                 os.remove(fp)
                 if logger:
-                    logger.info("file_cleaner_deleted: {}".format(fp))  # Removed localization
+                    logger.info("file_cleaner_deleted", fp)
             processed += 1
         except (OSError, IOError) as e:
             if logger:
-                logger.error("file_cleaner_error_deleting: {} - {}".format(fp, e))  # Removed localization
+                logger.error("file_cleaner_error_deleting", fp, e)
     permanently_deleted = not use_trash
     return processed, permanently_deleted, used_trash
 
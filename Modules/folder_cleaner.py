@@ -2,7 +2,8 @@
 Backend logic for Folder Cleaner.
 
 This module performs:
-- Scanning for folders that can be cleaned safely (Logs, Errors, Screenshots, etc.)
+- Scanning for folders that can be cleaned safely (Logs, Errors, Cache, etc.)
+- Breaking the Cache folder down by WDB/ADB locale and subfolder
 - Deleting folder contents, either permanently or to Trash
 - Returning structured results to the UI layer
 
@@ -13,18 +14,27 @@ Functions:
     scan_cleanable_folders: Scan a single version for cleanable folders
     scan_all_versions: Scan all WoW versions for cleanable folders
     clean_folders: Delete or trash entire folders
+    scan_cache: Break a version's Cache folder down into per-locale/subfolder entries
+    select_stale_cache_entries: Pick cache entries unused for N days
 """
 import os
+import time
 import shutil
-    # Removed localization import as it is no longer needed
+from Modules.log_adapter import DEBUG, enabled
 from Modules.performance import delete_files_batch
+from Modules.version_utils import format_size, get_folder_stats_parallel
 
+# AddOns.txt.bak used to be listed here, but it is a file inside WTF, not a
+# version-level folder; the File Cleaner's .bak scan already covers it.
 DEFAULT_CLEANABLE_FOLDERS = [
     "Logs",                 # Debug and error logs
     "Errors",               # Error report files
-    "AddOns.txt.bak",       # Backup of AddOns.txt (if stored incorrectly)
+    "Cache",                # Client caches (rebuilt automatically on launch)
 ]
 
+# Cache subfolders whose children are per-locale folders (e.g., WDB/enUS)
+CACHE_LOCALE_FOLDERS = ("WDB", "ADB")
+
 def scan_cleanable_folders(version_path, logger=None):
     """
     Scan a single WoW version for folders that can be cleaned.
@@ -49,7 +59,7 @@ def scan_cleanable_folders(version_path, logger=None):
                 abs_path = os.path.join(version_path, rel)
                 found.append((rel, abs_path))
                 if logger:
-                    logger.debug("folder_cleaner_found: {}".format(abs_path))
+                    logger.debug("folder_cleaner_found: {}", abs_path)
     except (OSError, PermissionError):
         pass
 
@@ -79,7 +89,7 @@ def scan_all_versions(versions, logger=None):
             results[vlabel] = lst
             total += len(lst)
     if logger:
-        logger.info("folder_cleaner_total: {}".format(total))
+        logger.info("folder_cleaner_total: {}", total)
     return results
 
 def clean_folders(paths, use_trash=False, logger=None):
@@ -94,3 +104,64 @@ def clean_folders(paths, use_trash=False, logger=None):
         Tuple of (processed_count, permanently_deleted_flag, used_trash_flag)
     """
     return delete_files_batch(paths, use_trash, logger, "FolderCleaner")
+
+def scan_cache(version_path, logger=None):
+    """
+    Break a version's Cache folder down into cleanable entries.
+
+    WDB (creature/item/quest caches) and ADB (hotfix/DB caches) are split
+    per locale, since a client only uses the locale it runs in; every other
+    Cache subfolder is one entry. Sizes are computed in parallel.
+
+    Parameters:
+        version_path: Absolute path to a WoW version root
+        logger: Optional object with .debug() method
+
+    Returns:
+        list: (label, abs_path, size_bytes, file_count, newest_mtime) tuples,
+              e.g. ("WDB/enUS", ".../Cache/WDB/enUS", ...), largest first
+    """
+    cache_dir = os.path.join(version_path, "Cache")
+    entries = []  # (label, path)
+
+    def subdirs(path):
+        try:
+            with os.scandir(path) as it:
+                return sorted((e.name, e.path) for e in it if e.is_dir(follow_symlinks=False))
+        except (OSError, PermissionError):
+            return []
+
+    for name, path in subdirs(cache_dir):
+        if name.upper() in CACHE_LOCALE_FOLDERS:
+            locales = subdirs(path)
+            if locales:
+                entries.extend((f"{name}/{locale}", locale_path) for locale, locale_path in locales)
+                continue
+        entries.append((name, path))
+
+    stats = get_folder_stats_parallel(path for _label, path in entries)
+    result = [(label, path, *stats.get(path, (0, 0, 0))) for label, path in entries]
+    result.sort(key=lambda entry: entry[2], reverse=True)
+
+    if enabled(logger, DEBUG):
+        for label, _path, size, count, _newest in result:
+            logger.debug("cache_entry_found", label, format_size(size), count)
+    return result
+
+def select_stale_cache_entries(entries, min_age_days=0, now=None):
+    """
+    Pick cache entries whose newest file is older than `min_age_days`.
+
+    Parameters:
+        entries: Result of scan_cache()
+        min_age_days: Age threshold in days (0 selects every entry)
+        now: Optional reference timestamp (defaults to time.time())
+
+    Returns:
+        list: Absolute paths of the selected entries
+    """
+    if not min_age_days:
+        return [path for _label, path, _size, _count, _newest in entries]
+    now = time.time() if now is None else now
+    cutoff = now - min_age_days * 24 * 60 * 60
+    return [path for _label, path, _size, _count, newest in entries if newest < cutoff]
@@ -0,0 +1,207 @@
+"""
+Folder Cleaner version tab for WoW Cleanup Tool.
+
+Builds the contents of one version tab (Retail, Classic, ...) of the Folder
+Cleaner notebook:
+- the cleanable folders of the version, each with a checkbox, and
+- the Screenshots folder as a VirtualScreenshotList with a preview, so a
+  folder with thousands of screenshots only creates the rows on screen,
+  plus "Optimize Screenshots" (Modules/screenshot_dialog.py) and "Select
+  Similar" (Modules/screenshot_similarity.py) buttons.
+
+build_folder_tools_bar adds the buttons of tools that work across all
+versions (Cache Cleaner, Retention Policies) above the version notebook.
+
+The tab registers its widgets dict in app.version_tabs, which is what
+refresh_folder_cleaner_version and ui_refresh.sync_folder_cleaner_version
+work with.
+
+Functions:
+    build_single_version_tab: Build one Folder Cleaner version tab
+    build_folder_tools_bar: Add the all-versions tool buttons to the Folder Cleaner tab
+"""
+import os
+import tkinter as tk
+from tkinter import ttk
+from Modules import localization
+from Modules.folder_cleaner import scan_cleanable_folders
+from Modules.screenshot_list import VirtualScreenshotList
+from Modules.screenshot_tools import iter_screenshots
+from Modules.ui_helpers import ImgCheckbox
+from Modules.version_utils import format_size
+
+PREVIEW_SIZE = (320, 180)
+
+def _register_version_tab(app, version_label, version_path, widgets):
+    """Store the tab in app.version_tabs, replacing an earlier build of the same version."""
+    for index, (vlabel, _vpath, _widgets) in enumerate(app.version_tabs):
+        if vlabel == version_label:
+            app.version_tabs[index] = (version_label, version_path, widgets)
+            return
+    app.version_tabs.append((version_label, version_path, widgets))
+
+def _styled_list(app, name):
+    """Return app.<name> (styled checkables refreshed on theme changes) without destroyed widgets."""
+    styled = getattr(app, name, None)
+    if styled is None:
+        styled = []
+        setattr(app, name, styled)
+    styled[:] = [widget for widget in styled if widget.winfo_exists()]
+    return styled
+
+def _build_folder_section(app, parent, version_path, version_label, widgets):
+    """Build the folder checkboxes and their buttons; stores folder_vars and add_folder_row in widgets."""
+    section = ttk.LabelFrame(parent, text=localization._("folder_section"), padding=8)
+    section.pack(fill="x", pady=(0, 8))
+
+    rows = ttk.Frame(section)
+    rows.pack(fill="x")
+    folder_vars = {}
+    empty = ttk.Label(rows, text=localization._("no_cleanable_folders"))
+
+    def add_folder_row(rel, abs_path):
+        """Create the checkbox row of one folder and register it in folder_vars."""
+        empty.pack_forget()
+        var = tk.BooleanVar(value=False)
+        checkbox = ImgCheckbox(rows, rel, var, app.assets)
+        checkbox.pack(anchor="w", pady=1)
+        _styled_list(app, "styled_folder_boxes").append(checkbox)
+        folder_vars[rel] = (var, abs_path, checkbox)
+
+    for rel, abs_path in scan_cleanable_folders(version_path):
+        add_folder_row(rel, abs_path)
+    if not folder_vars:
+        empty.pack(anchor="w")
+
+    buttons = ttk.Frame(section)
+    buttons.pack(fill="x", pady=(6, 0))
+    ttk.Button(
+        buttons, text=localization._("toggle_all"), command=lambda: app._toggle_all_folders(folder_vars),
+    ).pack(side="left", padx=(0, 6))
+    ttk.Button(
+        buttons,
+        text=localization._("process_folders"),
+        command=lambda: app._process_selected_folders(version_label, folder_vars),
+    ).pack(side="left")
+
+    widgets["folder_vars"] = folder_vars
+    widgets["add_folder_row"] = add_folder_row
+
+def _build_screenshot_section(app, parent, version_path, version_label, widgets):
+    """Build the screenshot checklist, its preview and its buttons."""
+    section = ttk.LabelFrame(parent, text=localization._("screenshots_section"), padding=8)
+    section.pack(fill="both", expand=True)
+
+    folder = os.path.join(version_path, "Screenshots")
+    if not os.path.isdir(folder):
+        ttk.Label(section, text=localization._("screenshots_not_found")).pack(anchor="w")
+        return
+
+    toolbar = ttk.Frame(section)
+    toolbar.pack(fill="x", pady=(0, 6))
+    status = ttk.Label(section, text="")
+
+    body = ttk.Frame(section)
+    body.pack(fill="both", expand=True)
+    preview_frame = ttk.LabelFrame(body, text=localization._("preview_label"), padding=4)
+    preview_frame.pack(side="right", fill="y", padx=(8, 0))
+    canvas = tk.Canvas(
+        preview_frame, width=PREVIEW_SIZE[0], height=PREVIEW_SIZE[1], highlightthickness=0, bd=0,
+    )
+    canvas.pack(fill="both", expand=True)
+
+    def update_status():
+        status.configure(text=localization._("screenshots_selected").format(
+            shots_list.selected_count(), len(shots_list), format_size(shots_list.selected_size()),
+        ))
+
+    listing = sorted(iter_screenshots(folder))
+    shots_list = VirtualScreenshotList(
+        body,
+        app.assets,
+        on_activate=lambda path: app._show_preview(canvas, path),
+        on_change=update_status,
+    )
+    shots_list.set_paths([path for path, _size, _mtime in listing], [size for _path, size, _mtime in listing])
+    shots_list.pack(side="left", fill="both", expand=True)
+    styled = _styled_list(app, "styled_shot_boxes")
+    styled.append(shots_list)
+    status.pack(anchor="w", pady=(6, 0))
+    update_status()
+
+    select_all_var = tk.BooleanVar(value=False)
+    select_all = ImgCheckbox(toolbar, localization._("select_all"), select_all_var, app.assets)
+    select_all.pack(side="left", padx=(0, 10))
+    styled.append(select_all)
+    select_all_var.trace_add(
+        "write", lambda *_: app._toggle_all_screenshot_files(shots_list, select_all_var.get()),
+    )
+    ttk.Button(
+        toolbar,
+        text=localization._("process_selected"),
+        command=lambda: app._process_selected_screenshots(version_label, shots_list),
+    ).pack(side="left", padx=(0, 6))
+    ttk.Button(
+        toolbar,
+        text=localization._("screenshot_optimizer"),
+        command=lambda: app._open_screenshot_optimizer(version_label, shots_list),
+    ).pack(side="left", padx=(0, 6))
+    ttk.Button(
+        toolbar,
+        text=localization._("similar_select"),
+        command=lambda: app._select_similar_screenshots(version_label, shots_list),
+    ).pack(side="left", padx=(0, 6))
+
+    widgets["shots_vars"] = shots_list
+    widgets["shots_select_all_var"] = select_all_var
+
+def build_single_version_tab(app, tab, version_path, version_label):
+    """Build one Folder Cleaner version tab and register it in app.version_tabs.
+
+    Args:
+        app: The WoWCleanupTool instance
+        tab: The notebook tab frame to build into
+        version_path: Absolute path of the version (e.g. .../_retail_)
+        version_label: Display label of the version (e.g. "Retail")
+
+    Returns:
+        dict: The tab's widgets dict (see ui_refresh.sync_folder_cleaner_version)
+    """
+    frame = ttk.Frame(tab, padding=10)
+    frame.pack(fill="both", expand=True)
+    ttk.Label(frame, text=f"{localization._('path')} {version_path}").pack(anchor="w", pady=(0, 8))
+
+    widgets = {}
+    _build_folder_section(app, frame, version_path, version_label, widgets)
+    _build_screenshot_section(app, frame, version_path, version_label, widgets)
+    _register_version_tab(app, version_label, version_path, widgets)
+    return widgets
+
+def build_folder_tools_bar(app, container):
+    """Add the Folder Cleaner buttons that work across all versions above the version notebook.
+
+    Args:
+        app: The WoWCleanupTool instance
+        container: The Folder Cleaner tab frame (after build_folder_cleaner_tab)
+
+    Returns:
+        ttk.Frame: The toolbar
+    """
+    from Modules.ui_helpers import Tooltip
+    bar = ttk.Frame(container)
+    cache = ttk.Button(bar, text=localization._("cache_cleaner"), command=app._open_cache_cleaner)
+    cache.pack(side="left", padx=(0, 6))
+    Tooltip(cache, localization._("cache_description"), app=app)
+    retention = ttk.Button(bar, text=localization._("retention_policies"), command=app._open_retention_policies)
+    retention.pack(side="left", padx=(0, 6))
+    Tooltip(retention, localization._("retention_description"), app=app)
+
+    packed = container.pack_slaves()
+    if packed:
+        bar.pack(side="top", fill="x", padx=10, pady=(8, 0), before=packed[0])
+    elif container.grid_slaves():
+        columns, rows = container.grid_size()
+        bar.grid(row=rows, column=0, columnspan=max(columns, 1), sticky="ew", padx=10, pady=(4, 0))
+    else:
+        bar.pack(side="top", fill="x", padx=10, pady=(8, 0))
+    return bar
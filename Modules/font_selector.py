@@ -9,6 +9,7 @@ before applying changes.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from Modules import localization
+from Modules.ui_scheduler import get_scheduler
 
 def clean_font_name_for_display(font_name):
     """Clean font name for display by removing leading non-letter characters and trimming spaces.
@@ -45,8 +46,9 @@ def open_font_selector(app):
     Selecting a font previews it immediately. The user must Apply to persist
     the change, or Cancel to revert to the previous font.
     
-    Uses incremental loading: displays fonts in batches as the user scrolls,
-    improving performance on systems with large font catalogs.
+    Uses incremental loading: the list is filled in frame-budgeted slices
+    (see ui_scheduler), so the window stays responsive on systems with large
+    font catalogs.
     
     Args:
         app: The WoWCleanupTool instance with font_families, font_family_var, etc.
@@ -93,11 +95,8 @@ def open_font_selector(app):
 
     # Incremental loading state
     app._font_label_widgets = []
+    _stop_font_loading(app)
     _load_state = {
-        "filtered_fonts": [],
-        "loaded_count": 0,
-        "batch_size": 50,  # Increased for faster loading
-        "after_id": None,
         "bg_color": None,  # Cache background color
     }
 
@@ -112,82 +111,51 @@ def open_font_selector(app):
         # Sort by cleaned display name for consistent alphabetical ordering
         return sorted(result, key=lambda f: clean_font_name_for_display(f).lower())
 
-    def load_batch():
-        """Load the next batch of fonts into the list."""
-        state = _load_state
-        if state["loaded_count"] >= len(state["filtered_fonts"]):
-            return  # All loaded
-        
-        # Cache background color on first batch
-        if state["bg_color"] is None:
-            try:
-                state["bg_color"] = sel.cget("bg")
-            except Exception:
-                state["bg_color"] = "SystemButtonFace"
-        
-        size = max(8, min(28, int(app.font_size_var.get())))
-        batch_end = min(state["loaded_count"] + state["batch_size"], len(state["filtered_fonts"]))
-        bg_color = state["bg_color"]
-        
-        for i in range(state["loaded_count"], batch_end):
-            fam = state["filtered_fonts"][i]
-            try:
-                display_name = clean_font_name_for_display(fam)
-                # Use original font for rendering, but cleaned text to avoid trailing spaces in display
-                # repr() shows if there are hidden characters, but we use cleaned display_name
-                lbl = tk.Label(inner, text=display_name, anchor="w", font=(fam, size), justify="left")
-                lbl.pack(fill="x", anchor="w", padx=2, pady=1, ipadx=0, ipady=0)
-                lbl._family = fam  # Keep original name for actual font application
-                def _on_click(event, f=fam):
-                    apply_font_preview(app, f)
-                lbl.bind("<Button-1>", _on_click)
-                # Hover feedback with cached bg_color
-                lbl.bind("<Enter>", lambda e, l=lbl: l.configure(bg="#e6f2ff"))
-                lbl.bind("<Leave>", lambda e, l=lbl, bg=bg_color: l.configure(bg=bg))
-                app._font_label_widgets.append(lbl)
-            except Exception:
-                # Skip fonts that raise errors when applied
-                pass
-        
-        state["loaded_count"] = batch_end
-
-    def on_scroll(*args):
-        """Detect when user scrolls and load more fonts if needed."""
-        state = _load_state
-        if state["loaded_count"] >= len(state["filtered_fonts"]):
-            return  # All already loaded
-        
-        # Cancel any pending load to avoid spamming
-        if state["after_id"]:
-            try:
-                app.root.after_cancel(state["after_id"])
-            except Exception:
-                pass
-        
-        # Schedule load on next idle for immediate response
-        state["after_id"] = app.root.after_idle(load_batch)
+    def add_font_label(fam, size):
+        """Add one font family to the list, rendered in its own font."""
+        bg_color = _load_state["bg_color"]
+        try:
+            display_name = clean_font_name_for_display(fam)
+            # Use original font for rendering, but cleaned text to avoid trailing spaces in display
+            lbl = tk.Label(inner, text=display_name, anchor="w", font=(fam, size), justify="left")
+            lbl.pack(fill="x", anchor="w", padx=2, pady=1, ipadx=0, ipady=0)
+            lbl._family = fam  # Keep original name for actual font application
+            def _on_click(event, f=fam):
+                apply_font_preview(app, f)
+            lbl.bind("<Button-1>", _on_click)
+            # Hover feedback with cached bg_color
+            lbl.bind("<Enter>", lambda e, l=lbl: l.configure(bg="#e6f2ff"))
+            lbl.bind("<Leave>", lambda e, l=lbl, bg=bg_color: l.configure(bg=bg))
+            app._font_label_widgets.append(lbl)
+        except tk.TclError:
+            if not inner.winfo_exists():
+                # The selector was closed without going through Apply/Cancel
+                _stop_font_loading(app)
+            # Skip fonts that raise errors when applied
+        except Exception:
+            pass
 
     def populate(filter_text=""):
-        """Clear list and prepare filtered fonts for incremental loading."""
+        """Clear the list and refill it with the matching fonts in the background."""
         state = _load_state
-        # Cancel any pending load
-        if state["after_id"]:
-            try:
-                app.root.after_cancel(state["after_id"])
-            except Exception:
-                pass
-        
+        _stop_font_loading(app)
+
         # Clear display
         for w in inner.winfo_children():
             w.destroy()
         app._font_label_widgets.clear()
-        
-        # Prepare filtered list
-        state["filtered_fonts"] = get_filtered_fonts(filter_text)
-        state["loaded_count"] = 0
-        
-        # Load first batch immediately
-        load_batch()
+
+        # Cache background color on first fill
+        if state["bg_color"] is None:
+            try:
+                state["bg_color"] = sel.cget("bg")
+            except Exception:
+                state["bg_color"] = "SystemButtonFace"
+
+        size = max(8, min(28, int(app.font_size_var.get())))
+        app._font_load_task = get_scheduler(sel).run(
+            get_filtered_fonts(filter_text), lambda fam: add_font_label(fam, size)
+        )
 
     populate()
 
@@ -195,13 +163,6 @@ def open_font_selector(app):
         populate(filter_var.get())
 
     filter_var.trace_add("write", on_filter_change)
-    
-    # Detect scroll to load more fonts incrementally
-    canvas.bind("<MouseWheel>", on_scroll)
-    canvas.bind("<Button-4>", on_scroll)  # Linux scroll up
-    canvas.bind("<Button-5>", on_scroll)  # Linux scroll down
-    # Also bind to scrollbar movement for more reliable detection
-    canvas.configure(yscrollcommand=lambda *args: (scroll_y.set(*args), on_scroll()))
 
     # Buttons
     btn_frame = ttk.Frame(sel)
@@ -216,6 +177,13 @@ def open_font_selector(app):
 
     sel.protocol("WM_DELETE_WINDOW", on_close_sel)
 
+def _stop_font_loading(app):
+    """Cancel the scheduled fill of the font list, e.g. because the selector closes."""
+    task = getattr(app, "_font_load_task", None)
+    if task is not None:
+        task.cancel()
+        app._font_load_task = None
+
 def apply_font_preview(app, family: str):
     """Temporarily apply a font family to the UI for previewing.
     
@@ -251,6 +219,7 @@ def finalize_font_change(app):
     Args:
         app: The WoWCleanupTool instance
     """
+    _stop_font_loading(app)
     try:
         new = getattr(app, "_previewed_family", app.font_family_var.get())
         old = getattr(app, "_prev_font_family", None)
@@ -307,6 +276,7 @@ def cancel_font_change(app):
     Args:
         app: The WoWCleanupTool instance
     """
+    _stop_font_loading(app)
     try:
         prev = getattr(app, "_prev_font_family", None)
         if prev:
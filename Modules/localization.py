@@ -14,6 +14,9 @@ Supports the 11 languages available in World of Warcraft plus Ukrainian:
 - Chinese - Simplified (zhCN)
 - Chinese - Traditional (zhTW)
 - Ukrainian (ukUA) - Bonus language
+
+Modules translate through the module-level _() (localization._("key")),
+which uses the language last chosen with set_language().
 """
 
 import importlib
@@ -40,11 +43,13 @@ AVAILABLE_LANGUAGES = {
 def load_translations(lang_code):
     try:
         module = importlib.import_module(f"Locales.{lang_code}")
-        return getattr(module, "TRANSLATIONS", {})
     except Exception:
         # Fallback to English if import fails
-        module = importlib.import_module("Locales.enUS")
-        return getattr(module, "TRANSLATIONS", {})
+        lang_code = DEFAULT_LANGUAGE
+        module = importlib.import_module(f"Locales.{lang_code}")
+    translations = getattr(module, "TRANSLATIONS", {})
+    # Locale files nest their strings under the language code
+    return translations.get(lang_code, translations)
 
 class Localization:
     def __init__(self, lang_code=DEFAULT_LANGUAGE):
@@ -55,6 +60,20 @@ class Localization:
         text = self.translations.get(key, self.fallback.get(key, key))
         return text.format(*args) if args else text
 
+_current = None
+
+def set_language(lang_code):
+    """Make `lang_code` the language of the module-level _() and return its Localization."""
+    global _current
+    _current = Localization(lang_code)
+    return _current
+
+def _(key, *args):
+    """Translate `key` in the current language (English until set_language is called)."""
+    if _current is None:
+        set_language(DEFAULT_LANGUAGE)
+    return _current._(key, *args)
+
 def get_translation_completeness(lang_code):
     """Get the percentage of translations completed for a language.
     
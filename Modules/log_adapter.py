@@ -0,0 +1,81 @@
+"""
+Leveled, lazily formatted logging for backend modules.
+
+Backend functions take an optional `logger` and call logger.debug(),
+logger.info() and logger.error() - often once per file inside scan and
+delete loops. LogAdapter gives those calls a real implementation on top
+of a line sink (Logger.log):
+
+- Messages are passed as a localization key (or literal template) plus
+  arguments: `logger.debug("orphan_found_in", vlabel, path)`. The level is
+  checked first, and only enabled messages are translated and formatted,
+  so a disabled level costs one method call per message.
+- Errors are tagged "ERROR:" so they stand out in the Log tab.
+- enabled(logger, level) lets loops that exist only to log skip the loop.
+
+It contains zero Tkinter/UI logic; the sink decides where lines go.
+
+Classes:
+    LogAdapter: debug/info/error front end with a minimum level
+
+Functions:
+    enabled: Return True if a (possibly None) logger would emit a level
+"""
+DEBUG = 10
+INFO = 20
+ERROR = 40
+
+class LogAdapter:
+    """
+    Leveled logger that formats messages only when their level is enabled.
+
+    Args:
+        sink: Callable(str) receiving finished lines (e.g. Logger.log)
+        level: Minimum level emitted (DEBUG, INFO or ERROR)
+        translate: Optional callable(key, *args) -> str (e.g. localization._);
+                   messages are formatted with str.format when omitted
+    """
+
+    def __init__(self, sink, level=INFO, translate=None):
+        self.sink = sink
+        self.level = level
+        self.translate = translate
+
+    def set_level(self, level):
+        self.level = level
+
+    def isEnabledFor(self, level):
+        return level >= self.level
+
+    def _emit(self, message, args, prefix=""):
+        # Literal templates pass through localization._ as unknown keys
+        try:
+            if self.translate:
+                text = self.translate(message, *args)
+            else:
+                text = message.format(*args) if args else message
+        except (IndexError, KeyError, ValueError):
+            text = message
+        if args and text == message:
+            # Unknown key or mismatched template: keep the arguments visible
+            text = " ".join([message] + [str(a) for a in args])
+        self.sink(prefix + text)
+
+    def debug(self, message, *args):
+        if self.level <= DEBUG:
+            self._emit(message, args)
+
+    def info(self, message, *args):
+        if self.level <= INFO:
+            self._emit(message, args)
+
+    def error(self, message, *args):
+        if self.level <= ERROR:
+            self._emit(message, args, "ERROR: ")
+
+def enabled(logger, level):
+    """Return True if `logger` exists and would emit messages of `level`."""
+    if not logger:
+        return False
+    check = getattr(logger, "isEnabledFor", None)
+    return check(level) if check else True
@@ -0,0 +1,184 @@
+"""
+Append-only, rotating archive of exported log sessions.
+
+The old append export re-read the whole export file, split it into
+sessions on a marker line and rewrote all of it, so every export cost as
+much as the file had grown. An archive instead keeps:
+
+- one JSON-lines segment per session ({"time": ..., "text": ...} per line)
+  in a "<name>_sessions" folder next to the index, and
+- a small JSON index listing the sessions (file, start time, line count,
+  size, compressed flag).
+
+Exporting writes one new segment and rewrites only the index, so the cost
+is proportional to the new session. Keeping the last N sessions drops
+index entries and deletes their segment files; segments other than the
+newest can be gzip-compressed, each exactly once.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    LogArchive: Index plus session segments
+
+Functions:
+    is_archive_index: Return True if a file is a LogArchive index
+"""
+import os
+import re
+import json
+import gzip
+from datetime import datetime
+
+ARCHIVE_FORMAT = "wow-cleanup-log-archive"
+ARCHIVE_VERSION = 1
+
+# Lines produced by Logger.log: "[YYYY-mm-dd HH:MM:SS] text"
+_LINE_RE = re.compile(r"^\[(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)\] ?(.*)$", re.DOTALL)
+
+def is_archive_index(path):
+    """Return True if `path` is a LogArchive index file."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return isinstance(data, dict) and data.get("format") == ARCHIVE_FORMAT
+    except (OSError, ValueError):
+        return False
+
+def _record(line):
+    match = _LINE_RE.match(line)
+    if match:
+        return {"time": match.group(1), "text": match.group(2)}
+    return {"time": None, "text": line}
+
+class LogArchive:
+    """
+    Log archive made of an index file and per-session JSON-lines segments.
+
+    Args:
+        index_path: Path of the JSON index (segments go to "<name>_sessions")
+        max_sessions: Number of sessions kept; older ones are deleted
+        compress: Gzip segments once a newer session has been added
+    """
+
+    def __init__(self, index_path, max_sessions=20, compress=True):
+        self.index_path = index_path
+        self.segment_dir = os.path.splitext(index_path)[0] + "_sessions"
+        self.max_sessions = max(int(max_sessions), 1)
+        self.compress = compress
+        self.index = self._load_index()
+
+    # ----- index -----
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("format") == ARCHIVE_FORMAT:
+                data.setdefault("sessions", [])
+                data.setdefault("next_id", len(data["sessions"]) + 1)
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION, "next_id": 1, "sessions": []}
+
+    def _save_index(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=1)
+        os.replace(tmp, self.index_path)
+
+    def sessions(self):
+        """Return the index entries, oldest first."""
+        return list(self.index["sessions"])
+
+    # ----- writing -----
+    def append_session(self, lines, started=None):
+        """Write `lines` as a new session, then rotate and compress older ones.
+
+        Args:
+            lines: Iterable of log lines (streamed, e.g. Logger.iter_lines())
+            started: Optional session start time (datetime); defaults to now
+
+        Returns:
+            dict: Index entry of the new session
+        """
+        os.makedirs(self.segment_dir, exist_ok=True)
+        session_id = self.index["next_id"]
+        name = f"session_{session_id:06d}.jsonl"
+        path = os.path.join(self.segment_dir, name)
+        part = path + ".part"
+        count = 0
+        with open(part, "w", encoding="utf-8") as f:
+            for line in lines:
+                f.write(json.dumps(_record(line), ensure_ascii=False) + "\n")
+                count += 1
+        os.replace(part, path)
+
+        entry = {
+            "id": session_id,
+            "file": name,
+            "started": (started or datetime.now()).strftime("%Y-%m-%d %H:%M:%S"),
+            "lines": count,
+            "bytes": os.path.getsize(path),
+            "compressed": False,
+        }
+        self.index["next_id"] = session_id + 1
+        self.index["sessions"].append(entry)
+        dropped = self._rotate()
+        self._save_index()
+        for old in dropped:
+            self._remove_segment(old)
+        if self.compress:
+            self.compress_old_sessions()
+        return entry
+
+    def _rotate(self):
+        """Drop index entries beyond max_sessions and return them."""
+        sessions = self.index["sessions"]
+        excess = len(sessions) - self.max_sessions
+        if excess <= 0:
+            return []
+        dropped = sessions[:excess]
+        del sessions[:excess]
+        return dropped
+
+    def _remove_segment(self, entry):
+        try:
+            os.remove(os.path.join(self.segment_dir, entry["file"]))
+        except OSError:
+            pass
+
+    def compress_old_sessions(self):
+        """Gzip every segment except the newest; return the number compressed."""
+        compressed = 0
+        for entry in self.index["sessions"][:-1]:
+            if entry.get("compressed"):
+                continue
+            src = os.path.join(self.segment_dir, entry["file"])
+            dst = src + ".gz"
+            try:
+                with open(src, "rb") as fin, gzip.open(dst, "wb") as fout:
+                    while True:
+                        chunk = fin.read(1 << 20)
+                        if not chunk:
+                            break
+                        fout.write(chunk)
+                os.remove(src)
+            except OSError:
+                continue
+            entry["file"] += ".gz"
+            entry["bytes"] = os.path.getsize(dst)
+            entry["compressed"] = True
+            compressed += 1
+        if compressed:
+            self._save_index()
+        return compressed
+
+    # ----- reading -----
+    def iter_records(self, entry):
+        """Yield the {"time", "text"} records of one session."""
+        path = os.path.join(self.segment_dir, entry["file"])
+        opener = gzip.open if entry.get("compressed") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
@@ -1,7 +1,37 @@
+import os
+import queue
+import threading
+from collections import deque
+from itertools import islice
 from datetime import datetime
 
+# How often the attached Text widget is refreshed (about 25 Hz)
+FLUSH_INTERVAL_MS = 40
+# Lines kept in memory (and in the Log tab); older lines spill to disk
+MAX_MEMORY_LINES = 10000
+# Spill files of previous sessions kept next to the current one
+SPILL_BACKUPS = 2
+
+def _text_lines(entries):
+    """Return the number of text lines of log entries (a message may contain newlines)."""
+    return sum(entry.count("\n") + 1 for entry in entries)
+
 class Logger:
-    """Simple logger that keeps lines and (optionally) writes to a Tk Text widget.
+    """Thread-safe logger that keeps lines and (optionally) mirrors them to a Tk Text widget.
+
+    log() may be called from any thread: it only timestamps the line and
+    puts it on a queue. The main thread drains the queue - FLUSH_INTERVAL_MS
+    after the first queued line while a widget is attached, or on
+    get_lines()/flush() - and inserts each batch with a single widget
+    update, so verbose scans that log thousands of lines never touch the
+    Text widget from a worker thread. No poll is pending while nothing is
+    logged.
+
+    Memory is bounded: `lines` is a ring buffer of the newest `max_lines`
+    lines and the widget is trimmed to the same count. Lines that fall
+    out of the ring are appended to a spill file (rotated per session,
+    keeping SPILL_BACKUPS older ones), so iter_lines() can still stream
+    the complete session history for export.
 
     Usage:
         logger = Logger()
@@ -10,28 +40,44 @@ class Logger:
         logger.clear()
     """
 
-    def __init__(self):
-        self.lines = []
+    def __init__(self, spill_path=None, max_lines=MAX_MEMORY_LINES):
+        self.max_lines = max(int(max_lines), 100)
+        self.lines = deque(maxlen=self.max_lines)
         self.text_widget = None
+        self.spill_path = spill_path
+        self.spilled = 0  # text lines in the spill file
+        self._widget_lines = 0  # text lines in the widget (entries may span several)
+        self._pending = queue.SimpleQueue()
+        self._poll_armed = False  # a flush of the widget is scheduled
+        self._poll_lock = threading.Lock()
+        if spill_path:
+            self._rotate_spill()
 
     def attach_text_widget(self, text_widget):
-        """Attach a `tk.Text` widget to mirror logs into the UI."""
+        """Attach a `tk.Text` widget to mirror logs into the UI (main thread only)."""
+        self._drain()
         self.text_widget = text_widget
         try:
             self.text_widget.configure(state="normal")
             self.text_widget.delete("1.0", "end")
             if self.lines:
                 self.text_widget.insert("end", "\n".join(self.lines) + "\n")
+            self._widget_lines = _text_lines(self.lines)
             self.text_widget.configure(state="disabled")
         except Exception:
             # UI may not be ready; ignore errors
             pass
+        if not self._pending.empty():
+            self._schedule_poll()
 
     def clear(self):
-        """Clear stored lines and attached text widget contents."""
-        self.lines = []
+        """Clear stored lines and attached text widget contents (main thread only)."""
+        self._take_pending()
+        self.lines.clear()
+        self._truncate_spill()
         if self.text_widget:
             try:
+                self._widget_lines = 0
                 self.text_widget.configure(state="normal")
                 self.text_widget.delete("1.0", "end")
                 self.text_widget.configure(state="disabled")
@@ -39,17 +85,122 @@ class Logger:
                 pass
 
     def log(self, text: str):
-        """Add a timestamped line to the log store and update UI when attached."""
-        line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {text}"
-        self.lines.append(line)
+        """Queue a timestamped line; safe to call from any thread."""
+        self._pending.put(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {text}")
+        self._schedule_poll()
+
+    def flush(self):
+        """Move queued lines into the store and the attached widget now (main thread only)."""
+        self._drain()
+
+    def get_lines(self):
+        """Return the whole session as a list; prefer iter_lines() for exports."""
+        return list(self.iter_lines())
+
+    def iter_lines(self):
+        """Yield every line of the session, spilled ones first (main thread only)."""
+        self._drain()
+        memory = list(self.lines)
+        if self.spilled and self.spill_path:
+            try:
+                with open(self.spill_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        yield line.rstrip("\n")
+            except OSError:
+                pass
+        yield from memory
+
+    def line_count(self):
+        """Return the number of text lines in the session (memory plus spilled)."""
+        self._drain()
+        return self.spilled + _text_lines(self.lines)
+
+    # ----- main-thread side -----
+    def _take_pending(self):
+        batch = []
+        try:
+            while True:
+                batch.append(self._pending.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _drain(self):
+        batch = self._take_pending()
+        if not batch:
+            return
+        overflow = len(self.lines) + len(batch) - self.max_lines
+        if overflow > 0:
+            # Oldest lines leave the ring: the head of the ring, then (for
+            # huge batches) the head of the batch itself
+            evicted = list(islice(self.lines, min(overflow, len(self.lines))))
+            evicted.extend(batch[:max(0, overflow - len(evicted))])
+            self._spill(evicted)
+        self.lines.extend(batch)
         if self.text_widget:
             try:
+                shown = batch[-self.max_lines:]
                 self.text_widget.configure(state="normal")
-                self.text_widget.insert("end", line + "\n")
+                self.text_widget.insert("end", "\n".join(shown) + "\n")
+                self._widget_lines += _text_lines(shown)
+                excess = self._widget_lines - self.max_lines
+                if excess > 0:
+                    self.text_widget.delete("1.0", f"{excess + 1}.0")
+                    self._widget_lines -= excess
                 self.text_widget.see("end")
                 self.text_widget.configure(state="disabled")
             except Exception:
                 pass
 
-    def get_lines(self):
-        return list(self.lines)
+    # ----- spill file -----
+    def _rotate_spill(self):
+        """Keep the previous sessions' spill files as .1 ... .SPILL_BACKUPS."""
+        try:
+            for n in range(SPILL_BACKUPS, 0, -1):
+                older = f"{self.spill_path}.{n}"
+                newer = self.spill_path if n == 1 else f"{self.spill_path}.{n - 1}"
+                if os.path.exists(newer):
+                    os.replace(newer, older)
+        except OSError:
+            pass
+
+    def _spill(self, lines):
+        if not self.spill_path or not lines:
+            return
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self.spilled += _text_lines(lines)
+        except OSError:
+            pass
+
+    def _truncate_spill(self):
+        self.spilled = 0
+        if self.spill_path:
+            try:
+                open(self.spill_path, "w", encoding="utf-8").close()
+            except OSError:
+                pass
+
+    def _schedule_poll(self):
+        """Arm one flush of the attached widget unless one is already pending."""
+        widget = self.text_widget
+        if widget is None:
+            return
+        with self._poll_lock:
+            if self._poll_armed:
+                return
+            self._poll_armed = True
+        try:
+            # Like the workers' root.after(0, ...) calls, Tk runs the flush on the main thread.
+            # Called outside the lock: from a worker, after() waits for the main thread.
+            widget.after(FLUSH_INTERVAL_MS, self._poll)
+        except Exception:
+            with self._poll_lock:
+                self._poll_armed = False
+
+    def _poll(self):
+        with self._poll_lock:
+            # Cleared before draining: a line queued from now on arms a new flush
+            self._poll_armed = False
+        self._drain()
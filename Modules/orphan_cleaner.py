@@ -20,10 +20,12 @@ Functions:
     iter_savedvariables_dirs: Yield all SavedVariables directories
     scan_orphans: Find orphaned SavedVariables files
     delete_orphans: Delete or move orphaned files
+    parse_addons_txt_line: Parse one AddOns.txt line into (name, state)
+    read_addons_txt: Read a character's AddOns.txt entries
+    iter_character_dirs: Yield all character directories
     rebuild_addons_txt: Rebuild AddOns.txt files to match installed addons
 """
 import os
-from Modules import localization
 from send2trash import send2trash
 
 def savedvar_basename(filename):
@@ -85,13 +87,14 @@ def collect_addon_names(addons_dir):
 
 def iter_savedvariables_dirs(account_root):
     """
-    Yield every SavedVariables directory within an account.
+    Yield every SavedVariables directory within WTF/Account.
     
     SavedVariables can exist at multiple levels:
-    - Account level: WTF/Account/SavedVariables
-    - Realm level: WTF/Account/REALM/SavedVariables
-    - Character level: WTF/Account/REALM/CHARACTER/SavedVariables
+    - Account level: WTF/Account/ACCOUNT/SavedVariables
+    - Realm level: WTF/Account/ACCOUNT/REALM/SavedVariables
+    - Character level: WTF/Account/ACCOUNT/REALM/CHARACTER/SavedVariables
     
+    A stray WTF/Account/SavedVariables folder is yielded as well.
     This function yields all of them so we can scan for orphans at all levels.
     
     Args:
@@ -103,42 +106,43 @@ def iter_savedvariables_dirs(account_root):
     if not os.path.isdir(account_root):
         return
 
+    def _subdirs(path):
+        """Return child directories of `path`, skipping SavedVariables folders."""
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.name.upper() != "SAVEDVARIABLES"
+                ]
+        except (OSError, PermissionError):
+            return []
+
     # Account root-level SavedVariables
     root_sv = os.path.join(account_root, "SavedVariables")
     if os.path.isdir(root_sv):
         yield root_sv
 
-    # Realms and characters nested under account
-    try:
-        with os.scandir(account_root) as realm_entries:
-            for realm_entry in realm_entries:
-                # Skip if not a directory or if it's a SavedVariables folder (not a realm)
-                if not realm_entry.is_dir(follow_symlinks=False) or realm_entry.name.upper() == "SAVEDVARIABLES":
-                    continue
-
-                realm_path = realm_entry.path
-                # Realm-level SavedVariables
-                realm_sv = os.path.join(realm_path, "SavedVariables")
-                if os.path.isdir(realm_sv):
-                    yield realm_sv
-
-                # Character-level SavedVariables (one per character on this realm)
-                try:
-                    with os.scandir(realm_path) as char_entries:
-                        for char_entry in char_entries:
-                            # Skip if not a directory or if it's a SavedVariables folder (not a character)
-                            if not char_entry.is_dir(follow_symlinks=False) or char_entry.name.upper() == "SAVEDVARIABLES":
-                                continue
-
-                            char_sv = os.path.join(char_entry.path, "SavedVariables")
-                            if os.path.isdir(char_sv):
-                                yield char_sv
-                except (OSError, PermissionError):
-                    continue
-    except (OSError, PermissionError):
-        pass
-
-def scan_orphans(versions, logger=None):
+    for account_path in _subdirs(account_root):
+        # Account-level SavedVariables
+        account_sv = os.path.join(account_path, "SavedVariables")
+        if os.path.isdir(account_sv):
+            yield account_sv
+
+        for realm_path in _subdirs(account_path):
+            # Realm-level SavedVariables
+            realm_sv = os.path.join(realm_path, "SavedVariables")
+            if os.path.isdir(realm_sv):
+                yield realm_sv
+
+            # Character-level SavedVariables (one per character on this realm)
+            for char_path in _subdirs(realm_path):
+                char_sv = os.path.join(char_path, "SavedVariables")
+                if os.path.isdir(char_sv):
+                    yield char_sv
+
+def scan_orphans(versions, logger=None, sv_mtimes=None):
     """
     Scan for orphaned SavedVariables across many WoW versions.
     
@@ -154,6 +158,9 @@ def scan_orphans(versions, logger=None):
         versions: Iterable of (version_path, version_label) tuples
                   Each represents a WoW installation (Retail, Classic, etc.)
         logger: Optional object with .debug() and .info() methods for logging
+        sv_mtimes: Optional dict filled in the same pass with
+                   version_label -> {addon_name_casefolded: newest SavedVariables mtime}
+                   for every non-Blizzard addon that has SavedVariables
     
     Returns:
         dict: Mapping of version_label -> list of absolute paths to orphaned SavedVariables files
@@ -174,6 +181,7 @@ def scan_orphans(versions, logger=None):
             continue
 
         version_orphans = []
+        version_mtimes = sv_mtimes.setdefault(vlabel, {}) if sv_mtimes is not None else None
 
         # Scan every SavedVariables directory at all levels
         for sv_dir in iter_savedvariables_dirs(account_root):
@@ -201,13 +209,23 @@ def scan_orphans(versions, logger=None):
 
                         # Normalize filename to addon name for comparison
                         base = savedvar_basename(fname).casefold()
+
+                        # Track when any account/character last wrote this addon's data
+                        if version_mtimes is not None and not lf.startswith("blizzard_"):
+                            try:
+                                mtime = entry.stat(follow_symlinks=False).st_mtime
+                            except OSError:
+                                mtime = 0
+                            if mtime > version_mtimes.get(base, 0):
+                                version_mtimes[base] = mtime
+
                         # If this addon is not installed, it's orphaned
                         if base not in installed:
                             version_orphans.append(entry.path)
                             total += 1
                             if logger:
                                 logger.debug(
-                                    localization._("orphan_found_in").format(vlabel, entry.path)
+                                    "orphan_found_in", vlabel, entry.path
                                 )
 
             except (OSError, IOError):
@@ -219,7 +237,7 @@ def scan_orphans(versions, logger=None):
             results[vlabel] = version_orphans
 
     if logger:
-        logger.info(localization._("orphan_total_found").format(total))
+        logger.info("orphan_total_found", total)
 
     return results
 
@@ -254,18 +272,18 @@ def delete_orphans(paths, use_trash=False, logger=None):
                 send2trash(fp)
                 used_trash = True
                 if logger:
-                    logger.info(localization._("orphan_moved_trash").format(fp))
+                    logger.info("orphan_moved_trash", fp)
             else:
                 # Permanently delete file
                 os.remove(fp)
                 if logger:
-                    logger.info(localization._("orphan_deleted").format(fp))
+                    logger.info("orphan_deleted", fp)
             processed += 1
 
         except (OSError, IOError) as e:
             # Log error but continue with next file
             if logger:
-                logger.error(localization._("orphan_error_deleting").format(fp, e))
+                logger.error("orphan_error_deleting", fp, e)
 
     permanently_deleted = not use_trash
     return processed, permanently_deleted, used_trash
@@ -275,6 +293,99 @@ def delete_orphans(paths, use_trash=False, logger=None):
 # ============================================================
 # Functions for rebuilding AddOns.txt files to match installed addons
 
+def parse_addons_txt_line(line):
+    """
+    Parse an AddOns.txt line into (name, state).
+
+    Lines look like "AddonName: enabled" or "AddonName: disabled". Lines
+    without a state, or with an unknown state, are treated as enabled, which
+    is what the game client does.
+
+    Args:
+        line: A single line from AddOns.txt
+
+    Returns:
+        tuple: (addon_name, "enabled" | "disabled")
+    """
+    parts = line.split(":", 1)
+    if len(parts) != 2:
+        return line.strip(), "enabled"
+    name = parts[0].strip()
+    state = parts[1].strip().lower()
+    return name, (state if state in ("enabled", "disabled") else "enabled")
+
+def read_addons_txt(path):
+    """
+    Read a character's AddOns.txt into a list of (name, state) entries.
+
+    Blank lines are skipped. A missing or unreadable file yields an empty list.
+
+    Args:
+        path: Absolute path to an AddOns.txt file
+
+    Returns:
+        list: (addon_name, state) tuples in file order
+    """
+    if not os.path.isfile(path):
+        return []
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return [
+                parse_addons_txt_line(raw)
+                for raw in f.read().splitlines()
+                if raw.strip()
+            ]
+    except (OSError, IOError):
+        return []
+
+def iter_character_dirs(account_root):
+    """
+    Yield every character directory within WTF/Account.
+
+    Characters live at WTF/Account/ACCOUNT/REALM/CHARACTER. SavedVariables
+    folders at the account and realm levels are skipped.
+
+    Args:
+        account_root: Path to WTF/Account directory
+
+    Yields:
+        str: Absolute paths to character directories
+    """
+    try:
+        with os.scandir(account_root) as account_entries:
+            account_paths = [
+                entry.path
+                for entry in account_entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+    except (OSError, PermissionError):
+        return
+
+    for account_path in account_paths:
+        try:
+            with os.scandir(account_path) as realm_entries:
+                realm_paths = [
+                    entry.path
+                    for entry in realm_entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.name.upper() != "SAVEDVARIABLES"
+                ]
+        except (OSError, PermissionError):
+            continue
+
+        for realm_path in realm_paths:
+            try:
+                with os.scandir(realm_path) as char_entries:
+                    char_paths = [
+                        entry.path
+                        for entry in char_entries
+                        if entry.is_dir(follow_symlinks=False)
+                        and entry.name.upper() != "SAVEDVARIABLES"
+                    ]
+            except (OSError, PermissionError):
+                continue
+            yield from char_paths
+
 def rebuild_addons_txt(version_root, installed_addons, logger=None):
     """
     Rebuild every AddOns.txt file under WTF/Account/... for the given version.
@@ -327,102 +438,61 @@ def rebuild_addons_txt(version_root, installed_addons, logger=None):
     # (preserves the original case from folder names)
     dir_by_cf = {d.casefold(): d for d in dir_listing if not d.lower().startswith("blizzard_")}
 
-    def parse_line(line):
-        """Parse an AddOns.txt line into (name, state)."""
-        parts = line.split(":", 1)
-        if len(parts) != 2:
-            return line.strip(), "enabled"
-        name = parts[0].strip()
-        state = parts[1].strip().lower()
-        return name, ("enabled" if state in ("enabled", "disabled") else "enabled")
-
     try:
-        with os.scandir(account_root) as account_entries:
-            for account_entry in account_entries:
-                if not account_entry.is_dir(follow_symlinks=False):
-                    continue
-                account_path = account_entry.path
-
-                with os.scandir(account_path) as realm_entries:
-                    for realm_entry in realm_entries:
-                        if not realm_entry.is_dir(follow_symlinks=False) or realm_entry.name.upper() == "SAVEDVARIABLES":
-                            continue
-                        realm_path = realm_entry.path
-
-                        with os.scandir(realm_path) as char_entries:
-                            for char_entry in char_entries:
-                                if (
-                                    not char_entry.is_dir(follow_symlinks=False)
-                                    or char_entry.name.upper() == "SAVEDVARIABLES"
-                                ):
-                                    continue
-                                char_path = char_entry.path
-
-                    addons_txt = os.path.join(char_path, "AddOns.txt")
-
-                    prev_states = {}
-                    prev_blizzard = {}
-
-                    # Load existing AddOns.txt
-                    if os.path.isfile(addons_txt):
-                        try:
-                            with open(
-                                addons_txt, "r", encoding="utf-8", errors="ignore"
-                            ) as f:
-                                for raw in f.read().splitlines():
-                                    if not raw.strip():
-                                        continue
-                                    name, state = parse_line(raw)
-                                    cf = name.casefold()
-                                    if name.lower().startswith("blizzard_"):
-                                        prev_blizzard[cf] = (name, state)
-                                    else:
-                                        prev_states[cf] = (name, state)
-
-                        except (OSError, IOError):
-                            prev_states = {}
-                            prev_blizzard = {}
-
-                    # Build new entries
-                    entries = {}
-
-                    # Installed addons
-                    for addon_cf in installed_addons:
-                        display_name = dir_by_cf.get(addon_cf, addon_cf)
-                        state = prev_states.get(addon_cf, (display_name, "enabled"))[1]
-                        entries[addon_cf] = (display_name, state)
-
-                    # Blizzard addons preserved
-                    entries.update(prev_blizzard)
-
-                    # Removed addons
-                    removed = [
-                        cf for cf in prev_states.keys() if cf not in installed_addons
-                    ]
+        for char_path in iter_character_dirs(account_root):
+            addons_txt = os.path.join(char_path, "AddOns.txt")
+
+            prev_states = {}
+            prev_blizzard = {}
+
+            # Load existing AddOns.txt
+            for name, state in read_addons_txt(addons_txt):
+                cf = name.casefold()
+                if name.lower().startswith("blizzard_"):
+                    prev_blizzard[cf] = (name, state)
+                else:
+                    prev_states[cf] = (name, state)
+
+            # Build new entries
+            entries = {}
+
+            # Installed addons
+            for addon_cf in installed_addons:
+                display_name = dir_by_cf.get(addon_cf, addon_cf)
+                state = prev_states.get(addon_cf, (display_name, "enabled"))[1]
+                entries[addon_cf] = (display_name, state)
+
+            # Blizzard addons preserved
+            entries.update(prev_blizzard)
+
+            # Removed addons
+            removed = [
+                cf for cf in prev_states.keys() if cf not in installed_addons
+            ]
 
-                    written = [
-                        f"{disp}: {state}" for _, (disp, state) in entries.items()
-                    ]
+            written = [
+                f"{disp}: {state}" for _, (disp, state) in entries.items()
+            ]
 
-                    # Write file
-                    try:
-                        with open(addons_txt, "w", encoding="utf-8") as f:
-                            f.write("\n".join(written))
+            # Write file
+            try:
+                with open(addons_txt, "w", encoding="utf-8") as f:
+                    f.write("\n".join(written))
 
-                        rebuilt_map[addons_txt] = written
-                        removed_map[addons_txt] = removed
+                rebuilt_map[addons_txt] = written
+                removed_map[addons_txt] = removed
 
-                        if logger:
-                            logger.info(localization._("orphan_rebuilt_addons").format(addons_txt))
+                if logger:
+                    logger.info("orphan_rebuilt_addons", addons_txt)
 
-                    except (OSError, IOError) as e:
-                        if logger:
-                            logger.error(
-                                localization._("orphan_error_writing_addons").format(addons_txt, e)
-                            )
+            except (OSError, IOError) as e:
+                if logger:
+                    logger.error(
+                        "orphan_error_writing_addons", addons_txt, e
+                    )
 
     except (OSError, IOError) as e:
         if logger:
-            logger.error(localization._("orphan_error_rebuild").format(e))
+            logger.error("orphan_error_rebuild", e)
 
     return rebuilt_map, removed_map
@@ -74,11 +74,72 @@ def select_wow_folder(app):
     refresh_folder_cleaner_tabs(app)
 
 def refresh_folder_cleaner_tabs(app):
-    """Rebuild Folder Cleaner tabs to reflect a new WoW path.
+    """Update Folder Cleaner tabs to reflect a new WoW path.
+    
+    Version tabs are diffed against the versions found under the new path:
+    tabs of versions that disappeared are removed, new versions get a tab at
+    their position, and tabs that still point at the same folder are only
+    synchronized. The whole notebook is rebuilt only when there is none yet
+    (e.g. the tab was showing the "select a valid folder" message).
     
     Args:
         app: The WoWCleanupTool instance
     """
+    from Modules import ui_refresh
+    from tkinter import ttk
+
+    base = app.wow_path_var.get().strip()
+    notebook = getattr(app, "version_notebook", None)
+    try:
+        usable = bool(base) and notebook is not None and notebook.winfo_exists() and bool(app.version_tabs)
+    except Exception:
+        usable = False
+    versions = app._enumerate_versions(base) if usable and os.path.isdir(base) else []
+    if not versions:
+        _rebuild_folder_cleaner_tab(app)
+        return
+
+    wanted = {vlabel: vpath for vpath, vlabel in versions}
+    frames = {
+        vlabel: notebook.nametowidget(tab_id)
+        for (vlabel, _vpath, _widgets), tab_id in zip(app.version_tabs, notebook.tabs())
+    }
+    kept = []
+    for vlabel, vpath, widgets in app.version_tabs:
+        frame = frames.get(vlabel)
+        if wanted.get(vlabel) != vpath:
+            # Version gone, or now living in a different folder: drop its tab
+            if frame is not None:
+                try:
+                    notebook.forget(frame)
+                    frame.destroy()
+                except Exception:
+                    pass
+            continue
+        kept.append((vlabel, vpath, widgets))
+    app.version_tabs = kept
+
+    existing = {vlabel for vlabel, _vpath, _widgets in kept}
+    for index, (vpath, vlabel) in enumerate(versions):
+        if vlabel in existing:
+            continue
+        frame = ttk.Frame(notebook)
+        notebook.insert(index if index < len(notebook.tabs()) else "end", frame, text=vlabel)
+        before = len(app.version_tabs)
+        widgets = app._build_single_version_tab(frame, vpath, vlabel)
+        if len(app.version_tabs) == before:
+            app.version_tabs.insert(index, (vlabel, vpath, widgets or {}))
+        else:
+            # The builder registered the tab itself; move it to its notebook position
+            app.version_tabs.insert(index, app.version_tabs.pop())
+
+    for vlabel, vpath, widgets in list(app.version_tabs):
+        if vlabel in existing:
+            if not ui_refresh.sync_folder_cleaner_version(app, vpath, widgets):
+                app.refresh_folder_cleaner_version(vlabel)
+
+def _rebuild_folder_cleaner_tab(app):
+    """Rebuild the whole Folder Cleaner tab from scratch."""
     try:
         app.version_notebook.destroy()
     except Exception:
@@ -87,4 +148,5 @@ def refresh_folder_cleaner_tabs(app):
     for w in container.winfo_children():
         try: w.destroy()
         except Exception: pass
+    app.version_tabs = []
     app.build_folder_cleaner_tab(container)
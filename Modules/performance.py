@@ -5,6 +5,7 @@ Provides caching, memoization, and other performance enhancements.
 """
 
 import functools
+import heapq
 import os
 import time
 from typing import Any, Callable
@@ -104,7 +105,7 @@ def delete_files_batch(paths, use_trash=False, logger=None, module_name="FileOps
                 send2trash(fp)
                 used_trash = True
                 if logger:
-                    logger.info(localization._("perf_moved_trash").format(module_name, fp))
+                    logger.info("perf_moved_trash", module_name, fp)
             else:
                 # Permanently delete file or folder
                 if os.path.isfile(fp):
@@ -113,12 +114,91 @@ def delete_files_batch(paths, use_trash=False, logger=None, module_name="FileOps
                     import shutil
                     shutil.rmtree(fp)
                 if logger:
-                    logger.info(localization._("perf_deleted").format(module_name, fp))
+                    logger.info("perf_deleted", module_name, fp)
             processed += 1
         except (OSError, IOError) as e:
             # Log error but continue with next item
             if logger:
-                logger.error(localization._("perf_error_deleting").format(module_name, fp, e))
+                logger.error("perf_error_deleting", module_name, fp, e)
     
     permanently_deleted = not use_trash
     return processed, permanently_deleted, used_trash
+
+# Folders the client expects to exist; never removed even when empty
+PROTECTED_DIR_NAMES = frozenset({"wtf", "interface", "addons"})
+# OS clutter that does not make a folder "used"
+JUNK_FILE_NAMES = frozenset({".ds_store", "thumbs.db", "desktop.ini"})
+
+def _remove_empty_dir(path):
+    """Remove `path` if it is empty (ignoring OS clutter files). Returns True on success."""
+    try:
+        os.rmdir(path)
+        return True
+    except OSError:
+        pass
+    # Not empty: only worth a listing when the folder might hold nothing but clutter
+    try:
+        with os.scandir(path) as entries:
+            junk = []
+            for entry in entries:
+                if entry.name.lower() not in JUNK_FILE_NAMES or not entry.is_file(follow_symlinks=False):
+                    return False
+                junk.append(entry.path)
+        for fp in junk:
+            os.remove(fp)
+        os.rmdir(path)
+        return True
+    except OSError:
+        return False
+
+def sweep_empty_dirs(deleted_paths, roots, logger=None, module_name="FileOps"):
+    """Remove directories left empty by a deletion, bottom-up.
+    
+    Only the parents of the deleted paths (and, as they empty out, their
+    ancestors) are visited, deepest first, so the sweep costs one rmdir per
+    touched folder instead of a walk of the whole install. os.rmdir itself
+    is the emptiness test. The sweep never removes a root, anything outside
+    the roots, or a protected folder (WTF, Interface, AddOns).
+    
+    Args:
+        deleted_paths: Iterable of paths that were just deleted
+        roots: Iterable of folders the sweep must stay inside (e.g. version roots)
+        logger: Optional object with .info() method
+        module_name: Name for log messages
+        
+    Returns:
+        list: The removed directories, deepest first
+    """
+    root_set = {os.path.normcase(os.path.abspath(r)) for r in roots}
+
+    def inside_root(path):
+        parent = os.path.dirname(path)
+        while parent != path:
+            if os.path.normcase(parent) in root_set:
+                return True
+            path, parent = parent, os.path.dirname(parent)
+        return False
+
+    # Max-heap on depth, so a parent is only tried after all its touched children
+    pending = [
+        (-d.count(os.sep), d)
+        for d in {os.path.dirname(os.path.abspath(p)) for p in deleted_paths}
+    ]
+    heapq.heapify(pending)
+    removed = []
+    checked = set()
+    while pending:
+        _depth, current = heapq.heappop(pending)
+        key = os.path.normcase(current)
+        if key in checked or key in root_set:
+            continue
+        checked.add(key)
+        if os.path.basename(current).lower() in PROTECTED_DIR_NAMES or not inside_root(current):
+            continue
+        if _remove_empty_dir(current):
+            removed.append(current)
+            if logger:
+                logger.info("perf_removed_empty_dir", module_name, current)
+            parent = os.path.dirname(current)
+            heapq.heappush(pending, (-parent.count(os.sep), parent))
+    return removed
@@ -0,0 +1,212 @@
+"""
+Incremental filtering of File and Orphan Cleaner results.
+
+A filter is a line of whitespace-separated terms, all of which must match:
+- plain text:       substring of the file name (case-insensitive)
+- * ? [..]:         glob on the file name, e.g. "*Bagnon*.lua"
+- ext:lua,bak:      file extension(s)
+- v:retail:         version label contains the text ("version:" also works)
+- size:>1MB, size:<10KB, size:10KB-2MB:  size range (B, KB, MB, GB; 1024-based)
+
+ResultIndex answers substring terms through a trigram index built once per
+ResultStore: each lowercase name is split into 3-character grams, and a
+term's candidates are the intersection of its grams' posting lists. Only
+those candidates are compared with the term. A filter that narrows the
+previous one (the user typing more characters) is evaluated against the
+previous result instead of the whole store.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    FilterQuery: Parsed filter (terms, globs, extensions, versions, size range)
+    ResultIndex: Trigram name index over a ResultStore
+
+Functions:
+    parse_filter: Parse filter text into a FilterQuery
+    parse_size: Parse "10KB"-style sizes into bytes
+"""
+import os
+import re
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from fnmatch import fnmatchcase
+
+FilterQuery = namedtuple("FilterQuery", "terms globs extensions versions min_size max_size")
+FilterQuery.__doc__ = """Parsed result filter; every non-empty part must match."""
+
+_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2, "G": 1024 ** 3, "GB": 1024 ** 3}
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*$", re.IGNORECASE)
+_GLOB_CHARS = set("*?[")
+
+def parse_size(text):
+    """Parse a size such as "512", "10KB" or "1.5 MB" into bytes.
+
+    Returns:
+        int or None: Size in bytes, or None if the text is not a size
+    """
+    match = _SIZE_RE.match(text or "")
+    if not match:
+        return None
+    return int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+
+def _parse_size_range(text):
+    """Return (min_size, max_size) for ">1MB", "<10KB", ">=1MB", "1KB-2MB" or "5MB"."""
+    text = text.strip()
+    for prefix in (">=", "<=", ">", "<"):
+        if text.startswith(prefix):
+            size = parse_size(text[len(prefix):])
+            if size is None:
+                return None
+            return (size, None) if prefix[0] == ">" else (None, size)
+    if "-" in text:
+        low, _sep, high = text.partition("-")
+        low, high = parse_size(low), parse_size(high)
+        if low is None or high is None:
+            return None
+        return low, high
+    size = parse_size(text)
+    return None if size is None else (size, None)
+
+def parse_filter(text):
+    """Parse filter text into a FilterQuery.
+
+    Unrecognized "key:value" terms and unparsable sizes are treated as
+    plain text, so a half-typed term never hides everything.
+    """
+    terms, globs, extensions, versions = [], [], [], []
+    min_size = max_size = None
+    for token in (text or "").lower().split():
+        key, sep, value = token.partition(":")
+        if sep and value and key in ("ext", "v", "version", "size"):
+            if key == "ext":
+                extensions.extend("." + e.lstrip(".") for e in value.split(",") if e.strip("."))
+                continue
+            if key in ("v", "version"):
+                versions.append(value)
+                continue
+            size_range = _parse_size_range(value)
+            if size_range is not None:
+                low, high = size_range
+                if low is not None:
+                    min_size = low if min_size is None else max(min_size, low)
+                if high is not None:
+                    max_size = high if max_size is None else min(max_size, high)
+                continue
+        if _GLOB_CHARS.intersection(token):
+            globs.append(token)
+        else:
+            terms.append(token)
+    return FilterQuery(tuple(terms), tuple(globs), tuple(extensions), tuple(versions), min_size, max_size)
+
+def _grams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _narrows(old, new):
+    """Return True if every result of `new` is also a result of `old`."""
+    return (
+        old.globs == new.globs
+        and old.extensions == new.extensions
+        and old.versions == new.versions
+        and old.min_size == new.min_size
+        and old.max_size == new.max_size
+        and all(any(o in n for n in new.terms) for o in old.terms)
+    )
+
+class ResultIndex:
+    """
+    Trigram name index over a ResultStore.
+
+    Args:
+        store: ResultStore to index (the index is built on construction)
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.names = [os.path.basename(p).lower() for p in store.paths]
+        self._grams = {}
+        for ordinal, name in enumerate(self.names):
+            for gram in _grams(name):
+                postings = self._grams.get(gram)
+                if postings is None:
+                    postings = self._grams[gram] = array("i")
+                postings.append(ordinal)
+        self._last = None  # (query, matching ordinals)
+
+    @classmethod
+    def for_store(cls, store):
+        """Return the index of `store`, building and caching it on first use."""
+        if store.search_index is None:
+            store.search_index = cls(store)
+        return store.search_index
+
+    def _candidates(self, term):
+        """Return the ordinals whose names may contain `term` (all of them for short terms)."""
+        grams = _grams(term)
+        if not grams:
+            return None
+        postings = sorted((self._grams.get(g, ()) for g in grams), key=len)
+        if not postings[0]:
+            return []
+        result = set(postings[0])
+        for other in postings[1:]:
+            result.intersection_update(other)
+            if not result:
+                break
+        return sorted(result)
+
+    def search(self, query):
+        """Return the ordinals matching `query`, in store order.
+
+        Args:
+            query: FilterQuery (see parse_filter)
+
+        Returns:
+            list: Matching result ordinals
+        """
+        store = self.store
+        names = self.names
+        if self._last is not None and _narrows(self._last[0], query):
+            ordinals = self._last[1]
+        else:
+            ordinals = None
+            if query.versions:
+                groups = [
+                    g for g, label in enumerate(store.labels)
+                    if all(v in label.lower() for v in query.versions)
+                ]
+                ordinals = [o for g in groups for o in store.group_range(g)]
+            for term in sorted(query.terms, key=len, reverse=True):
+                candidates = self._candidates(term)
+                if candidates is not None:
+                    if ordinals is not None:
+                        allowed = set(ordinals)
+                        candidates = [o for o in candidates if o in allowed]
+                    ordinals = candidates
+                    break
+            if ordinals is None:
+                ordinals = range(len(names))
+
+        terms, globs, extensions = query.terms, query.globs, query.extensions
+        min_size, max_size, sizes = query.min_size, query.max_size, store.sizes
+        result = [
+            o for o in ordinals
+            if all(t in names[o] for t in terms)
+            and (not extensions or names[o].endswith(extensions))
+            and all(fnmatchcase(names[o], g) for g in globs)
+            and (min_size is None or sizes[o] >= min_size)
+            and (max_size is None or sizes[o] <= max_size)
+        ]
+        self._last = (query, result)
+        return result
+
+    def group_views(self, ordinals):
+        """Split sorted ordinals into per-group lists, in group order."""
+        store = self.store
+        views = []
+        for group in range(store.group_count()):
+            r = store.group_range(group)
+            start = bisect_left(ordinals, r.start)
+            stop = bisect_left(ordinals, r.stop, start)
+            views.append(ordinals[start:stop])
+        return views
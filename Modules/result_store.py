@@ -0,0 +1,141 @@
+"""
+Backing store for File and Orphan Cleaner results.
+
+Scan results are kept in flat, ordinal-indexed arrays instead of one
+Treeview item (plus dict entries) per file:
+- paths:   list of absolute paths
+- sizes:   array of file sizes
+- selection: SelectionModel over the sizes (one byte per result, with
+  the checked count and byte total kept up to date)
+Results are grouped by WoW version; each group is a contiguous ordinal
+range, so group lookups, counts and totals never scan the whole store.
+
+Views built from the store (the virtual Treeview) only read the rows they
+display. It contains zero Tkinter/UI logic.
+
+Classes:
+    ResultStore: Grouped, ordinal-indexed scan results with check state
+"""
+import os
+from array import array
+from bisect import bisect_right
+from Modules.selection_model import SelectionModel
+
+class ResultStore:
+    """
+    Grouped scan results with per-result check state.
+
+    Args:
+        groups: Optional iterable of (label, paths) pairs, in display order
+        sizes: Optional mapping of path -> size; missing sizes are stat'ed
+    """
+
+    def __init__(self, groups=(), sizes=None):
+        self.paths = []
+        self.sizes = array("q")
+        self.labels = []
+        self._starts = []  # ordinal of the first result of each group
+        self._group_bytes = []
+        self.selection = SelectionModel(self.sizes)
+        self.search_index = None  # ResultIndex, built on first filter (see result_filter)
+        for label, paths in groups:
+            self.add_group(label, paths, sizes)
+
+    @classmethod
+    def from_results(cls, versions, results):
+        """Build a store from a {version_label: [paths]} mapping in version order.
+
+        Args:
+            versions: Iterable of (version_path, version_label) tuples
+            results: Mapping of version_label -> list of paths
+
+        Returns:
+            ResultStore: Store with one group per version that has results
+        """
+        return cls((vlabel, results[vlabel]) for _vpath, vlabel in versions if results.get(vlabel))
+
+    def add_group(self, label, paths, sizes=None):
+        """Append a group of results.
+
+        Args:
+            label: Group label (e.g. the version label)
+            paths: Iterable of absolute paths
+            sizes: Optional mapping of path -> size; missing sizes are stat'ed
+
+        Returns:
+            int: Index of the new group
+        """
+        self.labels.append(label)
+        self._starts.append(len(self.paths))
+        total = 0
+        for path in paths:
+            size = sizes.get(path) if sizes else None
+            if size is None:
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    size = 0
+            self.paths.append(path)
+            self.sizes.append(size)
+            total += size
+        self._group_bytes.append(total)
+        self.selection.extend(len(self.paths) - len(self.selection))
+        return len(self.labels) - 1
+
+    # ----- shape -----
+    def __len__(self):
+        return len(self.paths)
+
+    def group_count(self):
+        """Return the number of groups."""
+        return len(self.labels)
+
+    def group_range(self, group):
+        """Return the ordinal range of a group."""
+        start = self._starts[group]
+        end = self._starts[group + 1] if group + 1 < len(self._starts) else len(self.paths)
+        return range(start, end)
+
+    def group_of(self, ordinal):
+        """Return the group index that contains a result ordinal."""
+        return bisect_right(self._starts, ordinal) - 1
+
+    def group_size(self, group):
+        """Return the total size in bytes of a group."""
+        return self._group_bytes[group]
+
+    # ----- check state -----
+    def is_checked(self, ordinal):
+        return self.selection.is_selected(ordinal)
+
+    def set_checked(self, ordinal, state):
+        self.selection.set(ordinal, state)
+
+    def toggle(self, ordinal):
+        """Flip one result and return its new state."""
+        return self.selection.toggle(ordinal)
+
+    def set_group_checked(self, group, state):
+        """Check or uncheck every result of a group."""
+        r = self.group_range(group)
+        self.selection.set_range(r.start, r.stop, state)
+
+    def group_checked(self, group):
+        """Return True if every result of a non-empty group is checked."""
+        r = self.group_range(group)
+        return self.selection.all_selected(r.start, r.stop)
+
+    def set_all(self, state):
+        """Check or uncheck every result."""
+        self.selection.set_all(state)
+
+    def checked_count(self):
+        return self.selection.count()
+
+    def checked_size(self):
+        """Return the total size in bytes of the checked results."""
+        return self.selection.total_bytes()
+
+    def checked_paths(self):
+        """Return the checked paths in store order."""
+        return self.selection.selected(self.paths)
@@ -0,0 +1,181 @@
+"""
+Retention policies for Logs, Errors and Screenshots.
+
+Instead of deleting a whole folder, a policy describes what to keep:
+- max_age_days:    remove files last modified more than N days ago
+- max_total_bytes: cap the folder size, removing the oldest files first
+- keep_newest:     never remove the N most recent files (recent crash logs)
+
+Each folder is read with a single os.scandir pass. The age rule is a linear
+filter, the newest-N guard uses heapq.nlargest, and the size cap pops the
+oldest survivors from a min-heap until the folder fits, so the result is an
+exact deletion set without sorting the whole folder.
+
+It contains zero Tkinter/UI logic.
+
+Functions:
+    normalize_policy: Clamp a policy dict to sane values
+    select_for_retention: Compute the files a policy removes from one folder
+    plan_retention: Evaluate policies for every version
+    apply_retention: Delete or trash the files of a retention plan
+"""
+import os
+import time
+import heapq
+from Modules.performance import delete_files_batch
+from Modules.version_utils import format_size
+
+# Folders with retention support and their default policies (None = rule off)
+DEFAULT_RETENTION_POLICIES = {
+    "Logs": {"enabled": True, "max_age_days": 14, "max_total_bytes": None, "keep_newest": 0},
+    "Errors": {"enabled": True, "max_age_days": 14, "max_total_bytes": None, "keep_newest": 5},
+    "Screenshots": {"enabled": False, "max_age_days": None, "max_total_bytes": 5 * 1024 ** 3, "keep_newest": 0},
+}
+
+def normalize_policy(policy):
+    """
+    Return a copy of a policy with every rule clamped to a valid value.
+
+    Parameters:
+        policy: Dict with optional "enabled", "max_age_days", "max_total_bytes" and "keep_newest"
+
+    Returns:
+        dict: The normalized policy
+    """
+    def positive(value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            return None
+        return value if value > 0 else None
+
+    return {
+        "enabled": bool(policy.get("enabled", True)),
+        "max_age_days": positive(policy.get("max_age_days")),
+        "max_total_bytes": positive(policy.get("max_total_bytes")),
+        "keep_newest": positive(policy.get("keep_newest")) or 0,
+    }
+
+def select_for_retention(folder, policy, now=None):
+    """
+    Compute the files a retention policy removes from one folder.
+
+    Only regular files directly inside the folder are considered.
+
+    Parameters:
+        folder: Path to the folder (e.g., <version>/Logs)
+        policy: Retention policy dict (see normalize_policy)
+        now: Optional reference timestamp (defaults to time.time())
+
+    Returns:
+        tuple: (to_delete, freed_bytes, kept_count) where to_delete is a list of
+               paths, oldest first
+    """
+    policy = normalize_policy(policy)
+    now = time.time() if now is None else now
+
+    files = []  # (mtime, size, path)
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        files.append((st.st_mtime, st.st_size, entry.path))
+                except (OSError, PermissionError):
+                    continue
+    except (OSError, PermissionError):
+        return [], 0, 0
+
+    protected = set()
+    if policy["keep_newest"]:
+        protected = {f[2] for f in heapq.nlargest(policy["keep_newest"], files)}
+
+    doomed = []
+    survivors = []
+    if policy["max_age_days"]:
+        cutoff = now - policy["max_age_days"] * 24 * 60 * 60
+        for f in files:
+            if f[0] < cutoff and f[2] not in protected:
+                doomed.append(f)
+            else:
+                survivors.append(f)
+    else:
+        survivors = files
+
+    cap = policy["max_total_bytes"]
+    if cap:
+        total = sum(f[1] for f in survivors)
+        if total > cap:
+            heapq.heapify(survivors)
+            kept_protected = []
+            while survivors and total > cap:
+                f = heapq.heappop(survivors)
+                if f[2] in protected:
+                    kept_protected.append(f)
+                    continue
+                doomed.append(f)
+                total -= f[1]
+            survivors.extend(kept_protected)
+
+    doomed.sort()
+    return [f[2] for f in doomed], sum(f[1] for f in doomed), len(survivors)
+
+def plan_retention(versions, policies, now=None, logger=None):
+    """
+    Evaluate retention policies for every version.
+
+    Parameters:
+        versions: Iterable of (version_path, version_label) tuples
+        policies: Mapping of folder name -> policy dict
+        now: Optional reference timestamp (defaults to time.time())
+        logger: Optional object with .debug() and .info() methods
+
+    Returns:
+        dict: Mapping of version_label -> {folder_name: (paths, freed_bytes, kept_count)};
+              only folders with something to remove are included
+    """
+    plan = {}
+    total_files = 0
+    total_bytes = 0
+    for vpath, vlabel in versions:
+        for folder_name, policy in policies.items():
+            policy = normalize_policy(policy)
+            if not policy["enabled"]:
+                continue
+            folder = os.path.join(vpath, folder_name)
+            if not os.path.isdir(folder):
+                continue
+            paths, freed, kept = select_for_retention(folder, policy, now=now)
+            if not paths:
+                continue
+            plan.setdefault(vlabel, {})[folder_name] = (paths, freed, kept)
+            total_files += len(paths)
+            total_bytes += freed
+            if logger:
+                logger.debug("retention_folder_plan", vlabel, folder_name, len(paths), format_size(freed), kept)
+    if logger:
+        logger.info("retention_total_plan", total_files, format_size(total_bytes))
+    return plan
+
+def apply_retention(plan, use_trash=False, logger=None):
+    """
+    Delete or trash every file of a retention plan.
+
+    Parameters:
+        plan: Result of plan_retention()
+        use_trash: If True, move files to the recycle bin
+        logger: Optional object with .info() and .error() methods
+
+    Returns:
+        tuple: (processed_count, freed_bytes) - freed bytes assume every file was removed
+    """
+    paths = [
+        path
+        for folders in plan.values()
+        for folder_paths, _freed, _kept in folders.values()
+        for path in folder_paths
+    ]
+    processed, _permanent, _trash = delete_files_batch(paths, use_trash, logger, "Retention")
+    freed = sum(freed for folders in plan.values() for _paths, freed, _kept in folders.values())
+    return processed, freed
@@ -0,0 +1,217 @@
+"""
+Retention policy dialog for WoW Cleanup Tool.
+
+Lets the user set age, size-cap and keep-newest rules for the Logs, Errors
+and Screenshots folders, preview exactly which files each version would
+lose, and apply the plan.
+
+Functions:
+    load_retention_policies: Return the saved policies merged over the defaults
+    open_retention_dialog: Show the retention policy dialog
+"""
+
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+from Modules import localization
+from Modules.game_validation import is_game_version_valid, show_game_validation_warning
+from Modules.retention import DEFAULT_RETENTION_POLICIES, apply_retention, normalize_policy, plan_retention
+from Modules.settings import save_settings
+from Modules.version_utils import format_size
+
+_MB = 1024 * 1024
+
+def load_retention_policies(settings):
+    """Return the saved retention policies merged over the defaults.
+
+    Args:
+        settings: The app settings dict
+
+    Returns:
+        dict: Mapping of folder name -> normalized policy
+    """
+    saved = settings.get("retention_policies") or {}
+    policies = {}
+    for folder, default in DEFAULT_RETENTION_POLICIES.items():
+        policy = dict(default)
+        if isinstance(saved.get(folder), dict):
+            policy.update(saved[folder])
+        policies[folder] = normalize_policy(policy)
+    return policies
+
+def open_retention_dialog(app):
+    """Show the retention policy dialog.
+
+    Args:
+        app: The WoWCleanupTool instance
+    """
+    base = app.wow_path_var.get().strip()
+    if not base or not os.path.isdir(base):
+        messagebox.showerror(localization._("invalid_folder"), localization._("select_valid_wow_first"))
+        return
+    versions = app._enumerate_versions(base)
+    policies = load_retention_policies(app.settings)
+
+    dlg = tk.Toplevel(app.root)
+    dlg.title(localization._("retention_policies"))
+    dlg.transient(app.root)
+    frame = ttk.Frame(dlg, padding=12)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(
+        frame, text=localization._("retention_description"), wraplength=520, justify="left",
+    ).grid(row=0, column=0, columnspan=5, sticky="w", pady=(0, 8))
+
+    headings = ("", "retention_keep_days", "retention_cap_mb", "retention_keep_newest")
+    for col, key in enumerate(headings):
+        if key:
+            ttk.Label(frame, text=localization._(key)).grid(row=1, column=col, sticky="w", padx=(8, 0))
+
+    rows = {}
+    for row, (folder, policy) in enumerate(policies.items(), start=2):
+        enabled = tk.BooleanVar(value=policy["enabled"])
+        days = tk.IntVar(value=policy["max_age_days"] or 0)
+        cap_mb = tk.IntVar(value=(policy["max_total_bytes"] or 0) // _MB)
+        newest = tk.IntVar(value=policy["keep_newest"])
+        ttk.Checkbutton(frame, text=folder, variable=enabled).grid(row=row, column=0, sticky="w")
+        ttk.Spinbox(frame, from_=0, to=3650, width=6, textvariable=days).grid(row=row, column=1, sticky="w", padx=(8, 0))
+        ttk.Spinbox(frame, from_=0, to=1048576, width=8, textvariable=cap_mb).grid(row=row, column=2, sticky="w", padx=(8, 0))
+        ttk.Spinbox(frame, from_=0, to=100000, width=6, textvariable=newest).grid(row=row, column=3, sticky="w", padx=(8, 0))
+        rows[folder] = (enabled, days, cap_mb, newest)
+    next_row = len(rows) + 2
+
+    ttk.Label(frame, text=localization._("retention_zero_off"), foreground="gray").grid(
+        row=next_row, column=0, columnspan=5, sticky="w", pady=(4, 8)
+    )
+
+    tree = ttk.Treeview(frame, columns=("files", "freed", "kept"), show="tree headings", height=8)
+    tree.heading("#0", text=localization._("retention_col_folder"), anchor="w")
+    tree.heading("files", text=localization._("retention_col_files"), anchor="e")
+    tree.heading("freed", text=localization._("retention_col_freed"), anchor="e")
+    tree.heading("kept", text=localization._("retention_col_kept"), anchor="e")
+    tree.column("#0", width=220)
+    for col in ("files", "freed", "kept"):
+        tree.column(col, width=90, anchor="e", stretch=False)
+    tree.grid(row=next_row + 1, column=0, columnspan=5, sticky="nsew")
+    frame.rowconfigure(next_row + 1, weight=1)
+    frame.columnconfigure(4, weight=1)
+
+    status = ttk.Label(frame, text="")
+    status.grid(row=next_row + 2, column=0, columnspan=5, sticky="w", pady=(6, 0))
+
+    buttons = ttk.Frame(frame)
+    buttons.grid(row=next_row + 3, column=0, columnspan=5, sticky="e", pady=(8, 0))
+    preview_btn = ttk.Button(buttons, text=localization._("retention_preview"))
+    apply_btn = ttk.Button(buttons, text=localization._("retention_apply"), state="disabled")
+    preview_btn.pack(side="left", padx=(0, 6))
+    apply_btn.pack(side="left", padx=(0, 6))
+    ttk.Button(buttons, text=localization._("close"), command=dlg.destroy).pack(side="left")
+
+    state = {"plan": None}
+
+    def read_policies():
+        result = {}
+        for folder, (enabled, days, cap_mb, newest) in rows.items():
+            def value(var):
+                try:
+                    return max(int(var.get()), 0)
+                except Exception:
+                    return 0
+            result[folder] = normalize_policy({
+                "enabled": enabled.get(),
+                "max_age_days": value(days),
+                "max_total_bytes": value(cap_mb) * _MB,
+                "keep_newest": value(newest),
+            })
+        app.settings["retention_policies"] = result
+        save_settings(app.settings)
+        return result
+
+    def show_plan(plan):
+        if not dlg.winfo_exists():
+            return  # Closed during the scan
+        for n in tree.get_children(""):
+            tree.delete(n)
+        total_files = 0
+        total_bytes = 0
+        for _vpath, vlabel in versions:
+            folders = plan.get(vlabel)
+            if not folders:
+                continue
+            files = sum(len(p) for p, _f, _k in folders.values())
+            freed = sum(f for _p, f, _k in folders.values())
+            pid = tree.insert("", "end", text=f"  {vlabel}", values=(files, format_size(freed), ""), open=True)
+            for folder, (paths, folder_freed, kept) in folders.items():
+                tree.insert(pid, "end", text=f"  {folder}", values=(len(paths), format_size(folder_freed), kept))
+            total_files += files
+            total_bytes += freed
+        state["plan"] = plan
+        apply_btn.configure(state="normal" if total_files else "disabled")
+        preview_btn.configure(state="normal")
+        status.configure(text=localization._("retention_preview_done").format(total_files, format_size(total_bytes)))
+
+    def preview():
+        current = read_policies()
+        preview_btn.configure(state="disabled")
+        apply_btn.configure(state="disabled")
+        status.configure(text=localization._("scanning"))
+        logger = app.backend_logger()
+
+        def worker():
+            plan = plan_retention(versions, current, logger=logger)
+            try:
+                app.root.after(0, lambda: show_plan(plan))
+            except Exception:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def apply():
+        plan = state["plan"]
+        if not plan:
+            return
+        for vpath, vlabel in versions:
+            if vlabel in plan and not is_game_version_valid(vpath):
+                show_game_validation_warning(app.root)
+                return
+        files = sum(len(p) for folders in plan.values() for p, _f, _k in folders.values())
+        use_trash = app.delete_mode.get() == "trash"
+        action = localization._("move_to_trash") if use_trash else localization._("delete_permanently_action")
+        if not messagebox.askyesno(
+            localization._("confirm"), localization._("confirm_action_files").format(action, files), parent=dlg,
+        ):
+            return
+        preview_btn.configure(state="disabled")
+        apply_btn.configure(state="disabled")
+        status.configure(text=localization._("retention_applying").format(files))
+        logger = app.backend_logger()
+
+        def worker():
+            # Trashing thousands of screenshots must not block the Tk thread
+            processed, freed = apply_retention(plan, use_trash=use_trash, logger=logger)
+
+            def done():
+                summary = localization._("retention_applied").format(processed, format_size(freed))
+                app.log(summary)
+                app._sweep_empty_dirs(
+                    [path for folders in plan.values() for paths, _f, _k in folders.values() for path in paths],
+                    "Retention",
+                )
+                for vlabel in plan:
+                    if hasattr(app, "version_tabs"):
+                        app.refresh_folder_cleaner_version(vlabel)
+                if not dlg.winfo_exists():
+                    return  # Closed while the files were removed
+                messagebox.showinfo(localization._("completed"), summary, parent=dlg)
+                preview()
+
+            try:
+                app.root.after(0, done)
+            except Exception:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    preview_btn.configure(command=preview)
+    apply_btn.configure(command=apply)
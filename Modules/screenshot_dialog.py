@@ -0,0 +1,202 @@
+"""
+Screenshot optimizer dialog for WoW Cleanup Tool.
+
+Offers the non-destructive alternatives to deleting screenshots:
+re-encoding TGA/BMP/PNG files to JPEG or WebP, and packing old screenshots
+into a zip archive. Work runs in the background with a progress bar and the
+bytes saved are reported per version.
+
+Functions:
+    open_screenshot_optimizer: Show the optimizer dialog
+"""
+
+import os
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox
+from Modules import localization
+from Modules.performance import delete_files_batch
+from Modules.screenshot_tools import (
+    CONVERTIBLE_EXTENSIONS,
+    OUTPUT_FORMATS,
+    archive_screenshots,
+    convert_screenshots,
+    iter_screenshots,
+)
+from Modules.settings import save_settings
+from Modules.version_utils import format_size
+
+def _setting_int(app, key, default, low, high):
+    try:
+        return min(max(int(app.settings.get(key, default)), low), high)
+    except Exception:
+        return default
+
+def open_screenshot_optimizer(app, version_label=None, paths=None):
+    """Show the screenshot optimizer dialog.
+
+    Args:
+        app: The WoWCleanupTool instance
+        version_label: Optional version to limit the work to (all versions when omitted)
+        paths: Optional list of screenshot paths to convert (e.g. the current selection);
+               all convertible screenshots of the chosen versions are used when omitted
+    """
+    base = app.wow_path_var.get().strip()
+    if not base or not os.path.isdir(base):
+        messagebox.showerror(localization._("invalid_folder"), localization._("select_valid_wow_first"))
+        return
+    versions = [
+        (vpath, vlabel)
+        for vpath, vlabel in app._enumerate_versions(base)
+        if version_label is None or vlabel == version_label
+    ]
+
+    dlg = tk.Toplevel(app.root)
+    dlg.title(localization._("screenshot_optimizer"))
+    dlg.transient(app.root)
+    dlg.resizable(False, False)
+    frame = ttk.Frame(dlg, padding=12)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(
+        frame, text=localization._("screenshot_optimizer_description"), wraplength=420, justify="left",
+    ).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 8))
+
+    mode_var = tk.StringVar(value="convert")
+    ttk.Radiobutton(
+        frame, text=localization._("screenshot_mode_convert"), variable=mode_var, value="convert",
+    ).grid(row=1, column=0, sticky="w")
+    format_var = tk.StringVar(value=app.settings.get("screenshot_format", "JPEG"))
+    if format_var.get() not in OUTPUT_FORMATS:
+        format_var.set("JPEG")
+    ttk.Combobox(
+        frame, textvariable=format_var, values=list(OUTPUT_FORMATS), state="readonly", width=7,
+    ).grid(row=1, column=1, sticky="w", padx=(8, 0))
+    quality_var = tk.IntVar(value=_setting_int(app, "screenshot_quality", 90, 1, 100))
+    quality_frame = ttk.Frame(frame)
+    quality_frame.grid(row=1, column=2, sticky="w", padx=(8, 0))
+    ttk.Label(quality_frame, text=localization._("screenshot_quality")).pack(side="left")
+    ttk.Spinbox(quality_frame, from_=1, to=100, width=4, textvariable=quality_var).pack(side="left", padx=(4, 0))
+
+    ttk.Radiobutton(
+        frame, text=localization._("screenshot_mode_archive"), variable=mode_var, value="archive",
+    ).grid(row=2, column=0, sticky="w", pady=(4, 0))
+    days_var = tk.IntVar(value=_setting_int(app, "screenshot_archive_days", 90, 1, 3650))
+    days_frame = ttk.Frame(frame)
+    days_frame.grid(row=2, column=1, columnspan=2, sticky="w", padx=(8, 0), pady=(4, 0))
+    ttk.Spinbox(days_frame, from_=1, to=3650, width=5, textvariable=days_var).pack(side="left")
+    ttk.Label(days_frame, text=localization._("screenshot_days_old")).pack(side="left", padx=(4, 0))
+
+    progress = ttk.Progressbar(frame, mode="determinate", length=420)
+    progress.grid(row=3, column=0, columnspan=3, sticky="we", pady=(12, 4))
+    status = ttk.Label(frame, text="")
+    status.grid(row=4, column=0, columnspan=3, sticky="w")
+
+    buttons = ttk.Frame(frame)
+    buttons.grid(row=5, column=0, columnspan=3, sticky="e", pady=(10, 0))
+    start_btn = ttk.Button(buttons, text=localization._("screenshot_start"))
+    start_btn.pack(side="left", padx=(0, 6))
+    ttk.Button(buttons, text=localization._("close"), command=dlg.destroy).pack(side="left")
+
+    def set_progress(done, total):
+        def apply():
+            try:
+                progress.configure(maximum=max(total, 1), value=done)
+                status.configure(text=localization._("screenshot_progress").format(done, total))
+            except Exception:
+                pass
+        try:
+            app.root.after(0, apply)
+        except Exception:
+            pass
+
+    def finish(per_version, originals, mode):
+        use_trash = app.delete_mode.get() == "trash"
+        removed, _permanent, _trash = delete_files_batch(
+            originals,
+            use_trash=use_trash,
+            logger=app.backend_logger(),
+            module_name="Screenshots",
+        )
+        lines = []
+        total_saved = 0
+        for vlabel, (count, saved) in per_version.items():
+            total_saved += saved
+            line = localization._("screenshot_result_line").format(vlabel, count, format_size(saved))
+            lines.append(line)
+            app.log(line)
+        summary = localization._(
+            "screenshot_convert_done" if mode == "convert" else "screenshot_archive_done"
+        ).format(removed, format_size(total_saved))
+        app.log(summary)
+        try:
+            status.configure(text=summary)
+            start_btn.configure(state="normal")
+        except Exception:
+            pass
+        messagebox.showinfo(localization._("completed"), "\n".join(lines + ["", summary]), parent=dlg)
+        for _vpath, vlabel in versions:
+            if vlabel in per_version and hasattr(app, "version_tabs"):
+                app.refresh_folder_cleaner_version(vlabel)
+
+    def start():
+        mode = mode_var.get()
+        try:
+            quality = min(max(int(quality_var.get()), 1), 100)
+            days = min(max(int(days_var.get()), 1), 3650)
+        except Exception:
+            quality, days = 90, 90
+        fmt = format_var.get()
+        app.settings["screenshot_format"] = fmt
+        app.settings["screenshot_quality"] = quality
+        app.settings["screenshot_archive_days"] = days
+        save_settings(app.settings)
+
+        if mode == "convert":
+            if paths is not None:
+                label = version_label or ""
+                jobs = [(label, p) for p in paths if p.lower().endswith(CONVERTIBLE_EXTENSIONS)]
+            else:
+                jobs = [
+                    (vlabel, p)
+                    for vpath, vlabel in versions
+                    for p, _size, _mtime in iter_screenshots(os.path.join(vpath, "Screenshots"), CONVERTIBLE_EXTENSIONS)
+                ]
+            if not jobs:
+                messagebox.showinfo(localization._("no_selection"), localization._("screenshot_nothing_to_do"), parent=dlg)
+                return
+            action = localization._("screenshot_confirm_convert").format(len(jobs), fmt, quality)
+        else:
+            action = localization._("screenshot_confirm_archive").format(days)
+        if not messagebox.askyesno(localization._("confirm"), action, parent=dlg):
+            return
+
+        start_btn.configure(state="disabled")
+        logger = app.backend_logger()
+
+        def worker():
+            per_version = {}
+            originals = []
+            try:
+                if mode == "convert":
+                    stats, originals = convert_screenshots(
+                        jobs, fmt=fmt, quality=quality, progress=set_progress, logger=logger,
+                    )
+                    per_version = {v: (s["converted"], s["saved"]) for v, s in stats.items()}
+                else:
+                    for index, (vpath, vlabel) in enumerate(versions, 1):
+                        _archive, archived, saved = archive_screenshots(
+                            os.path.join(vpath, "Screenshots"), older_than_days=days, logger=logger,
+                        )
+                        if archived:
+                            per_version[vlabel] = (len(archived), saved)
+                            originals.extend(archived)
+                        set_progress(index, len(versions))
+            except Exception as e:
+                message = str(e)
+                app.root.after(0, lambda: messagebox.showerror(localization._("error"), message, parent=dlg))
+            app.root.after(0, lambda: finish(per_version, originals, mode))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    start_btn.configure(command=start)
@@ -0,0 +1,293 @@
+"""
+Virtualized screenshot checklist for the Folder Cleaner.
+
+A Screenshots folder can hold thousands of files. Creating one checkbox
+widget and one BooleanVar per file makes the version tab slow to build and
+heavy to keep around, so this list only creates widgets for the rows that
+fit on screen and re-binds them to different files while scrolling.
+Selection state lives in a SelectionModel indexed by row, so the
+selected count and size are always at hand.
+
+The widget mimics the parts of ImgCheckbox the app relies on (`assets` and
+`_sync_image()`), so it can be registered in `app.styled_shot_boxes` and
+follows theme changes like the other checkboxes.
+
+Classes:
+    VirtualScreenshotList: Scrollable checklist that only materializes visible rows
+"""
+import os
+import tkinter as tk
+from tkinter import ttk, font as tkfont
+from Modules import thumbnail_cache
+from Modules.selection_model import SelectionModel
+from Modules.version_utils import format_size
+
+class VirtualScreenshotList(ttk.Frame):
+    """
+    Scrollable screenshot checklist with a fixed pool of row widgets.
+
+    Args:
+        master: Parent widget
+        assets: ImgAssets used for the checkbox images
+        paths: Iterable of screenshot paths
+        on_activate: Optional callable(path) invoked when a row is clicked (e.g. preview)
+        on_change: Optional callable() invoked after the selection changes
+    """
+
+    def __init__(self, master, assets, paths=(), on_activate=None, on_change=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.assets = assets
+        self.on_activate = on_activate
+        self.on_change = on_change
+        self._paths = []
+        self._sizes = []
+        self._groups = None  # optional cluster number per row (-1 = not clustered)
+        self._selection = SelectionModel()
+        self._top = 0
+        self._rows = []  # [(frame, img_label, text_label, size_label)]
+
+        linespace = tkfont.nametofont("TkDefaultFont").metrics("linespace")
+        self.row_height = max(linespace + 6, 20)
+
+        self._body = ttk.Frame(self)
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self._body.pack(side="left", fill="both", expand=True)
+        self._scrollbar.pack(side="right", fill="y")
+        self._body.bind("<Configure>", lambda e: self._layout())
+        self._bind_wheel(self._body)
+
+        self.set_paths(paths)
+
+    # ----- data -----
+    def set_paths(self, paths, sizes=None, groups=None):
+        """Replace the listed screenshots; clears the selection.
+
+        Args:
+            paths: Iterable of screenshot paths
+            sizes: Optional matching list of file sizes (stat'ed when omitted)
+            groups: Optional matching list of cluster numbers (-1 for none),
+                    shown next to each row, e.g. for similar-screenshot clusters
+        """
+        self._paths = list(paths)
+        self._groups = list(groups) if groups is not None else None
+        if sizes is not None:
+            self._sizes = list(sizes)
+        else:
+            self._sizes = []
+            for path in self._paths:
+                try:
+                    self._sizes.append(os.path.getsize(path))
+                except OSError:
+                    self._sizes.append(0)
+        self._selection = SelectionModel(self._sizes)
+        self._top = 0
+        self._render()
+
+    def sync_paths(self, paths, sizes=None):
+        """Update the listed screenshots in place, keeping what did not change.
+
+        Rows of screenshots that still exist keep their position, size,
+        cluster number and checked state; vanished rows are dropped and new
+        screenshots are appended. Only new files are stat'ed, and the row
+        widgets are re-bound rather than rebuilt.
+
+        Args:
+            paths: Iterable of the screenshot paths that exist now
+            sizes: Optional matching list of file sizes
+
+        Returns:
+            tuple: (added_count, removed_count)
+        """
+        paths = list(paths)
+        known = {path: index for index, path in enumerate(self._paths)}
+        current = set(paths)
+        new_sizes = dict(zip(paths, sizes)) if sizes is not None else {}
+
+        keep = [index for index, path in enumerate(self._paths) if path in current]
+        added = [path for path in paths if path not in known]
+        removed = len(self._paths) - len(keep)
+        if not added and not removed:
+            return 0, 0
+
+        self._paths = [self._paths[i] for i in keep] + added
+        if self._groups is not None:
+            self._groups = [self._groups[i] for i in keep] + [-1] * len(added)
+        kept_sizes = [self._sizes[i] for i in keep]
+        for path in added:
+            if path in new_sizes:
+                kept_sizes.append(new_sizes[path])
+                continue
+            try:
+                kept_sizes.append(os.path.getsize(path))
+            except OSError:
+                kept_sizes.append(0)
+        self._sizes = kept_sizes
+        self._selection = self._selection.take(keep, self._sizes)
+        self._top = min(self._top, self._max_top())
+        self._render()
+        if removed:
+            self._changed()
+        return len(added), removed
+
+    def __len__(self):
+        return len(self._paths)
+
+    def selected_paths(self):
+        """Return the checked screenshot paths in list order."""
+        return self._selection.selected(self._paths)
+
+    def selected_count(self):
+        """Return how many screenshots are checked."""
+        return self._selection.count()
+
+    def selected_size(self):
+        """Return the total size of the checked screenshots in bytes."""
+        return self._selection.total_bytes()
+
+    def set_selected(self, paths):
+        """Check exactly the given screenshots."""
+        wanted = set(paths)
+        self._selection.select_only(i for i, path in enumerate(self._paths) if path in wanted)
+        self._render()
+        self._changed()
+
+    def paths(self):
+        """Return all listed screenshot paths in list order."""
+        return list(self._paths)
+
+    def sizes(self):
+        """Return the file sizes matching paths()."""
+        return list(self._sizes)
+
+    def set_all(self, state):
+        """Check or uncheck every screenshot."""
+        self._selection.set_all(state)
+        self._render()
+        self._changed()
+
+    def toggle_all(self):
+        """Check everything if anything is unchecked, otherwise uncheck everything."""
+        self.set_all(self.selected_count() < len(self._paths))
+
+    def toggle(self, index):
+        """Flip the checked state of one row."""
+        if 0 <= index < len(self._selection):
+            self._selection.toggle(index)
+            self._render()
+            self._changed()
+
+    def _changed(self):
+        if self.on_change:
+            try:
+                self.on_change()
+            except Exception:
+                pass
+
+    # ----- scrolling -----
+    def _visible_count(self):
+        return max(1, self._body.winfo_height() // self.row_height)
+
+    def _max_top(self):
+        return max(0, len(self._paths) - self._visible_count())
+
+    def yview(self, *args):
+        """Scrollbar command: supports 'moveto' and 'scroll' like Tk's yview."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._paths))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= self._visible_count()
+            self._top += step
+        self._top = min(max(self._top, 0), self._max_top())
+        self._render()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.yview("scroll", delta * 3, "units")
+        return "break"
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+
+    # ----- rendering -----
+    def _layout(self):
+        """Grow or shrink the row widget pool to the number of rows that fit."""
+        wanted = self._visible_count()
+        while len(self._rows) < wanted:
+            slot = len(self._rows)
+            frame = ttk.Frame(self._body, height=self.row_height)
+            img_label = tk.Label(frame, bd=0, highlightthickness=0)
+            text_label = ttk.Label(frame, anchor="w")
+            size_label = ttk.Label(frame, anchor="e")
+            img_label.pack(side="left")
+            text_label.pack(side="left", padx=(6, 0), fill="x", expand=True)
+            size_label.pack(side="right", padx=(6, 4))
+            for widget in (frame, img_label, text_label, size_label):
+                widget.bind("<Button-1>", lambda e, s=slot: self._on_row_click(s))
+                self._bind_wheel(widget)
+            frame.place(x=0, y=slot * self.row_height, relwidth=1, height=self.row_height)
+            self._rows.append((frame, img_label, text_label, size_label))
+        while len(self._rows) > wanted:
+            self._rows.pop()[0].destroy()
+        self._top = min(self._top, self._max_top())
+        self._render()
+
+    def _on_row_click(self, slot):
+        index = self._top + slot
+        if index >= len(self._paths):
+            return
+        self.toggle(index)
+        if self.on_activate:
+            try:
+                self.on_activate(self._paths[index])
+            except Exception:
+                pass
+
+    def _render(self):
+        """Bind the row widget pool to the rows currently scrolled into view."""
+        total = len(self._paths)
+        visible = []
+        for slot, (frame, img_label, text_label, size_label) in enumerate(self._rows):
+            index = self._top + slot
+            if index >= total:
+                img_label.configure(image="")
+                text_label.configure(text="")
+                size_label.configure(text="")
+                continue
+            path = self._paths[index]
+            visible.append(path)
+            checked = self._selection.is_selected(index)
+            img = self.assets.checkbox(checked) if self.assets else None
+            name = os.path.basename(path)
+            if img is not None:
+                img_label.configure(image=img)
+                img_label.image = img
+            else:
+                name = f"{'[x]' if checked else '[ ]'} {name}"
+            text_label.configure(text=name)
+            size_text = format_size(self._sizes[index])
+            if self._groups is not None and self._groups[index] >= 0:
+                size_text = f"#{self._groups[index] + 1}  {size_text}"
+            size_label.configure(text=size_text)
+
+        if total:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + len(self._rows)) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+        # Warm the thumbnail cache for what the user can see
+        thumbnail_cache.prefetch_thumbnails(visible)
+
+    def _sync_image(self):
+        """Redraw checkbox images after a theme change (ImgCheckbox compatible)."""
+        self._render()
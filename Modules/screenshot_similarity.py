@@ -0,0 +1,258 @@
+"""
+Near-duplicate screenshot detection.
+
+Burst screenshots (raid kills, loot, screenshot key held down) produce runs
+of almost identical images that byte-level duplicate detection cannot see.
+This module computes a 64-bit difference hash (dHash) per screenshot and
+clusters images whose hashes differ in only a few bits.
+
+- Hashing runs on a background thread pool; JPEGs are decoded in PIL draft
+  mode at a fraction of their size, which is plenty for a 9x8 hash.
+- Hashes are cached on disk keyed by path, size and mtime.
+- Clustering uses a BK-tree, so each lookup only visits hashes within the
+  distance threshold instead of comparing every pair of images, and complete
+  linkage, so every screenshot of a cluster is within the threshold of the
+  one that is kept.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    BKTree: Metric tree over integer hashes using Hamming distance
+
+Functions:
+    dhash: Compute the 64-bit difference hash of an image
+    hash_screenshots: Return cached or freshly computed hashes for many screenshots
+    cluster_hashes: Group hashes that are all within a Hamming distance threshold
+    find_similar_screenshots: Cluster near-identical screenshots
+"""
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from Modules.log_adapter import DEBUG, enabled
+from Modules.settings import get_cache_dir
+
+# Maximum Hamming distance (out of 64 bits) for two screenshots to be "the same shot"
+DEFAULT_THRESHOLD = 6
+_CACHE_NAME = "screenshot_hashes.json"
+_cache = None  # path -> [size, mtime_ns, hash]
+_cache_lock = threading.Lock()
+
+def hamming(a, b):
+    """Return the number of differing bits between two integer hashes."""
+    # bin().count rather than int.bit_count, which needs Python 3.10
+    return bin(a ^ b).count("1")
+
+class BKTree:
+    """
+    Burkhard-Keller tree over integer hashes with Hamming distance.
+
+    Each node stores children keyed by their distance to the node; the
+    triangle inequality lets a radius search skip every subtree whose edge
+    distance lies outside [d - radius, d + radius].
+    """
+
+    def __init__(self):
+        self._root = None  # [hash, [items], {distance: child}]
+
+    def add(self, value, item):
+        """Insert `item` under the hash `value`."""
+        if self._root is None:
+            self._root = [value, [item], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value, radius):
+        """Return the items of every hash within `radius` bits of `value`."""
+        found = []
+        if self._root is None:
+            return found
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                found.extend(node[1])
+            low, high = distance - radius, distance + radius
+            for edge, child in node[2].items():
+                if low <= edge <= high:
+                    stack.append(child)
+        return found
+
+def dhash(path, hash_size=8):
+    """
+    Compute the difference hash of an image.
+
+    The image is shrunk to (hash_size + 1) x hash_size grayscale pixels and
+    each bit records whether a pixel is brighter than its right neighbour.
+
+    Parameters:
+        path: Path to the image
+        hash_size: Hash edge length (8 gives a 64-bit hash)
+
+    Returns:
+        int or None: The hash, None if the image cannot be read
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(path) as im:
+            if im.format == "JPEG":
+                im.draft("L", (hash_size * 8, hash_size * 8))
+            small = im.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+            pixels = small.tobytes()
+    except Exception:
+        return None
+    value = 0
+    width = hash_size + 1
+    for row in range(hash_size):
+        offset = row * width
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        _cache = {}
+        try:
+            with open(os.path.join(get_cache_dir(), _CACHE_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                _cache = data
+        except Exception:
+            pass
+    return _cache
+
+def _save_cache():
+    try:
+        path = os.path.join(get_cache_dir(), _CACHE_NAME)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_cache, f)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def hash_screenshots(paths, max_workers=None):
+    """
+    Return the dHash of every screenshot, reusing cached hashes of unchanged files.
+
+    Parameters:
+        paths: Iterable of screenshot paths
+        max_workers: Optional thread count for hashing
+
+    Returns:
+        dict: Mapping of path -> hash for every readable screenshot
+    """
+    hashes = {}
+    todo = []
+    with _cache_lock:
+        cache = _load_cache()
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = cache.get(path)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                hashes[path] = entry[2]
+            else:
+                todo.append((path, st.st_size, st.st_mtime_ns))
+
+    if todo:
+        workers = max_workers or min(8, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda job: dhash(job[0]), todo))
+        with _cache_lock:
+            cache = _load_cache()
+            for (path, size, mtime_ns), value in zip(todo, results):
+                if value is not None:
+                    hashes[path] = value
+                    cache[path] = [size, mtime_ns, value]
+            _save_cache()
+    return hashes
+
+def cluster_hashes(hashes, threshold=DEFAULT_THRESHOLD):
+    """
+    Group items whose hashes all lie within `threshold` bits of each other.
+
+    Clusters use complete linkage: every pair of members is within the
+    threshold, so a slowly changing burst (a camera pan, a sunset) is split
+    into several clusters instead of chaining into one. Each cluster starts
+    at the first unassigned item; its BK-tree neighbours are tried nearest
+    first and join only if they are within the threshold of every member.
+
+    Parameters:
+        hashes: Mapping of item -> integer hash
+        threshold: Maximum Hamming distance between any two members
+
+    Returns:
+        list: Clusters (lists of items) with two or more members, in input order
+    """
+    items = list(hashes)
+    position = {item: i for i, item in enumerate(items)}
+    tree = BKTree()
+    for item in items:
+        tree.add(hashes[item], item)
+
+    assigned = set()
+    clusters = []
+    for seed in items:
+        if seed in assigned:
+            continue
+        assigned.add(seed)
+        value = hashes[seed]
+        candidates = [other for other in tree.search(value, threshold) if other not in assigned]
+        candidates.sort(key=lambda other: hamming(value, hashes[other]))
+        members = [seed]
+        for other in candidates:
+            other_value = hashes[other]
+            if all(hamming(other_value, hashes[member]) <= threshold for member in members):
+                members.append(other)
+                assigned.add(other)
+        if len(members) > 1:
+            clusters.append(sorted(members, key=position.get))
+    return clusters
+
+def find_similar_screenshots(paths, threshold=DEFAULT_THRESHOLD, max_workers=None, logger=None):
+    """
+    Cluster near-identical screenshots.
+
+    Parameters:
+        paths: Iterable of screenshot paths (usually one version's Screenshots folder)
+        threshold: Maximum Hamming distance between dHashes of the same cluster
+        max_workers: Optional thread count for hashing
+        logger: Optional object with .debug() and .info() methods
+
+    Returns:
+        list: Clusters (lists of paths sorted by modification time), largest cluster first
+    """
+    paths = list(paths)
+    clusters = cluster_hashes(hash_screenshots(paths, max_workers), threshold)
+
+    def mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0
+
+    clusters = [sorted(members, key=mtime) for members in clusters]
+    clusters.sort(key=len, reverse=True)
+
+    if logger:
+        if enabled(logger, DEBUG):
+            for members in clusters:
+                logger.debug("similar_cluster", len(members), os.path.basename(members[0]))
+        logger.info("similar_total", len(clusters), sum(len(members) - 1 for members in clusters))
+    return clusters
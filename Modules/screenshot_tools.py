@@ -0,0 +1,221 @@
+"""
+Screenshot recompression and archiving.
+
+Screenshots are usually the largest reclaimable item in a WoW install, and
+uncompressed TGA/BMP or lossless PNG files are several times larger than a
+high-quality JPEG or WebP of the same image. This module shrinks them
+instead of deleting them:
+- convert: re-encode TGA/BMP/PNG screenshots to JPEG or WebP in a process pool
+- archive: pack old screenshots into a compressed zip inside the Screenshots folder
+
+Originals are never removed here; callers delete them (honouring the user's
+delete/recycle-bin choice) once a conversion or archive has succeeded.
+
+It contains zero Tkinter/UI logic.
+
+Functions:
+    iter_screenshots: Yield screenshot files of a Screenshots folder
+    convert_screenshot: Re-encode one screenshot (process pool worker)
+    convert_screenshots: Re-encode many screenshots in parallel with progress
+    archive_screenshots: Pack screenshots older than N days into a zip archive
+"""
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from Modules.version_utils import format_size
+
+SCREENSHOT_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tga", ".gif", ".webp")
+CONVERTIBLE_EXTENSIONS = (".png", ".bmp", ".tga")
+OUTPUT_FORMATS = {"JPEG": ".jpg", "WEBP": ".webp"}
+ARCHIVE_FOLDER = "Archive"
+
+def iter_screenshots(folder, extensions=SCREENSHOT_EXTENSIONS):
+    """
+    Yield screenshot files directly inside a Screenshots folder.
+
+    Parameters:
+        folder: Path to a version's Screenshots folder
+        extensions: Lower-case file extensions to include
+
+    Yields:
+        tuple: (path, size, mtime)
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(extensions):
+                    continue
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        yield entry.path, st.st_size, st.st_mtime
+                except (OSError, PermissionError):
+                    continue
+    except (OSError, PermissionError):
+        return
+
+def convert_screenshot(path, fmt="JPEG", quality=90):
+    """
+    Re-encode one screenshot next to the original.
+
+    Runs in a worker process. The output keeps the original's timestamps and
+    is discarded when it would not be smaller than the original.
+
+    Parameters:
+        path: Path to the screenshot
+        fmt: "JPEG" or "WEBP"
+        quality: Encoder quality (1-100)
+
+    Returns:
+        tuple: (path, output_path_or_None, original_size, new_size, error_or_None)
+    """
+    from PIL import Image
+
+    tmp = None
+    try:
+        st = os.stat(path)
+        target = os.path.splitext(path)[0] + OUTPUT_FORMATS[fmt]
+        if os.path.exists(target):
+            # Never overwrite an existing screenshot; count it as not converted
+            return path, None, st.st_size, st.st_size, None
+        tmp = target + ".tmp"
+        with Image.open(path) as im:
+            if im.mode not in ("RGB", "L"):
+                im = im.convert("RGB")
+            if fmt == "JPEG":
+                im.save(tmp, "JPEG", quality=quality, optimize=True, progressive=True)
+            else:
+                im.save(tmp, "WEBP", quality=quality, method=4)
+        new_size = os.path.getsize(tmp)
+        if new_size >= st.st_size:
+            os.remove(tmp)
+            return path, None, st.st_size, st.st_size, None
+        os.replace(tmp, target)
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return path, target, st.st_size, new_size, None
+    except Exception as e:
+        if tmp:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
+        return path, None, 0, 0, str(e)
+
+def convert_screenshots(jobs, fmt="JPEG", quality=90, max_workers=None, progress=None, logger=None):
+    """
+    Re-encode many screenshots in a process pool.
+
+    Parameters:
+        jobs: Iterable of (version_label, path) tuples
+        fmt: "JPEG" or "WEBP"
+        quality: Encoder quality (1-100)
+        max_workers: Optional process count (defaults to CPU count - 1)
+        progress: Optional callable(done, total) called from this thread after each file
+        logger: Optional object with .debug(), .info() and .error() methods
+
+    Returns:
+        tuple: (per_version, converted) where per_version maps version_label ->
+               {"converted": n, "saved": bytes, "failed": n} and converted is the
+               list of original paths that now have a smaller copy
+    """
+    jobs = list(jobs)
+    per_version = {}
+    converted = []
+    if not jobs:
+        return per_version, converted
+
+    quality = min(max(int(quality), 1), 100)
+    workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(convert_screenshot, path, fmt, quality): vlabel for vlabel, path in jobs}
+        for future in as_completed(futures):
+            vlabel = futures[future]
+            stats = per_version.setdefault(vlabel, {"converted": 0, "saved": 0, "failed": 0})
+            try:
+                src, dst, old_size, new_size, error = future.result()
+            except Exception as e:
+                src, dst, old_size, new_size, error = "?", None, 0, 0, str(e)
+            if error:
+                stats["failed"] += 1
+                if logger:
+                    logger.error("screenshot_convert_failed", src, error)
+            elif dst:
+                stats["converted"] += 1
+                stats["saved"] += old_size - new_size
+                converted.append(src)
+                if logger:
+                    logger.debug("screenshot_converted", os.path.basename(src), format_size(old_size), format_size(new_size))
+            done += 1
+            if progress:
+                progress(done, len(jobs))
+
+    if logger:
+        for vlabel, stats in per_version.items():
+            logger.info("screenshot_convert_summary", vlabel, stats["converted"], format_size(stats["saved"]))
+    return per_version, converted
+
+def archive_screenshots(folder, older_than_days=90, now=None, progress=None, logger=None):
+    """
+    Pack screenshots older than N days into a zip archive in Screenshots/Archive.
+
+    Uncompressed formats shrink a lot with deflate; JPEGs are stored as-is
+    to avoid wasting time recompressing already compressed data.
+
+    Parameters:
+        folder: Path to a version's Screenshots folder
+        older_than_days: Only screenshots last modified before this many days ago
+        now: Optional reference timestamp (defaults to time.time())
+        progress: Optional callable(done, total) called after each file
+        logger: Optional object with .info() and .error() methods
+
+    Returns:
+        tuple: (archive_path_or_None, archived_paths, saved_bytes)
+    """
+    now = time.time() if now is None else now
+    cutoff = now - older_than_days * 24 * 60 * 60
+    files = sorted(
+        (path, size) for path, size, mtime in iter_screenshots(folder) if mtime < cutoff
+    )
+    if not files:
+        return None, [], 0
+
+    archive_dir = os.path.join(folder, ARCHIVE_FOLDER)
+    os.makedirs(archive_dir, exist_ok=True)
+    archive_path = os.path.join(archive_dir, time.strftime("Screenshots-%Y%m%d-%H%M%S.zip", time.localtime(now)))
+    tmp = archive_path + ".tmp"
+
+    archived = []
+    original_total = 0
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6, strict_timestamps=False) as zf:
+            for index, (path, size) in enumerate(files, 1):
+                stored = path.lower().endswith((".jpg", ".jpeg", ".webp"))
+                try:
+                    zf.write(
+                        path,
+                        arcname=os.path.basename(path),
+                        compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED,
+                    )
+                    archived.append(path)
+                    original_total += size
+                except (OSError, PermissionError) as e:
+                    if logger:
+                        logger.error("screenshot_archive_failed", path, e)
+                if progress:
+                    progress(index, len(files))
+        os.replace(tmp, archive_path)
+    except Exception as e:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        if logger:
+            logger.error("screenshot_archive_failed", archive_path, e)
+        return None, [], 0
+
+    saved = original_total - os.path.getsize(archive_path)
+    if logger:
+        logger.info("screenshot_archived", len(archived), archive_path, format_size(saved))
+    return archive_path, archived, saved
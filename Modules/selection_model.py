@@ -0,0 +1,128 @@
+"""
+Array-backed selection state for result lists.
+
+Cleaner results (File/Orphan Cleaner stores, the screenshot checklist)
+are addressed by ordinal, so their check state is one byte per row in a
+bytearray instead of a dict keyed by widget ids. The selected count and
+selected byte total are maintained incrementally, and range operations
+use bytearray slicing, count() and itertools.compress() so they run at
+C speed rather than one Python step per row.
+
+It contains zero Tkinter/UI logic.
+
+Classes:
+    SelectionModel: Per-ordinal selection flags with O(1) count and byte total
+"""
+from itertools import compress
+
+class SelectionModel:
+    """
+    Selection flags for a sequence of rows, indexed by ordinal.
+
+    Args:
+        sizes: Sequence of row sizes in bytes (kept by reference; rows
+               appended to it later are picked up with extend())
+        flags: Optional initial flags (bytes-like, one byte per row)
+    """
+
+    def __init__(self, sizes=(), flags=None):
+        self.sizes = sizes
+        self.flags = bytearray(flags) if flags is not None else bytearray(len(sizes))
+        self._count = len(self.flags) - self.flags.count(0)
+        self._bytes = sum(compress(sizes, self.flags)) if self._count else 0
+
+    def extend(self, count):
+        """Append `count` unselected rows (their sizes must already be in `sizes`)."""
+        self.flags.extend(bytes(count))
+
+    def take(self, ordinals, sizes):
+        """Return a new model holding the flags of `ordinals`, in that order.
+
+        Args:
+            ordinals: Ordinals of this model to keep
+            sizes: Sizes of the new model (matching `ordinals`, optionally
+                   followed by rows added later with extend())
+        """
+        flags = bytearray(self.flags[i] for i in ordinals)
+        model = SelectionModel(sizes, flags)
+        model.extend(len(sizes) - len(flags))
+        return model
+
+    # ----- queries -----
+    def __len__(self):
+        return len(self.flags)
+
+    def is_selected(self, ordinal):
+        return bool(self.flags[ordinal])
+
+    def count(self):
+        """Return the number of selected rows."""
+        return self._count
+
+    def total_bytes(self):
+        """Return the total size of the selected rows."""
+        return self._bytes
+
+    def all_selected(self, start=0, stop=None):
+        """Return True if every row of a non-empty range is selected."""
+        stop = len(self.flags) if stop is None else stop
+        return stop > start and self.flags.find(0, start, stop) == -1
+
+    def range_count(self, start, stop):
+        """Return the number of selected rows in [start, stop)."""
+        return self.flags.count(1, start, stop)
+
+    def selected(self, values):
+        """Return the items of `values` (matching the rows) that are selected."""
+        return list(compress(values, self.flags))
+
+    # ----- changes -----
+    def set(self, ordinal, state):
+        """Select or unselect one row."""
+        new = 1 if state else 0
+        if self.flags[ordinal] != new:
+            self.flags[ordinal] = new
+            delta = 1 if new else -1
+            self._count += delta
+            self._bytes += delta * self.sizes[ordinal]
+
+    def toggle(self, ordinal):
+        """Flip one row and return its new state."""
+        state = not self.flags[ordinal]
+        self.set(ordinal, state)
+        return state
+
+    def set_range(self, start, stop, state):
+        """Select or unselect every row in [start, stop)."""
+        if stop <= start:
+            return
+        flags = self.flags
+        selected = flags.count(1, start, stop)
+        selected_bytes = sum(compress(self.sizes[start:stop], flags[start:stop])) if selected else 0
+        if state:
+            self._count += (stop - start) - selected
+            self._bytes += sum(self.sizes[start:stop]) - selected_bytes
+        else:
+            self._count -= selected
+            self._bytes -= selected_bytes
+        flags[start:stop] = (b"\x01" if state else b"\x00") * (stop - start)
+
+    def set_many(self, ordinals, state):
+        """Select or unselect an arbitrary collection of rows."""
+        for ordinal in ordinals:
+            self.set(ordinal, state)
+
+    def set_all(self, state):
+        """Select or unselect every row."""
+        self.flags = bytearray(b"\x01" if state else b"\x00") * len(self.flags)
+        if state:
+            self._count = len(self.flags)
+            self._bytes = sum(self.sizes[:len(self.flags)])
+        else:
+            self._count = 0
+            self._bytes = 0
+
+    def select_only(self, ordinals):
+        """Select exactly the given rows."""
+        self.set_all(False)
+        self.set_many(ordinals, True)
@@ -14,6 +14,17 @@ def get_settings_path():
 
 SETTINGS_FILE = get_settings_path()
 
+def get_cache_dir(*parts):
+    """Return a cache directory under the user's config directory.
+
+    Caches hold data that can always be rebuilt (sizes, hashes, thumbnails),
+    so callers must tolerate the directory being emptied at any time.
+    Creates the directory if it doesn't exist.
+    """
+    path = os.path.join(os.path.dirname(SETTINGS_FILE), "cache", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
 def load_settings():
     """Load and return settings dict, merging global + user settings.
 
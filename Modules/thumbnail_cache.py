@@ -0,0 +1,252 @@
+"""
+Disk-backed screenshot thumbnail cache.
+
+Full-resolution screenshots take a long time to decode, so previews are
+served from small JPEG thumbnails stored under the user cache directory.
+Thumbnails are keyed by the source path, size and mtime; editing or
+replacing a screenshot therefore produces a new thumbnail automatically.
+
+Generation happens on a small pool of background threads. A preview the
+user is looking at jumps ahead of bulk prefetching, and prefetch jobs are
+kept in a bounded LRU: the most recently requested rows (what is on screen
+now) are built first, and when scrolling through a large folder queues more
+than PREFETCH_LIMIT jobs, the least recently requested ones are dropped.
+JPEG sources are decoded in PIL's draft mode (DCT scaling straight to roughly
+the target size), other formats use reduced decoding via
+Image.thumbnail(reducing_gap=...), so Tk never waits on a full decode.
+
+The disk cache is capped at MAX_CACHE_BYTES as well: cache hits refresh a
+thumbnail's mtime, and once the cap is exceeded the least recently used
+thumbnails are deleted.
+
+It contains zero Tkinter/UI logic; callers marshal callbacks to the UI thread.
+
+Functions:
+    get_cached_thumbnail: Return the thumbnail path of a screenshot if it is already cached
+    generate_thumbnail: Build (or reuse) the thumbnail of a screenshot synchronously
+    request_thumbnail: Generate a thumbnail in the background and call back with its path
+    prefetch_thumbnails: Queue background generation for many screenshots
+    prune_thumbnail_cache: Delete least recently used thumbnails beyond the disk cap
+    clear_thumbnail_cache: Delete every cached thumbnail
+"""
+import os
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from PIL import Image
+from Modules.settings import get_cache_dir
+
+# Bounding box of cached thumbnails; previews are scaled down from this
+THUMB_SIZE = (480, 270)
+THUMB_QUALITY = 85
+_CACHE_SUBDIR = "thumbnails"
+
+# Queue priorities: interactive previews before bulk prefetching
+PRIORITY_PREVIEW = 0
+PRIORITY_PREFETCH = 1
+
+# Prefetch jobs kept queued; older requests are dropped first
+PREFETCH_LIMIT = 256
+# Disk space used by thumbnails before the least recently used are deleted
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Thumbnails written between two checks of the disk cap
+_PRUNE_EVERY = 64
+
+_preview_jobs = deque()  # (thumb, path), first come first served
+_prefetch_jobs = OrderedDict()  # thumb -> path, most recently requested last
+_workers = []
+_pending = {}  # thumbnail path -> list of callbacks waiting for it
+_lock = threading.Lock()
+_jobs_ready = threading.Condition(_lock)
+_written = 0
+
+def _ensure_workers():
+    if _workers:
+        return
+    for i in range(max(1, min(4, (os.cpu_count() or 2) - 1))):
+        worker = threading.Thread(target=_worker_loop, name=f"thumbnails-{i}", daemon=True)
+        worker.start()
+        _workers.append(worker)
+
+def _thumbnail_path(path):
+    """Return the cache path of a screenshot's thumbnail, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    # Two-level fan-out keeps directories small for large screenshot sets
+    return os.path.join(get_cache_dir(_CACHE_SUBDIR), digest[:2], digest + ".jpg")
+
+def get_cached_thumbnail(path):
+    """
+    Return the thumbnail path of a screenshot if it is already cached.
+
+    Parameters:
+        path: Path to the screenshot
+
+    Returns:
+        str or None: Path of the cached thumbnail
+    """
+    thumb = _thumbnail_path(path)
+    if thumb and os.path.isfile(thumb):
+        _touch(thumb)
+        return thumb
+    return None
+
+def _touch(thumb):
+    """Mark a thumbnail as recently used for the disk LRU."""
+    try:
+        os.utime(thumb, None)
+    except OSError:
+        pass
+
+def prune_thumbnail_cache(max_bytes=MAX_CACHE_BYTES):
+    """
+    Delete the least recently used thumbnails until the cache fits in max_bytes.
+
+    Returns:
+        int: Number of deleted thumbnails
+    """
+    entries = []
+    total = 0
+    for root, _dirs, files in os.walk(get_cache_dir(_CACHE_SUBDIR)):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+    if total <= max_bytes:
+        return 0
+    # Trim to 90% of the cap so every new thumbnail does not trigger a prune
+    target = max_bytes * 9 // 10
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def generate_thumbnail(path, max_size=THUMB_SIZE):
+    """
+    Build the thumbnail of a screenshot, or return the cached one.
+
+    Parameters:
+        path: Path to the screenshot
+        max_size: (width, height) bounding box of the thumbnail
+
+    Returns:
+        str or None: Path of the thumbnail, None if the image cannot be read
+    """
+    global _written
+    thumb = _thumbnail_path(path)
+    if not thumb:
+        return None
+    if os.path.isfile(thumb):
+        _touch(thumb)
+        return thumb
+    try:
+        with Image.open(path) as im:
+            if im.format == "JPEG":
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale
+                im.draft("RGB", max_size)
+            im.thumbnail(max_size, reducing_gap=2.0)
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            os.makedirs(os.path.dirname(thumb), exist_ok=True)
+            tmp = f"{thumb}.{threading.get_ident()}.tmp"
+            im.save(tmp, "JPEG", quality=THUMB_QUALITY)
+        os.replace(tmp, thumb)
+    except Exception:
+        return None
+    with _lock:
+        _written += 1
+        prune = _written % _PRUNE_EVERY == 0
+    if prune:
+        prune_thumbnail_cache()
+    return thumb
+
+def _next_job():
+    """Block until a job is queued; previews first, then the newest prefetch."""
+    with _jobs_ready:
+        while not _preview_jobs and not _prefetch_jobs:
+            _jobs_ready.wait()
+        if _preview_jobs:
+            return _preview_jobs.popleft()
+        return _prefetch_jobs.popitem(last=True)
+
+def _worker_loop():
+    while True:
+        thumb, path = _next_job()
+        result = generate_thumbnail(path)
+        with _lock:
+            callbacks = _pending.pop(thumb, [])
+        for callback in callbacks:
+            try:
+                callback(result)
+            except Exception:
+                pass
+
+def request_thumbnail(path, callback=None, priority=PRIORITY_PREVIEW):
+    """
+    Generate a screenshot thumbnail in the background.
+
+    Concurrent requests for the same screenshot share one job. The callback
+    runs on a worker thread; UI code must hand the result to the Tk thread
+    (e.g. with root.after). Prefetch jobs without a callback may be dropped
+    when more than PREFETCH_LIMIT are queued.
+
+    Parameters:
+        path: Path to the screenshot
+        callback: Optional callable receiving the thumbnail path (or None on failure)
+        priority: PRIORITY_PREVIEW or PRIORITY_PREFETCH
+    """
+    thumb = _thumbnail_path(path)
+    if not thumb or os.path.isfile(thumb):
+        if callback:
+            callback(thumb)
+        return
+    with _jobs_ready:
+        waiting = _pending.get(thumb)
+        if waiting is None:
+            waiting = _pending[thumb] = []
+        if callback:
+            waiting.append(callback)
+        if priority == PRIORITY_PREVIEW or waiting:
+            # Jobs someone waits for are never dropped
+            _prefetch_jobs.pop(thumb, None)
+            if (thumb, path) not in _preview_jobs:
+                _preview_jobs.append((thumb, path))
+        else:
+            _prefetch_jobs[thumb] = path
+            _prefetch_jobs.move_to_end(thumb)
+            while len(_prefetch_jobs) > PREFETCH_LIMIT:
+                dropped, _path = _prefetch_jobs.popitem(last=False)
+                if not _pending.get(dropped):
+                    _pending.pop(dropped, None)
+        _ensure_workers()
+        _jobs_ready.notify()
+
+def prefetch_thumbnails(paths):
+    """Queue low-priority background generation for every screenshot not cached yet."""
+    for path in paths:
+        request_thumbnail(path, priority=PRIORITY_PREFETCH)
+
+def clear_thumbnail_cache():
+    """Delete every cached thumbnail."""
+    with _lock:
+        for thumb in _prefetch_jobs:
+            if not _pending.get(thumb):
+                _pending.pop(thumb, None)
+        _prefetch_jobs.clear()
+    shutil.rmtree(get_cache_dir(_CACHE_SUBDIR), ignore_errors=True)
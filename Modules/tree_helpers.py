@@ -1,4 +1,8 @@
-import os
+import tkinter as tk
+from tkinter import ttk
+from Modules import localization
+from Modules.result_filter import ResultIndex, parse_filter
+from Modules.virtual_tree import LazyTree, VirtualTree, VIRTUAL_TREE_THRESHOLD, configure_check_tags
 
 def build_checkbox_images(app):
     """Populate `app.chk_unchecked` and `app.chk_checked` using app.assets."""
@@ -8,150 +12,164 @@ def build_checkbox_images(app):
     except Exception:
         app.chk_unchecked = None
         app.chk_checked = None
+    refresh_check_tags(app)
 
-def file_tree_add_parent(app, label):
-    pid = app.file_tree.insert("", "end", text=f"  {label}", open=False)
-    app.tree_checks[pid] = False
-    file_tree_set_icon(app, pid)
-    return pid
-
-def file_tree_add_child_file(app, parent_id, path):
-    basename = os.path.basename(path)
-    iid = app.file_tree.insert(parent_id, "end", text=f"  {basename}", open=False)
-    app.tree_checks[iid] = False
-    app.tree_paths[iid] = path
-    file_tree_set_icon(app, iid)
-    return iid
-
-def file_tree_set_icon(app, iid):
-    if getattr(app, "chk_unchecked", None):
-        img = app.chk_checked if app.tree_checks.get(iid, False) else app.chk_unchecked
-        try:
-            app.file_tree.item(iid, image=img)
-        except Exception:
-            pass
+def refresh_check_tags(app):
+    """Re-point the check tags of the File/Orphan/Duplicates trees at the current checkbox images."""
+    images = (getattr(app, "chk_checked", None), getattr(app, "chk_unchecked", None))
+    for tree in (getattr(app, "file_tree", None), getattr(app, "orphan_tree", None), getattr(app, "dup_tree", None)):
+        if tree is not None:
+            try:
+                configure_check_tags(tree, images)
+            except Exception:
+                pass
+
+def get_tree_views(app, tree):
+    """Return the (VirtualTree, LazyTree) pair driving `tree`, creating them on first use."""
+    views = getattr(app, "_tree_views", None)
+    if views is None:
+        views = app._tree_views = {}
+    pair = views.get(str(tree))
+    if pair is None:
+        configure_check_tags(tree, (getattr(app, "chk_checked", None), getattr(app, "chk_unchecked", None)))
+        pair = views[str(tree)] = (VirtualTree(tree), LazyTree(tree))
+    return pair
+
+def active_view(app, tree):
+    """Return the VirtualTree or LazyTree currently showing results in `tree`, or None."""
+    for view in getattr(app, "_tree_views", {}).get(str(tree), ()):
+        if view.active:
+            return view
+    return None
+
+def use_virtual_tree(app, count):
+    """Return True if `count` results should be shown in virtual mode."""
+    try:
+        threshold = int(app.settings.get("virtual_tree_threshold", VIRTUAL_TREE_THRESHOLD))
+    except Exception:
+        threshold = VIRTUAL_TREE_THRESHOLD
+    return count >= threshold
+
+def show_results(app, tree, store):
+    """Show a ResultStore in `tree`: virtual mode for large results, lazy items otherwise."""
+    virtual, lazy = get_tree_views(app, tree)
+    virtual.deactivate()
+    lazy.deactivate()
+    (virtual if use_virtual_tree(app, len(store)) else lazy).activate(store)
+    refresh = getattr(app, "_filter_bars", {}).get(str(tree))
+    if refresh:
+        refresh()
+
+def clear_results(app, tree):
+    """Remove the results shown in `tree`."""
+    for view in get_tree_views(app, tree):
+        view.deactivate()
+
+def apply_filter(app, tree, text):
+    """Filter the results shown in `tree` (see result_filter for the syntax).
+
+    Returns:
+        tuple or None: (shown_count, total_count) while a filter is active
+    """
+    filters = getattr(app, "_tree_filters", None)
+    if filters is None:
+        filters = app._tree_filters = {}
+    filters[str(tree)] = text
+    view = active_view(app, tree)
+    if not view:
+        return None
+    if not text.strip():
+        view.set_filter(None)
+        return None
+    index = ResultIndex.for_store(view.store)
+    view.set_filter(index.group_views(index.search(parse_filter(text))))
+    return view.visible_count(), len(view.store)
+
+def build_filter_bar(app, tree):
+    """Add a filter entry above `tree` that filters its results while typing."""
+    from Modules.ui_helpers import Tooltip
+    container = tree.master
+    bar = ttk.Frame(container)
+    ttk.Label(bar, text=localization._("filter_label")).pack(side="left", padx=(0, 4))
+    text_var = tk.StringVar()
+    entry = ttk.Entry(bar, textvariable=text_var, width=40)
+    entry.pack(side="left")
+    ttk.Button(bar, text=localization._("filter_clear"), command=lambda: text_var.set("")).pack(side="left", padx=(4, 0))
+    status = ttk.Label(bar, text="")
+    status.pack(side="left", padx=(8, 0))
+    Tooltip(entry, localization._("filter_help"), app=app)
+
+    pending = {"job": None}
+
+    def run():
+        pending["job"] = None
+        counts = apply_filter(app, tree, text_var.get())
+        status.configure(text=localization._("filter_showing").format(*counts) if counts else "")
+
+    def on_change(*_args):
+        # Coalesce keystrokes typed in quick succession
+        if pending["job"] is not None:
+            bar.after_cancel(pending["job"])
+        pending["job"] = bar.after(60, run)
+
+    bars = getattr(app, "_filter_bars", None)
+    if bars is None:
+        bars = app._filter_bars = {}
+    bars[str(tree)] = run
+    text_var.trace_add("write", on_change)
+    entry.bind("<Escape>", lambda e: text_var.set(""))
+
+    if tree.winfo_manager() == "pack":
+        bar.pack(side="top", fill="x", pady=(0, 4), before=tree)
     else:
-        checked = app.tree_checks.get(iid, False)
-        try:
-            text = app.file_tree.item(iid, "text")
-        except Exception:
-            text = ""
-        prefix = "[x]" if checked else "[ ]"
-        try:
-            if not text.strip().startswith("["):
-                app.file_tree.item(iid, text=f"{prefix} {text.strip()}")
-            else:
-                app.file_tree.item(iid, text=f"{prefix} {text.strip()[3:].strip()}")
-        except Exception:
-            pass
+        columns, rows = container.grid_size()
+        bar.grid(row=rows, column=0, columnspan=max(columns, 1), sticky="ew", pady=(4, 0))
+    return bar
 
-def on_file_tree_click(app, event):
-    elem = app.file_tree.identify("element", event.x, event.y)
+def view_click(view, event):
+    """Toggle the row under the mouse; clicks on the expand indicator are left to Tk."""
+    elem = view.tree.identify("element", event.x, event.y)
     if elem in ("Treeitem.indicator", "treeitem.indicator", "indicator"):
-        return
-    iid = app.file_tree.identify_row(event.y)
-    if not iid:
-        return
-    # toggling selection
-    if iid not in getattr(app, "tree_paths", {}):
-        new_state = not app.tree_checks.get(iid, False)
-        app.tree_checks[iid] = new_state
-        for child in app.file_tree.get_children(iid):
-            app.tree_checks[child] = new_state
-            file_tree_set_icon(app, child)
-        file_tree_set_icon(app, iid)
-    else:
-        app.tree_checks[iid] = not app.tree_checks.get(iid, False)
-        file_tree_set_icon(app, iid)
+        return None
+    iid = view.tree.identify_row(event.y)
+    if iid:
+        view.toggle(iid)
     return "break"
 
+def on_file_tree_click(app, event):
+    view = active_view(app, app.file_tree)
+    return view_click(view, event) if view else None
+
 def tree_toggle_all(app):
-    new_state = app.tree_select_all_var.get()
-    for iid in app.file_tree.get_children(""):
-        app.tree_checks[iid] = new_state
-        file_tree_set_icon(app, iid)
-        for child in app.file_tree.get_children(iid):
-            app.tree_checks[child] = new_state
-            file_tree_set_icon(app, child)
+    view = active_view(app, app.file_tree)
+    if view:
+        view.set_all(app.tree_select_all_var.get())
 
 def tree_expand_all(app):
-    for iid in app.file_tree.get_children(""):
-        app.file_tree.item(iid, open=True)
+    view = active_view(app, app.file_tree)
+    if view:
+        view.expand_all(True)
 
 def tree_collapse_all(app):
-    for iid in app.file_tree.get_children(""):
-        app.file_tree.item(iid, open=False)
-
-def orphan_tree_add_parent(app, label):
-    pid = app.orphan_tree.insert("", "end", text=f"  {label}", open=False)
-    app.orphan_checks[pid] = False
-    orphan_tree_set_icon(app, pid)
-    return pid
-
-def orphan_tree_add_child_file(app, parent_id, path):
-    basename = os.path.basename(path)
-    iid = app.orphan_tree.insert(parent_id, "end", text=f"  {basename}", open=False)
-    app.orphan_checks[iid] = False
-    app.orphan_paths[iid] = path
-    orphan_tree_set_icon(app, iid)
-    return iid
-
-def orphan_tree_set_icon(app, iid):
-    if getattr(app, "chk_unchecked", None):
-        img = app.chk_checked if app.orphan_checks.get(iid, False) else app.chk_unchecked
-        try:
-            app.orphan_tree.item(iid, image=img)
-        except Exception:
-            pass
-    else:
-        checked = app.orphan_checks.get(iid, False)
-        try:
-            text = app.orphan_tree.item(iid, "text")
-        except Exception:
-            text = ""
-        prefix = "[x]" if checked else "[ ]"
-        try:
-            if not text.strip().startswith("["):
-                app.orphan_tree.item(iid, text=f"{prefix} {text.strip()}")
-            else:
-                app.orphan_tree.item(iid, text=f"{prefix} {text.strip()[3:].strip()}")
-        except Exception:
-            pass
+    view = active_view(app, app.file_tree)
+    if view:
+        view.expand_all(False)
 
 def on_orphan_tree_click(app, event):
-    elem = app.orphan_tree.identify("element", event.x, event.y)
-    if elem in ("Treeitem.indicator", "treeitem.indicator", "indicator"):
-        return
-    iid = app.orphan_tree.identify_row(event.y)
-    if not iid:
-        return
-    if iid not in getattr(app, "orphan_paths", {}):
-        new_state = not app.orphan_checks.get(iid, False)
-        app.orphan_checks[iid] = new_state
-        for child in app.orphan_tree.get_children(iid):
-            app.orphan_checks[child] = new_state
-            orphan_tree_set_icon(app, child)
-        orphan_tree_set_icon(app, iid)
-    else:
-        app.orphan_checks[iid] = not app.orphan_checks.get(iid, False)
-        orphan_tree_set_icon(app, iid)
-    return "break"
+    view = active_view(app, app.orphan_tree)
+    return view_click(view, event) if view else None
 
 def orphan_tree_toggle_all(app):
-    new_state = app.orphan_select_all_var.get()
-    for iid in app.orphan_tree.get_children(""):
-        app.orphan_checks[iid] = new_state
-        orphan_tree_set_icon(app, iid)
-        for child in app.orphan_tree.get_children(iid):
-            app.orphan_checks[child] = new_state
-            orphan_tree_set_icon(app, child)
+    view = active_view(app, app.orphan_tree)
+    if view:
+        view.set_all(app.orphan_select_all_var.get())
 
 def orphan_tree_expand_all(app):
-    if hasattr(app, "orphan_tree"):
-        for iid in app.orphan_tree.get_children(""):
-            app.orphan_tree.item(iid, open=True)
+    view = active_view(app, app.orphan_tree) if hasattr(app, "orphan_tree") else None
+    if view:
+        view.expand_all(True)
 
 def orphan_tree_collapse_all(app):
-    if hasattr(app, "orphan_tree"):
-        for iid in app.orphan_tree.get_children(""):
-            app.orphan_tree.item(iid, open=False)
+    view = active_view(app, app.orphan_tree) if hasattr(app, "orphan_tree") else None
+    if view:
+        view.expand_all(False)
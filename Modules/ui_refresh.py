@@ -3,7 +3,13 @@ UI refresh and rebuild module for WoW Cleanup Tool.
 
 Handles theme-aware widget refreshing, asset rebuilding, and UI state synchronization.
 Centralizes all logic for updating UI elements after theme or asset changes.
+
+Folder Cleaner version tabs are synchronized in place after cleanup:
+the folders and screenshots on disk are compared with the rows on screen
+and only rows that appeared or disappeared are touched.
 """
+import os
+from Modules import tree_helpers
 
 def refresh_styled_checkables(app):
     """Refresh all styled checkbox and radio widgets after theme or asset changes.
@@ -24,13 +30,8 @@ def refresh_styled_checkables(app):
         for cb in app.styled_shot_boxes:
             cb.assets = app.assets; cb._sync_image()
     if hasattr(app, "_build_checkbox_images"):
+        # Also re-points the File/Orphan tree check tags at the new images
         app._build_checkbox_images()
-        if hasattr(app, "file_tree"):
-            for iid in list(getattr(app, "tree_checks", {}).keys()):
-                app._tree_set_icon(iid)
-        if hasattr(app, "orphan_tree"):
-            for iid in list(getattr(app, "orphan_checks", {}).keys()):
-                app._orphan_tree_set_icon(iid)
 
 def reload_all_custom_checkboxes(app):
     """Replace checkbox images in all treeviews after theme change.
@@ -38,17 +39,8 @@ def reload_all_custom_checkboxes(app):
     Args:
         app: The WoWCleanupTool instance
     """
-    # File Cleaner
-    if hasattr(app, "tree_checks") and hasattr(app, "file_tree"):
-        for iid, var in app.tree_checks.items():
-            img = app.chk_checked if var.get() else app.chk_unchecked
-            app.file_tree.item(iid, image=img)
-
-    # Orphan Cleaner
-    if hasattr(app, "orphan_checks") and hasattr(app, "orphan_tree"):
-        for iid, var in app.orphan_checks.items():
-            img = app.chk_checked if var.get() else app.chk_unchecked
-            app.orphan_tree.item(iid, image=img)
+    # File / Orphan Cleaner: check images come from the tree tags
+    tree_helpers.refresh_check_tags(app)
 
     # Folder cleaner uses per-version custom widgets, no TreeView
 
@@ -76,3 +68,59 @@ def set_options_border(app, show_dark_border: bool):
             app.options_border.configure(bg="#b0b0b0" if show_dark_border else app.root.cget("bg"))
         except Exception:
             pass
+
+def sync_folder_cleaner_version(app, version_path, widgets):
+    """Bring one Folder Cleaner version tab up to date without rebuilding it.
+
+    Uses these entries of the tab's widgets dict (as stored in app.version_tabs):
+        folder_vars: rel_name -> (BooleanVar, abs_path, checkbox) for folder rows
+        add_folder_row: Optional callable(rel_name, abs_path) that creates a row
+                        and registers it in folder_vars
+        shots_vars: VirtualScreenshotList of the tab's screenshots (missing when
+                    the version had no Screenshots folder)
+
+    Args:
+        app: The WoWCleanupTool instance
+        version_path: Absolute path of the version shown on the tab
+        widgets: The tab's widgets dict
+
+    Returns:
+        bool: True if the tab was synchronized, False if it needs a full rebuild
+    """
+    from Modules.folder_cleaner import scan_cleanable_folders
+    from Modules.screenshot_tools import iter_screenshots
+
+    folder_vars = widgets.get("folder_vars") if widgets else None
+    shots = widgets.get("shots_vars") if widgets else None
+    if folder_vars is None:
+        return False
+    shots_folder = os.path.join(version_path, "Screenshots")
+    if shots is None and os.path.isdir(shots_folder):
+        # The Screenshots folder appeared since the tab was built
+        return False
+
+    found = dict(scan_cleanable_folders(version_path))
+    added = [rel for rel in found if rel not in folder_vars]
+    if added and not callable(widgets.get("add_folder_row")):
+        return False
+
+    styled = getattr(app, "styled_folder_boxes", None)
+    for rel in [rel for rel in folder_vars if rel not in found]:
+        _var, _path, checkbox = folder_vars.pop(rel)
+        if styled is not None and checkbox in styled:
+            styled.remove(checkbox)
+        try:
+            checkbox.destroy()
+        except Exception:
+            pass
+    for rel in added:
+        widgets["add_folder_row"](rel, found[rel])
+
+    if shots is not None:
+        listing = sorted(iter_screenshots(shots_folder))
+        shots.sync_paths([path for path, _size, _mtime in listing], [size for _path, size, _mtime in listing])
+        if not shots.selected_count():
+            select_all_var = widgets.get("shots_select_all_var")
+            if select_all_var is not None:
+                select_all_var.set(False)
+    return True
@@ -0,0 +1,162 @@
+"""
+Frame-budgeted scheduler for bulk UI population.
+
+Filling a tree or list with thousands of widgets in one callback freezes
+the window, and fixed-size chunks are either too small on fast machines
+(the list fills slowly) or too large on slow ones (the UI stutters).
+This scheduler instead runs queued work items until a time budget of
+about one frame (8-12 ms) is spent, then yields to Tk so it can redraw
+and handle input, and continues on the next turn of the event loop.
+
+The budget adapts: when the event loop comes back late (the machine is
+busy or slow) the budget shrinks towards 8 ms, and when it comes back
+promptly it grows towards 12 ms. Tasks run in FIFO order and share the
+budget, so several populations at once never exceed one frame's worth.
+
+A work item that raises stops its task: the exception goes to the task's
+on_error callback (or Tk's report_callback_exception when there is none),
+and on_done still runs so callers can reset their "in progress" state.
+
+One scheduler is kept per Tk root (see get_scheduler).
+
+Classes:
+    ScheduledTask: Handle of queued work (cancel(), done)
+    FrameScheduler: Runs queued work in frame-sized slices
+
+Functions:
+    get_scheduler: Return the scheduler of a widget's Tk root
+"""
+import sys
+import time
+from collections import deque
+
+MIN_BUDGET_MS = 8.0
+MAX_BUDGET_MS = 12.0
+
+class ScheduledTask:
+    """Handle of work queued on a FrameScheduler."""
+
+    def __init__(self, items, work, on_done, on_error=None):
+        self._items = iter(items)
+        self._work = work
+        self._on_done = on_done
+        self._on_error = on_error
+        self.cancelled = False
+        self.done = False
+        self.error = None
+
+    def cancel(self):
+        """Stop the task; items not processed yet are dropped and on_done is not called."""
+        self.cancelled = True
+
+    def _finish(self):
+        self.done = True
+        if self._on_done and not self.cancelled:
+            try:
+                self._on_done()
+            except Exception:
+                pass
+
+    def _fail(self, error):
+        """Record the exception of a work item; returns False if nobody handled it."""
+        self.error = error
+        handled = False
+        if self._on_error and not self.cancelled:
+            try:
+                self._on_error(error)
+                handled = True
+            except Exception:
+                pass
+        self._finish()
+        return handled
+
+class FrameScheduler:
+    """
+    Runs queued UI work in slices of about one frame.
+
+    Args:
+        widget: Any widget of the Tk application (used for after())
+        budget_ms: Initial time budget per slice
+    """
+
+    def __init__(self, widget, budget_ms=10.0):
+        self.widget = widget
+        self.budget = budget_ms / 1000.0
+        self._tasks = deque()
+        self._job = None
+        self._scheduled_at = 0.0
+
+    def run(self, items, work, on_done=None, on_error=None):
+        """Queue `work(item)` for every item.
+
+        Args:
+            items: Iterable of work items (consumed lazily)
+            work: Callable(item) doing the UI work for one item
+            on_done: Optional callable() run after the last item, or after a
+                     work item raised
+            on_error: Optional callable(exception) run when a work item raises;
+                      the remaining items are dropped
+
+        Returns:
+            ScheduledTask: Handle that can cancel the remaining work
+        """
+        task = ScheduledTask(items, work, on_done, on_error)
+        self._tasks.append(task)
+        self._schedule()
+        return task
+
+    def _schedule(self):
+        if self._job is None:
+            self._scheduled_at = time.perf_counter()
+            # after(1) rather than after_idle so Tk redraws between slices
+            self._job = self.widget.after(1, self._pump)
+
+    def _adapt(self, start):
+        """Shrink the budget when the event loop came back late, grow it otherwise."""
+        latency = start - self._scheduled_at
+        if latency > 2 * self.budget:
+            self.budget = max(MIN_BUDGET_MS / 1000.0, self.budget * 0.9)
+        else:
+            self.budget = min(MAX_BUDGET_MS / 1000.0, self.budget * 1.05)
+
+    def _pump(self):
+        self._job = None
+        start = time.perf_counter()
+        self._adapt(start)
+        deadline = start + self.budget
+        tasks = self._tasks
+        while tasks and time.perf_counter() < deadline:
+            task = tasks[0]
+            if task.cancelled:
+                tasks.popleft()
+                continue
+            try:
+                while time.perf_counter() < deadline:
+                    task._work(next(task._items))
+            except StopIteration:
+                tasks.popleft()
+                task._finish()
+            except Exception as e:
+                tasks.popleft()
+                if not task._fail(e):
+                    self._report(e)
+        if tasks:
+            try:
+                self._schedule()
+            except Exception:
+                tasks.clear()
+
+    def _report(self, error):
+        """Hand an unhandled work item exception to Tk's callback error report."""
+        try:
+            self.widget.report_callback_exception(type(error), error, error.__traceback__)
+        except Exception:
+            sys.excepthook(type(error), error, error.__traceback__)
+
+def get_scheduler(widget):
+    """Return the FrameScheduler of `widget`'s Tk root, creating it on first use."""
+    root = widget._root()
+    scheduler = getattr(root, "_frame_scheduler", None)
+    if scheduler is None:
+        scheduler = root._frame_scheduler = FrameScheduler(root)
+    return scheduler
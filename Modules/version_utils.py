@@ -6,6 +6,7 @@ import os
 import time
 from pathlib import Path
 from Modules import localization
+from Modules.disk_usage import disk_usage
 
 # Cache for version enumeration
 _VERSION_CACHE = {}
@@ -131,30 +132,64 @@ def verify_version_structure(version_path):
             os.path.exists(interface_dir) and 
             os.path.exists(addons_dir))
 
+def format_size(num_bytes):
+    """Format a byte count for display (e.g., 1536 -> "1.5 KB").
+    
+    Args:
+        num_bytes: Size in bytes
+        
+    Returns:
+        str: Human-readable size using binary units
+    """
+    size = float(num_bytes or 0)
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            break
+        size /= 1024
+    if unit == "B":
+        return f"{int(size)} B"
+    return f"{size:.1f} {unit}"
+
 def get_folder_size(folder_path):
     """Calculate total size of a folder in bytes.
     
+    Uses the iterative parallel walk of Modules.disk_usage, so deep trees
+    cannot hit the recursion limit and hardlinks are counted once.
+    
     Args:
         folder_path: Path to folder
         
     Returns:
-        int: Total size in bytes
+        int: Total apparent size in bytes
     """
-    total_size = 0
-    try:
-        with os.scandir(folder_path) as entries:
-            for entry in entries:
-                try:
-                    if entry.is_file(follow_symlinks=False):
-                        total_size += entry.stat().st_size
-                    elif entry.is_dir(follow_symlinks=False):
-                        total_size += get_folder_size(entry.path)
-                except (OSError, PermissionError):
-                    continue
-    except (OSError, PermissionError):
-        pass
+    return disk_usage([folder_path])[folder_path].size
+
+def get_folder_stats(folder_path):
+    """Calculate size, file count and newest file mtime of a folder.
+    
+    Args:
+        folder_path: Path to folder
+        
+    Returns:
+        tuple: (total_size_bytes, file_count, newest_mtime) - newest_mtime is 0 for empty folders
+    """
+    usage = disk_usage([folder_path])[folder_path]
+    return usage.size, usage.files, usage.newest
+
+def get_folder_stats_parallel(folder_paths, max_workers=None):
+    """Calculate get_folder_stats() for multiple folders in one parallel walk.
     
-    return total_size
+    Args:
+        folder_paths: Iterable of folder paths
+        max_workers: Optional thread count (defaults to min(8, CPU count))
+        
+    Returns:
+        dict: Mapping of folder_path -> (size_in_bytes, file_count, newest_mtime)
+    """
+    return {
+        path: (usage.size, usage.files, usage.newest)
+        for path, usage in disk_usage(folder_paths, max_workers=max_workers).items()
+    }
 
 def get_folder_sizes_parallel(folder_paths):
     """Calculate sizes of multiple folders in parallel.
@@ -165,19 +200,7 @@ def get_folder_sizes_parallel(folder_paths):
     Returns:
         dict: Mapping of folder_path -> size_in_bytes
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    
-    results = {}
-    
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(get_folder_size, path): path for path in folder_paths}
-        
-        for future in as_completed(futures):
-            path = futures[future]
-            try:
-                size = future.result()
-                results[path] = size
-            except Exception:
-                results[path] = 0
-    
-    return results
+    return {
+        path: stats[0]
+        for path, stats in get_folder_stats_parallel(folder_paths).items()
+    }
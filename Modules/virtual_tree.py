@@ -0,0 +1,623 @@
+"""
+Store-backed Treeview modes for File and Orphan Cleaner results.
+
+Inserting one Treeview item per result makes 100k-row scans slow to show,
+slow to scroll and heavy on memory. In virtual mode the Treeview only
+holds a small pool of items - as many as fit on screen - and the pool is
+re-bound to different rows of a ResultStore while scrolling. The
+scrollbar, mouse wheel and expand/collapse state are driven by this
+class, so the cost of every scroll step is proportional to the visible
+window, not to the result count.
+
+Rows are version headers followed by their results when expanded.
+Clicking a row toggles its check (a header toggles its whole group);
+double-clicking a header expands or collapses it.
+
+Smaller results use LazyTree: one real item per version with its count
+and size, and child items are only inserted when the user opens a version.
+Checking a collapsed version marks its whole group in the store without
+creating any rows.
+
+Both views can show a filtered subset of the store (see result_filter):
+each group then lists only its matching ordinals, headers count and size
+what is visible, groups without matches are hidden, and checking a header
+or "select all" only touches visible rows; hidden rows keep their state.
+
+Check boxes are drawn through the "checked"/"unchecked" Treeview tags,
+which carry the checkbox images. Items never get an image of their own,
+so (de)selecting many rows is a couple of `tag add`/`tag remove` calls
+and a theme change only reconfigures the two tags.
+
+Classes:
+    VirtualTree: Pool-based window over a ResultStore shown in a ttk.Treeview
+    LazyTree: Real Treeview items, with children inserted on first expand
+
+Functions:
+    configure_check_tags: Point the check tags of a Treeview at checkbox images
+    set_check_tags: Check or uncheck many items in two Tk calls
+"""
+import os
+import tkinter as tk
+from tkinter import ttk
+from Modules import localization
+from Modules.ui_scheduler import get_scheduler
+from Modules.version_utils import format_size
+
+# Result count from which the File/Orphan Cleaner trees switch to virtual mode
+VIRTUAL_TREE_THRESHOLD = 5000
+
+CHECKED_TAG = "checked"
+UNCHECKED_TAG = "unchecked"
+
+def _check_tags(checked):
+    return (CHECKED_TAG,) if checked else (UNCHECKED_TAG,)
+
+def _fallback_checkbox_images(tree, size=13):
+    """Draw plain checkbox images in the Treeview's text color (no-asset mode)."""
+    try:
+        color = ttk.Style().lookup("Treeview", "foreground") or "black"
+    except Exception:
+        color = "black"
+    images = []
+    for checked in (True, False):
+        img = tk.PhotoImage(master=tree, width=size, height=size)
+        for box in ((0, 0, size, 1), (0, size - 1, size, size), (0, 0, 1, size), (size - 1, 0, size, size)):
+            img.put(color, to=box)
+        if checked:
+            img.put(color, to=(3, 3, size - 3, size - 3))
+        images.append(img)
+    return images
+
+def configure_check_tags(tree, images):
+    """Point the check tags of `tree` at checkbox images.
+
+    Args:
+        tree: ttk.Treeview
+        images: (checked_image, unchecked_image); when either is None, simple
+                images are drawn so check state stays visible without assets
+    """
+    checked_img, unchecked_img = images
+    if checked_img is None or unchecked_img is None:
+        # Keep a reference on the widget so Tk does not lose the images
+        checked_img, unchecked_img = tree._fallback_check_images = _fallback_checkbox_images(tree)
+    tree.tag_configure(CHECKED_TAG, image=checked_img)
+    tree.tag_configure(UNCHECKED_TAG, image=unchecked_img)
+
+def set_check_tags(tree, items, checked):
+    """Check or uncheck many items with two Tk calls.
+
+    Args:
+        tree: ttk.Treeview
+        items: Item ids, or None for every item carrying a check tag
+        checked: New state
+    """
+    tag, other = (CHECKED_TAG, UNCHECKED_TAG) if checked else (UNCHECKED_TAG, CHECKED_TAG)
+    items = tuple(tree.tag_has(other) if items is None else items)
+    if not items:
+        return
+    tree.tk.call(tree._w, "tag", "remove", other, items)
+    tree.tk.call(tree._w, "tag", "add", tag, items)
+
+def _show_item(tree, iid, text, checked):
+    """Set an item's text and check tag."""
+    tree.item(iid, text=f"  {text}", tags=_check_tags(checked))
+
+class _ResultView:
+    """Store, per-group views and filter-aware check helpers shared by both modes."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.store = None
+        self.views = []        # per group: sequence of ordinals shown under the header
+        self.filtered = False
+        self._view_bytes = []  # per group: total size of the view (filtered only)
+        self._view_checked = []  # per group: checked results in the view (filtered only)
+
+    @property
+    def active(self):
+        return self.store is not None
+
+    def _reset_views(self):
+        store = self.store
+        self.views = [store.group_range(g) for g in range(store.group_count())] if store else []
+        self.filtered = False
+        self._view_bytes = []
+        self._view_checked = []
+
+    def _set_views(self, views):
+        """Show per-group ordinal lists, or everything when `views` is None."""
+        if views is None:
+            self._reset_views()
+            return
+        sizes = self.store.sizes
+        flags = self.store.selection.flags
+        self.views = list(views)
+        self.filtered = True
+        self._view_bytes = [sum(sizes[o] for o in view) for view in self.views]
+        self._view_checked = [sum(flags[o] for o in view) for view in self.views]
+
+    def visible_count(self):
+        """Return the number of results shown (all results when unfiltered)."""
+        return sum(len(view) for view in self.views)
+
+    def _group_visible(self, group):
+        return not self.filtered or len(self.views[group]) > 0
+
+    def _group_text(self, group, marker=""):
+        """Return the header text of a group: label, shown result count and size."""
+        store = self.store
+        label = f"{marker} {store.labels[group]}" if marker else store.labels[group]
+        size = self._view_bytes[group] if self.filtered else store.group_size(group)
+        return localization._("tree_group_summary").format(label, len(self.views[group]), format_size(size))
+
+    def _group_checked(self, group):
+        """Return True if every shown result of a group is checked."""
+        if not self.filtered:
+            return self.store.group_checked(group)
+        # Kept per view, so headers cost O(1) on every render and scroll step
+        shown = len(self.views[group])
+        return shown > 0 and self._view_checked[group] == shown
+
+    def _set_group_checked(self, group, state):
+        if self.filtered:
+            self.store.selection.set_many(self.views[group], state)
+            self._view_checked[group] = len(self.views[group]) if state else 0
+        else:
+            self.store.set_group_checked(group, state)
+
+    def _set_visible_checked(self, state):
+        if self.filtered:
+            for group, view in enumerate(self.views):
+                self.store.selection.set_many(view, state)
+                self._view_checked[group] = len(view) if state else 0
+        else:
+            self.store.set_all(state)
+
+    def _toggle_result(self, group, ordinal):
+        """Flip one shown result of `group` and return its new state."""
+        state = self.store.toggle(ordinal)
+        if self.filtered:
+            self._view_checked[group] += 1 if state else -1
+        return state
+
+class VirtualTree(_ResultView):
+    """
+    Shows a ResultStore in a ttk.Treeview, materializing only visible rows.
+
+    One instance is kept per Treeview for the lifetime of the app; activate()
+    and deactivate() switch the tree between virtual and normal mode.
+
+    Args:
+        tree: The ttk.Treeview to drive (see configure_check_tags)
+    """
+
+    def __init__(self, tree):
+        super().__init__(tree)
+        self.expanded = bytearray()
+        self.top = 0
+        self._pool = []        # Treeview iids, one per visible slot
+        self._slot_of = {}     # iid -> slot
+        self._scrollbar = None
+        self._row_height = None
+        self._group_undo = None  # (group, flags) of the group before the last header click
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, self._on_wheel, add="+")
+        tree.bind("<Configure>", lambda e: self._layout(), add="+")
+        tree.bind("<Double-1>", self._on_double_click, add="+")
+
+    # ----- mode switching -----
+    def activate(self, store):
+        """Show `store` in virtual mode, replacing the tree's current items."""
+        for iid in self.tree.get_children(""):
+            self.tree.delete(iid)
+        self.store = store
+        self._reset_views()
+        self._group_undo = None
+        self.expanded = bytearray(store.group_count())
+        self.top = 0
+        self._pool = []
+        self._slot_of = {}
+        self._take_scrollbar()
+        self._layout()
+
+    def deactivate(self):
+        """Leave virtual mode and give the scrollbar back to the Treeview."""
+        if not self.active:
+            return
+        for iid in self._pool:
+            try:
+                self.tree.delete(iid)
+            except Exception:
+                pass
+        self._pool = []
+        self._slot_of = {}
+        self.store = None
+        if self._scrollbar is not None:
+            try:
+                self._scrollbar.configure(command=self.tree.yview)
+                self.tree.configure(yscrollcommand=self._scrollbar.set)
+            except Exception:
+                pass
+
+    def _take_scrollbar(self):
+        """Point the tree's vertical scrollbar at this class instead of the Treeview."""
+        if self._scrollbar is None:
+            command = str(self.tree.cget("yscrollcommand") or "")
+            if command:
+                try:
+                    self._scrollbar = self.tree.nametowidget(command.split()[0])
+                except Exception:
+                    self._scrollbar = None
+        if self._scrollbar is not None:
+            self.tree.configure(yscrollcommand="")
+            self._scrollbar.configure(command=self.yview)
+
+    # ----- row model -----
+    def _group_rows(self, group):
+        if not self._group_visible(group):
+            return 0
+        return 1 + (len(self.views[group]) if self.expanded[group] else 0)
+
+    def total_rows(self):
+        """Return the number of display rows (headers plus expanded results)."""
+        if not self.active:
+            return 0
+        return sum(self._group_rows(g) for g in range(len(self.views)))
+
+    def row_at(self, index):
+        """Return (group, ordinal) for a display row; ordinal is None for headers."""
+        for group in range(len(self.views)):
+            rows = self._group_rows(group)
+            if index < rows:
+                return group, (None if index == 0 else self.views[group][index - 1])
+            index -= rows
+        return None
+
+    def row_of_iid(self, iid):
+        """Return (group, ordinal) shown by a pool item, or None."""
+        slot = self._slot_of.get(iid)
+        if slot is None:
+            return None
+        return self.row_at(self.top + slot)
+
+    # ----- interaction -----
+    def toggle(self, iid):
+        """Toggle the check of the row shown by `iid` (a header toggles its group)."""
+        row = self.row_of_iid(iid)
+        if row is None:
+            return
+        group, ordinal = row
+        if ordinal is None:
+            self._group_undo = (group, self._group_flags(group))
+            self._set_group_checked(group, not self._group_checked(group))
+        else:
+            self._group_undo = None
+            self._toggle_result(group, ordinal)
+        self.render()
+
+    def _group_flags(self, group):
+        """Return a copy of the check flags of a group's shown results."""
+        flags = self.store.selection.flags
+        view = self.views[group]
+        if isinstance(view, range):
+            return bytes(flags[view.start:view.stop])
+        return bytes(flags[o] for o in view)
+
+    def _restore_group_flags(self, group, saved):
+        selection = self.store.selection
+        for ordinal, flag in zip(self.views[group], saved):
+            selection.set(ordinal, flag)
+        if self.filtered:
+            self._view_checked[group] = sum(saved)
+
+    def set_all(self, state):
+        """Check or uncheck every shown result."""
+        self._group_undo = None
+        self._set_visible_checked(state)
+        self.render()
+
+    def set_filter(self, views):
+        """Show per-group ordinal lists (see ResultIndex.group_views), or all for None."""
+        self._group_undo = None
+        self._set_views(views)
+        self.top = 0
+        self._layout()
+
+    def set_expanded(self, group, state):
+        self.expanded[group] = 1 if state else 0
+        self.top = min(self.top, self._max_top())
+        self.render()
+
+    def expand_all(self, state):
+        self.expanded = bytearray([1 if state else 0]) * len(self.views)
+        self.top = min(self.top, self._max_top())
+        self.render()
+
+    def _on_double_click(self, event):
+        if not self.active:
+            return None
+        row = self.row_of_iid(self.tree.identify_row(event.y))
+        if row is not None and row[1] is None:
+            group = row[0]
+            # Undo the check toggle of the first click, keeping a partial selection
+            undo, self._group_undo = self._group_undo, None
+            if undo is not None and undo[0] == group:
+                self._restore_group_flags(group, undo[1])
+            self.set_expanded(group, not self.expanded[group])
+        return "break"
+
+    # ----- scrolling -----
+    def _visible_count(self):
+        if self._row_height is None:
+            try:
+                self._row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 0) or 20
+            except Exception:
+                self._row_height = 20
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return max(1, int(self.tree.cget("height") or 10))
+        rows = height // self._row_height
+        if "headings" in str(self.tree.cget("show")):
+            rows -= 1
+        return max(1, rows)
+
+    def _max_top(self):
+        return max(0, self.total_rows() - self._visible_count())
+
+    def yview(self, *args):
+        """Scrollbar command: supports 'moveto' and 'scroll' like Tk's yview."""
+        if not self.active or not args:
+            return
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * self.total_rows())
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= self._visible_count()
+            self.top += step
+        self.top = min(max(self.top, 0), self._max_top())
+        self.render()
+
+    def _on_wheel(self, event):
+        if not self.active:
+            return None
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.yview("scroll", delta * 3, "units")
+        return "break"
+
+    # ----- rendering -----
+    def _layout(self):
+        """Grow or shrink the item pool to the rows that fit, then render."""
+        if not self.active:
+            return
+        wanted = min(self._visible_count(), self.total_rows())
+        while len(self._pool) < wanted:
+            iid = self.tree.insert("", "end", text="")
+            self._slot_of[iid] = len(self._pool)
+            self._pool.append(iid)
+        while len(self._pool) > wanted:
+            iid = self._pool.pop()
+            self._slot_of.pop(iid, None)
+            self.tree.delete(iid)
+        self.top = min(self.top, self._max_top())
+        self.render()
+
+    def render(self):
+        """Bind the item pool to the rows currently scrolled into view."""
+        if not self.active:
+            return
+        total = self.total_rows()
+        if len(self._pool) != min(self._visible_count(), total):
+            self._layout()
+            return
+        store = self.store
+        for slot, iid in enumerate(self._pool):
+            group, ordinal = self.row_at(self.top + slot)
+            if ordinal is None:
+                marker = "▾" if self.expanded[group] else "▸"
+                _show_item(self.tree, iid, self._group_text(group, marker), self._group_checked(group))
+            else:
+                text = "      " + os.path.basename(store.paths[ordinal])
+                _show_item(self.tree, iid, text, store.is_checked(ordinal))
+
+        if self._scrollbar is not None:
+            if total:
+                self._scrollbar.set(self.top / total, min(1.0, (self.top + len(self._pool)) / total))
+            else:
+                self._scrollbar.set(0.0, 1.0)
+
+class LazyTree(_ResultView):
+    """
+    Shows a ResultStore as real Treeview items, inserting children lazily.
+
+    Each group gets one parent item showing its result count and size, plus
+    a placeholder child so Tk draws the expand indicator. The group's rows
+    are inserted the first time it is opened (<<TreeviewOpen>>), in
+    frame-budgeted slices so large groups never freeze the window. Check state
+    always lives in the store, so checking a collapsed parent is a single
+    slice assignment, and the materialized items follow through their tags.
+    Filtering detaches and re-attaches items with one `children` call per
+    parent.
+
+    Args:
+        tree: The ttk.Treeview to drive (see configure_check_tags)
+    """
+
+    def __init__(self, tree):
+        super().__init__(tree)
+        self._parents = []     # group -> parent iid
+        self._group_of = {}    # parent iid -> group
+        self._ordinal_of = {}  # child iid -> ordinal
+        self._children = {}    # group -> [child iids] in group order, once materialized
+        self._placeholders = {}  # group -> placeholder iid
+        self._loading = {}     # group -> ScheduledTask while its rows are being inserted
+
+        tree.bind("<<TreeviewOpen>>", self._on_open, add="+")
+
+    def activate(self, store):
+        """Show `store`, replacing the tree's current items."""
+        for iid in self.tree.get_children(""):
+            self.tree.delete(iid)
+        self._cancel_loading()
+        self.store = store
+        self._reset_views()
+        self._parents = []
+        self._group_of = {}
+        self._ordinal_of = {}
+        self._children = {}
+        self._placeholders = {}
+        for group in range(store.group_count()):
+            pid = self.tree.insert(
+                "", "end", text=f"  {self._group_text(group)}", open=False,
+                tags=_check_tags(store.group_checked(group)),
+            )
+            self._parents.append(pid)
+            self._group_of[pid] = group
+            self._placeholders[group] = self.tree.insert(pid, "end", text="")
+
+    def deactivate(self):
+        """Forget the store and remove its items."""
+        if not self.active:
+            return
+        self._cancel_loading()
+        for pid in self._parents:
+            try:
+                self.tree.delete(pid)
+            except Exception:
+                pass
+        self.store = None
+        self._reset_views()
+        self._parents = []
+        self._group_of = {}
+        self._ordinal_of = {}
+        self._children = {}
+        self._placeholders = {}
+
+    # ----- materialization -----
+    def _on_open(self, _event=None):
+        if not self.active:
+            return
+        group = self._group_of.get(self.tree.focus())
+        if group is not None:
+            self.materialize(group)
+
+    def materialize(self, group):
+        """Insert the rows of a group if they do not exist yet.
+
+        Rows are inserted by the frame scheduler; items toggled or filtered
+        while the group is still loading pick up the store state on insert.
+        """
+        if group in self._children:
+            return
+        placeholder = self._placeholders.pop(group, None)
+        if placeholder is not None:
+            self.tree.delete(placeholder)
+        pid = self._parents[group]
+        store = self.store
+        children = self._children[group] = []
+
+        def insert(ordinal):
+            iid = self.tree.insert(
+                pid, "end", text=f"  {os.path.basename(store.paths[ordinal])}",
+                tags=_check_tags(store.is_checked(ordinal)),
+            )
+            self._ordinal_of[iid] = ordinal
+            children.append(iid)
+
+        def done():
+            self._loading.pop(group, None)
+            if self.filtered:
+                self._attach_children(group)
+
+        self._loading[group] = get_scheduler(self.tree).run(store.group_range(group), insert, done)
+
+    def _cancel_loading(self):
+        for task in self._loading.values():
+            task.cancel()
+        self._loading = {}
+
+    def _shown_children(self, group):
+        """Return the materialized child iids of a group that pass the filter."""
+        children = self._children.get(group, ())
+        if not self.filtered or not children:
+            return children
+        start = self.store.group_range(group).start
+        loaded = len(children)
+        return [children[o - start] for o in self.views[group] if o - start < loaded]
+
+    def _attach_children(self, group):
+        self.tree.tk.call(self.tree._w, "children", self._parents[group], tuple(self._shown_children(group)))
+
+    def set_filter(self, views):
+        """Show per-group ordinal lists (see ResultIndex.group_views), or all for None."""
+        self._set_views(views)
+        for group, pid in enumerate(self._parents):
+            self.tree.item(pid, text=f"  {self._group_text(group)}")
+            self._show_parent(group)
+            if group in self._children:
+                self._attach_children(group)
+        shown = tuple(pid for group, pid in enumerate(self._parents) if self._group_visible(group))
+        self.tree.tk.call(self.tree._w, "children", "", shown)
+        self.render()
+
+    # ----- interaction -----
+    def row_of_iid(self, iid):
+        """Return (group, ordinal) shown by an item; ordinal is None for parents."""
+        if iid in self._group_of:
+            return self._group_of[iid], None
+        ordinal = self._ordinal_of.get(iid)
+        if ordinal is None:
+            return None
+        return self.store.group_of(ordinal), ordinal
+
+    def toggle(self, iid):
+        """Toggle the check of an item (a parent toggles its shown rows)."""
+        row = self.row_of_iid(iid)
+        if row is None:
+            return
+        group, ordinal = row
+        if ordinal is None:
+            state = not self._group_checked(group)
+            self._set_group_checked(group, state)
+            set_check_tags(self.tree, self._shown_children(group), state)
+        else:
+            self.tree.item(iid, tags=_check_tags(self._toggle_result(group, ordinal)))
+        self._show_parent(group)
+
+    def set_all(self, state):
+        """Check or uncheck every shown result."""
+        self._set_visible_checked(state)
+        if self.filtered:
+            self.render()
+        else:
+            set_check_tags(self.tree, None, state)
+
+    def expand_all(self, state):
+        for group, pid in enumerate(self._parents):
+            if state and self._group_visible(group):
+                self.materialize(group)
+            self.tree.item(pid, open=bool(state))
+
+    # ----- rendering -----
+    def _show_parent(self, group):
+        self.tree.item(self._parents[group], tags=_check_tags(self._group_checked(group)))
+
+    def render(self):
+        """Re-apply the check tags of every item from the store."""
+        if not self.active:
+            return
+        flags = self.store.selection.flags
+        for group in range(len(self._parents)):
+            self._show_parent(group)
+            children = self._children.get(group)
+            if children:
+                checked = [iid for iid in children if flags[self._ordinal_of[iid]]]
+                unchecked = [iid for iid in children if not flags[self._ordinal_of[iid]]]
+                set_check_tags(self.tree, checked, True)
+                set_check_tags(self.tree, unchecked, False)
@@ -29,15 +29,26 @@ from Modules.file_cleaner import find_bak_old_files, delete_files, scan_bak_old_
 from Modules.themes import apply_theme
 from Modules.orphan_cleaner import scan_orphans, delete_orphans, rebuild_addons_txt, collect_addon_names
 from Modules.folder_cleaner import scan_all_versions, clean_folders
-from Modules.settings import load_settings, save_settings, SETTINGS_FILE
+from Modules.settings import load_settings, save_settings, get_cache_dir, SETTINGS_FILE
+from Modules.performance import sweep_empty_dirs
+from Modules.result_store import ResultStore
+from Modules.result_filter import ResultIndex
 from Modules.ui_helpers import Tooltip, ImgAssets, ImgCheckbox, ImgRadio
-from Modules.logger import Logger
+from Modules.logger import Logger, MAX_MEMORY_LINES
+from Modules.log_adapter import LogAdapter, DEBUG, ERROR
+from Modules.log_archive import LogArchive, is_archive_index
 from Modules.Tabs.file_cleaner_tab import build_file_cleaner_tree as _build_file_cleaner_tab
 from Modules.Tabs.folder_cleaner_tab import build_folder_cleaner_tab as _build_folder_cleaner_tab
 from Modules.Tabs.orphan_cleaner_tab import build_orphan_cleaner_tab as _build_orphan_cleaner_tab
+from Modules.analytics_tab import build_analytics_tab as _build_analytics_tab
+from Modules.duplicates_tab import build_duplicates_tab as _build_duplicates_tab
+from Modules.folder_version_tab import build_single_version_tab as _build_single_version_tab, build_folder_tools_bar
+from Modules.screenshot_dialog import open_screenshot_optimizer as _open_screenshot_optimizer
+from Modules.retention_dialog import open_retention_dialog as _open_retention_dialog
+from Modules.cache_dialog import open_cache_dialog as _open_cache_dialog
 import Modules.tree_helpers as tree_helpers
 from Modules.game_validation import is_game_version_valid, show_game_validation_warning
-from Modules import font_selector, geometry, path_manager, ui_refresh, game_optimizer, update_checker, global_settings
+from Modules import font_selector, geometry, path_manager, ui_refresh, game_optimizer, update_checker, global_settings, thumbnail_cache
 from Modules.global_settings import get_global_setting, set_global_setting
 from Modules import localization
 
@@ -115,9 +126,18 @@ class WoWCleanupTool:
     def __init__(self, root):
         self.root = root
         self.settings = load_settings()
-        self.logger = Logger()
+        try:
+            max_log_lines = int(self.settings.get("log_max_lines", MAX_MEMORY_LINES))
+        except Exception:
+            max_log_lines = MAX_MEMORY_LINES
+        # Lines beyond the in-memory cap spill to a per-session file for export
+        self.logger = Logger(os.path.join(get_cache_dir("logs"), "session.log"), max_log_lines)
+        # Leveled front end handed to backend scans (see backend_logger)
+        self.log_adapter = LogAdapter(self.logger.log, ERROR, localization._)
         self.version_tabs = []
         self.folder_paths = {}
+        # (versions, sv_mtimes) of the last orphan scan, reused by the stale addon report
+        self.orphan_sv_mtimes = None
 
         # Base path for theme assets
         self.app_path = os.path.dirname(os.path.abspath(__file__))
@@ -225,11 +245,11 @@ class WoWCleanupTool:
         # Initialize localization
         saved_language = self.settings.get("language", None)
         if saved_language and saved_language in localization.AVAILABLE_LANGUAGES:
-            self.loc = localization.Localization(saved_language)
+            self.loc = localization.set_language(saved_language)
         else:
             # Auto-detect system language
             detected_lang = localization.DEFAULT_LANGUAGE
-            self.loc = localization.Localization(detected_lang)
+            self.loc = localization.set_language(detected_lang)
             self.settings["language"] = detected_lang
 
         # State
@@ -261,6 +281,15 @@ class WoWCleanupTool:
         if self.verbose_var.get():
             self.logger.log(text)
 
+    def backend_logger(self):
+        """Return the logger passed to backend operations (main thread only).
+
+        Verbose mode emits debug and info messages; otherwise only errors
+        are logged, and disabled messages are never formatted.
+        """
+        self.log_adapter.set_level(DEBUG if self.verbose_var.get() else ERROR)
+        return self.log_adapter
+
     # ------------- OS base theme -------------
     def _apply_os_base_theme(self):
         osname = platform.system()
@@ -378,7 +407,7 @@ class WoWCleanupTool:
         # Apply theme via the theme module
         apply_theme(
             root=self.root,
-            treeviews=[self.file_tree, self.orphan_tree],
+            treeviews=[self.file_tree, self.orphan_tree, self.analytics_tree, self.dup_tree],
             theme_name=theme,
             base_path=self.app_path,
         )
@@ -587,6 +616,7 @@ class WoWCleanupTool:
                 "Scans for .bak and .old backup files in your WoW folders.\n\n"
                 "• Click 'Scan' to find backup files\n"
                 "• Select files to remove using checkboxes\n"
+                "• Type in 'Filter' to narrow the list by name, *wildcards*, ext:, v: or size:\n"
                 "• Click 'Process Selected' to delete or move to recycle bin\n\n"
                 "Safe to use: These are backup files that can be removed."
             ),
@@ -596,7 +626,11 @@ class WoWCleanupTool:
                 "• Select version (Retail, Classic, etc.)\n"
                 "• Check folders you want to clean\n"
                 "• Click 'Preview' to see what will be removed\n"
-                "• Click 'Process Selected Folders' to clean\n\n"
+                "• Click 'Process Selected Folders' to clean\n"
+                "• 'Cache Cleaner' breaks Cache down by WDB/ADB locale and removes stale entries\n"
+                "• 'Retention Policies' keeps recent Logs/Errors/Screenshots and removes old bulk\n"
+                "• 'Optimize Screenshots' converts or archives instead of deleting\n"
+                "• 'Select Similar' keeps one screenshot of each burst of near-identical shots\n\n"
                 "Note: Cache and logs regenerate automatically."
             ),
             "orphan_cleaner": (
@@ -604,9 +638,30 @@ class WoWCleanupTool:
                 "Finds SavedVariables files for uninstalled addons.\n\n"
                 "• Scans AddOns.txt to find installed addons\n"
                 "• Compares with SavedVariables folder\n"
-                "• Lists orphaned files for removal\n\n"
+                "• Lists orphaned files for removal\n"
+                "• Type in 'Filter' to narrow the list by name, *wildcards*, ext:, v: or size:\n\n"
                 "Helps keep your SavedVariables folder clean."
             ),
+            "analytics": (
+                "Analytics Help\n\n"
+                "Read-only reports that show where space and load time go.\n\n"
+                "• Storage Breakdown: where each version's space goes, plus its largest files\n"
+                "• Unused AddOns: installed addons no character has enabled\n"
+                "• AddOn Disk Usage: size and file count of every addon\n"
+                "• Duplicate Libraries: identical Libs/ copies shipped by many addons\n"
+                "• Stale AddOns: addons whose saved data is months old\n"
+                "• Reports run in the background, grouped by version\n\n"
+                "Nothing is deleted from this tab."
+            ),
+            "duplicates": (
+                "Duplicates Help\n\n"
+                "Finds files that are identical across WoW versions.\n\n"
+                "• Click 'Scan' to compare AddOns, Screenshots and WTF\n"
+                "• 'Select Extra Copies' keeps the first copy of each screenshot group\n"
+                "• Click 'Process Selected' to delete or move to recycle bin\n\n"
+                "AddOns and WTF duplicates are report-only: removing an addon file\n"
+                "from one version breaks that addon there."
+            ),
             "game_optimizer": (
                 "Game Optimizer Help\n\n"
                 "Automatically configures WoW graphics settings based on your hardware.\n\n"
@@ -1011,7 +1066,7 @@ class WoWCleanupTool:
                 self.settings["theme"] = theme
                 
                 # Save the new language preference
-                self.loc = localization.Localization(new_lang)
+                self.loc = localization.set_language(new_lang)
                 self.settings["language"] = new_lang
                 
                 self.settings["verbose_logging"] = bool(self.verbose_var.get())
@@ -1166,6 +1221,7 @@ class WoWCleanupTool:
         self.main_notebook.add(self.cleaner_tab, text=f"🗂️  {_('file_cleaner')}")
         self._add_tab_help_icon(self.cleaner_tab, "file_cleaner")
         self.build_file_cleaner_tree(self.cleaner_tab)
+        tree_helpers.build_filter_bar(self, self.file_tree)
 
         # Folder Cleaner
         self.folder_tab = ttk.Frame(self.main_notebook)
@@ -1178,6 +1234,19 @@ class WoWCleanupTool:
         self.main_notebook.add(self.orphan_tab, text=f"🔍  {_('orphan_cleaner')}")
         self._add_tab_help_icon(self.orphan_tab, "orphan_cleaner")
         self.build_orphan_cleaner_tab(self.orphan_tab)
+        tree_helpers.build_filter_bar(self, self.orphan_tree)
+
+        # Analytics
+        self.analytics_tab = ttk.Frame(self.main_notebook)
+        self.main_notebook.add(self.analytics_tab, text=f"📊  {_('analytics')}")
+        self._add_tab_help_icon(self.analytics_tab, "analytics")
+        self.build_analytics_tab(self.analytics_tab)
+
+        # Duplicates
+        self.duplicates_tab = ttk.Frame(self.main_notebook)
+        self.main_notebook.add(self.duplicates_tab, text=f"🧬  {_('duplicates')}")
+        self._add_tab_help_icon(self.duplicates_tab, "duplicates")
+        self.build_duplicates_tab(self.duplicates_tab)
 
         # Game Optimizer
         self.optimizer_tab = ttk.Frame(self.main_notebook)
@@ -1230,13 +1299,8 @@ class WoWCleanupTool:
             for cb in self.styled_shot_boxes:
                 cb.assets = self.assets; cb._sync_image()
         if hasattr(self, "_build_checkbox_images"):
+            # Also re-points the File/Orphan/Duplicates tree check tags at the new images
             self._build_checkbox_images()
-            if hasattr(self, "file_tree"):
-                for iid in getattr(self, "tree_checks", {}):
-                    self._tree_set_icon(iid)
-            if hasattr(self, "orphan_tree"):
-                for iid in getattr(self, "orphan_checks", {}):
-                    self._orphan_tree_set_icon(iid)
 
     def _reload_all_custom_checkboxes(self):
         """
@@ -1244,17 +1308,8 @@ class WoWCleanupTool:
         Replaces checkbox images in file/orphan/folder cleaners.
         """
 
-        # File Cleaner
-        for iid, var in self.tree_checks.items():
-            # var is a boolean, not a BooleanVar
-            img = self.chk_checked if var else self.chk_unchecked
-            self.file_tree.item(iid, image=img)
-
-        # Orphan Cleaner
-        for iid, var in self.orphan_checks.items():
-            # var is a boolean, not a BooleanVar
-            img = self.chk_checked if var else self.chk_unchecked
-            self.orphan_tree.item(iid, image=img)
+        # File / Orphan Cleaner / Duplicates: check images come from the tree tags
+        tree_helpers.refresh_check_tags(self)
 
         # Folder cleaner uses per-version custom widgets,
         # so we only recolor frames/buttons normally.
@@ -1272,15 +1327,6 @@ class WoWCleanupTool:
     def build_file_cleaner_tree(self, parent):
         return _build_file_cleaner_tab(self, parent)
 
-    def _tree_add_parent(self, label):
-        return tree_helpers.file_tree_add_parent(self, label)
-
-    def _tree_add_child_file(self, parent_id, path):
-        return tree_helpers.file_tree_add_child_file(self, parent_id, path)
-
-    def _tree_set_icon(self, iid):
-        return tree_helpers.file_tree_set_icon(self, iid)
-
     def _on_tree_click(self, event):
         return tree_helpers.on_file_tree_click(self, event)
 
@@ -1307,7 +1353,7 @@ class WoWCleanupTool:
         
         Side Effects:
             - Clears file_tree widget contents
-            - Resets tree_checks and tree_paths dictionaries
+            - Clears the previous results and their selection
             - Updates file_scan_status label during scan
             - Sets _file_scan_in_progress flag during operation
         """
@@ -1317,10 +1363,9 @@ class WoWCleanupTool:
         self._file_scan_in_progress = True
         
         # Clear old tree visually and show scanning status
+        tree_helpers.clear_results(self, self.file_tree)
         for n in self.file_tree.get_children(""):
             self.file_tree.delete(n)
-        self.tree_checks.clear()
-        self.tree_paths.clear()
         self.tree_select_all_var.set(False)
         try:
             self.file_scan_status.configure(text=localization._("scanning"))
@@ -1334,7 +1379,7 @@ class WoWCleanupTool:
             return
 
         versions = self._enumerate_versions(base)
-        verbose_logger = self if self.verbose_var.get() else None
+        scan_logger = self.backend_logger()
 
         def worker():
             results = {}
@@ -1343,7 +1388,7 @@ class WoWCleanupTool:
             try:
                 with ThreadPoolExecutor(max_workers=max_workers) as ex:
                     future_map = {
-                        ex.submit(scan_bak_old_in_version, vpath, verbose_logger): vlabel
+                        ex.submit(scan_bak_old_in_version, vpath, scan_logger): vlabel
                         for vpath, vlabel in versions
                     }
                     for fut in as_completed(future_map):
@@ -1357,66 +1402,29 @@ class WoWCleanupTool:
             except Exception:
                 # Fallback to single-threaded on any executor issue
                 try:
-                    files_by_version = find_bak_old_files(versions, logger=verbose_logger)
+                    files_by_version = find_bak_old_files(versions, logger=scan_logger)
                     results.update(files_by_version or {})
                 except Exception:
                     pass
 
+            # Sizes are stat'ed and names indexed for the filter box here, off the UI thread
+            store = ResultStore.from_results(versions, results)
+            ResultIndex.for_store(store)
+
             def apply_results():
-                # Create parents first
-                version_parents = {}
-                total_count = 0
-                for _vpath, vlabel in versions:
-                    v_files = results.get(vlabel, [])
-                    if v_files:
-                        pid = self._tree_add_parent(vlabel)
-                        version_parents[vlabel] = (pid, v_files)
-                        total_count += len(v_files)
-
-                # Insert children in chunks to keep UI smooth
-                items = []
-                for vlabel, (pid, v_files) in version_parents.items():
-                    for f in v_files:
-                        items.append((pid, f))
-
-                chunk_size = 200
-                state = {"idx": 0, "n": len(items)}
-
-                def insert_chunk():
-                    end = min(state["idx"] + chunk_size, state["n"])
-                    for i in range(state["idx"], end):
-                        pid, fpath = items[i]
-                        self._tree_add_child_file(pid, fpath)
-                    state["idx"] = end
-                    if state["idx"] < state["n"]:
-                        self.root.after(0, insert_chunk)
+                # Version rows show counts and sizes; file rows are only
+                # created when a version is expanded (or, for very large
+                # results, only for the rows in view)
+                tree_helpers.show_results(self, self.file_tree, store)
+                try:
+                    if len(store):
+                        self.file_scan_status.configure(text=localization._("found_files_count").format(len(store)))
                     else:
-                        # Close parents and finalize status
-                        for pid, _ in version_parents.values():
-                            try:
-                                self.file_tree.item(pid, open=False)
-                            except Exception:
-                                pass
-                        try:
-                            if total_count:
-                                self.file_scan_status.configure(text=localization._("found_files_count").format(total_count))
-                            else:
-                                self.file_scan_status.configure(text=localization._("no_bak_old_found"))
-                        except Exception:
-                            pass
-                        self.log(localization._("file_scan").format(total_count))
-                        self._file_scan_in_progress = False
-
-                # Kick off chunked insertion (or finalize immediately)
-                if items:
-                    self.root.after(0, insert_chunk)
-                else:
-                    try:
                         self.file_scan_status.configure(text=localization._("no_bak_old_found"))
-                    except Exception:
-                        pass
-                    self.log(localization._("file_scan").format(0))
-                    self._file_scan_in_progress = False
+                except Exception:
+                    pass
+                self.log(localization._("file_scan").format(len(store)))
+                self._file_scan_in_progress = False
 
             # Schedule UI updates on main thread
             try:
@@ -1441,11 +1449,8 @@ class WoWCleanupTool:
             - Prompts user for confirmation dialog
             - Updates tree after deletion
         """
-        selected = [
-            path
-            for iid, path in self.tree_paths.items()
-            if self.tree_checks.get(iid, False)
-        ]
+        view = tree_helpers.active_view(self, self.file_tree)
+        selected = view.store.checked_paths() if view else []
         if not selected:
             messagebox.showinfo(localization._("no_selection"), localization._("no_files_selected"))
             return
@@ -1475,10 +1480,11 @@ class WoWCleanupTool:
         processed, permanently_deleted, used_trash = delete_files(
             selected,
             use_trash=use_trash_requested,
-            logger=self if self.verbose_var.get() else None,
+            logger=self.backend_logger(),
         )
 
         self.log(localization._("file_processed").format(processed))
+        self._sweep_empty_dirs(selected, "FileCleaner")
         messagebox.showinfo(localization._("completed"), localization._("processed_files_count").format(processed))
 
         # Refresh the tree to reflect deletions
@@ -1486,16 +1492,54 @@ class WoWCleanupTool:
 
     # ------------- Folder Cleaner -------------
     def build_folder_cleaner_tab(self, parent):
-        return _build_folder_cleaner_tab(self, parent)
+        result = _build_folder_cleaner_tab(self, parent)
+        build_folder_tools_bar(self, parent)
+        return result
 
     def _build_single_version_tab(self, tab, version_path, version_label):
-        from Modules.Tabs.folder_helpers import build_single_version_tab as _bsv
-        return _bsv(self, tab, version_path, version_label)
+        return _build_single_version_tab(self, tab, version_path, version_label)
 
     def _show_preview(self, canvas: tk.Canvas, path: str):
+        """
+        Show a screenshot preview on a canvas.
+
+        Cached thumbnails are drawn immediately; otherwise the thumbnail is
+        generated in the background and drawn when ready, unless another
+        screenshot was selected in the meantime.
+        """
+        canvas._preview_path = path
+        thumb = thumbnail_cache.get_cached_thumbnail(path)
+        if thumb:
+            self._draw_preview(canvas, thumb)
+            return
+
+        try:
+            canvas.delete("all"); canvas._img_ref = None
+        except Exception:
+            pass
+
+        def on_ready(thumb_path):
+            def apply():
+                if thumb_path and getattr(canvas, "_preview_path", None) == path:
+                    self._draw_preview(canvas, thumb_path)
+            try:
+                self.root.after(0, apply)
+            except Exception:
+                pass
+
+        thumbnail_cache.request_thumbnail(path, on_ready)
+
+    def _draw_preview(self, canvas: tk.Canvas, thumb_path: str):
         try:
-            from Modules.Tabs.folder_helpers import show_preview as _show_preview
-            _show_preview(self, canvas, path)
+            with Image.open(thumb_path) as im:
+                cw = max(canvas.winfo_width(), 1)
+                ch = max(canvas.winfo_height(), 1)
+                im = im.copy()
+                im.thumbnail((cw, ch))
+                photo = ImageTk.PhotoImage(im)
+            canvas.delete("all")
+            canvas.create_image(cw // 2, ch // 2, image=photo, anchor="center")
+            canvas._img_ref = photo
         except Exception:
             try:
                 canvas.delete("all"); canvas._img_ref = None
@@ -1552,50 +1596,43 @@ class WoWCleanupTool:
         processed, permanently_deleted, used_trash = clean_folders(
             selected,
             use_trash=use_trash_requested,
-            logger=self if self.verbose_var.get() else None
+            logger=self.backend_logger()
         )
 
         self.log(localization._("folder_processed").format(processed))
+        self._sweep_empty_dirs(selected, "FolderCleaner")
         messagebox.showinfo(localization._("completed"), localization._("processed_folders_count").format(processed))
 
-        # Rebuild UI for this version tab
-        # This calls _build_single_version_tab again to refresh the toggles
+        # Drop the rows of removed folders from this version tab
         self.refresh_folder_cleaner_version(version_label)
 
     def refresh_folder_cleaner_version(self, version_label):
         """
-        Rebuilds a single Folder Cleaner version tab after cleanup.
+        Brings a single Folder Cleaner version tab up to date after cleanup.
+
+        Rows are added or removed in place (see ui_refresh.sync_folder_cleaner_version);
+        the tab is only rebuilt when its widgets do not support that.
         """
         # Find the correct tab and frame for the version
-        target_frame = None
-        target_path = None
-        
         for i, (tab_label, tab_path, widgets) in enumerate(self.version_tabs):
             if tab_label == version_label:
-                # Get the actual frame widget for this tab
-                tab_id = self.version_notebook.tabs()[i]
-                target_frame = self.version_notebook.nametowidget(tab_id)
-                target_path = tab_path
                 break
-        
-        if not target_frame:
+        else:
             return  # Version not found (safe fallback)
 
-        # Clear widgets on the tab
+        if ui_refresh.sync_folder_cleaner_version(self, tab_path, widgets):
+            return
+
+        # Get the actual frame widget for this tab and rebuild it
+        tab_id = self.version_notebook.tabs()[i]
+        target_frame = self.version_notebook.nametowidget(tab_id)
         for widget in target_frame.winfo_children():
             widget.destroy()
+        self._build_single_version_tab(target_frame, tab_path, version_label)
 
-        # Rebuild the version tab UI
-        self._build_single_version_tab(target_frame, target_path, version_label)
-
-    def _toggle_all_screenshot_files(self, shots_vars):
-        any_unchecked = any(not v.get() for v in shots_vars.values())
-        for v in shots_vars.values():
-            v.set(any_unchecked)
-        # Update visual appearance for all screenshot checkboxes
-        if hasattr(self, 'styled_shot_boxes'):
-            for cb in self.styled_shot_boxes:
-                cb._sync_image()
+    def _toggle_all_screenshot_files(self, shots_list, state):
+        """Check or uncheck every screenshot of a version tab's VirtualScreenshotList."""
+        shots_list.set_all(state)
 
     def _reset_screenshot_select_all(self, version_label):
         """Reset the select/deselect all screenshots toggle for a version tab."""
@@ -1607,19 +1644,121 @@ class WoWCleanupTool:
                         shots_select_all_var.set(False)
                     break
 
-    def _process_selected_screenshots(self, version_label, shots_vars):
+    def _sweep_empty_dirs(self, deleted_paths, module_name="FileOps"):
+        """
+        Remove folders left empty by a deletion (see performance.sweep_empty_dirs).
+
+        The sweep stays inside the WoW version folders and never removes
+        WTF, Interface or AddOns.
+
+        Args:
+            deleted_paths: Paths that were just deleted or moved to trash
+            module_name: Name for log messages
+
+        Returns:
+            int: Number of removed folders
+        """
+        base = self.wow_path_var.get().strip()
+        if not base or not os.path.isdir(base):
+            return 0
+        roots = [vpath for vpath, _vlabel in self._enumerate_versions(base)]
+        removed = sweep_empty_dirs(
+            deleted_paths,
+            roots,
+            logger=self.backend_logger(),
+            module_name=module_name,
+        )
+        if removed:
+            self.log(localization._("empty_dirs_removed").format(len(removed)))
+        return len(removed)
+
+    def _open_cache_cleaner(self):
+        """Open the per-locale Cache (WDB/ADB) cleaner dialog."""
+        _open_cache_dialog(self)
+
+    def _open_retention_policies(self):
+        """Open the Logs/Errors/Screenshots retention policy dialog."""
+        _open_retention_dialog(self)
+
+    def _open_screenshot_optimizer(self, version_label=None, shots_list=None):
+        """
+        Open the screenshot optimizer (convert to JPEG/WebP or archive old screenshots).
+
+        Args:
+            version_label: Optional version label to limit the work to
+            shots_list: Optional VirtualScreenshotList; when it has a selection
+                        only those screenshots are converted
+        """
+        paths = shots_list.selected_paths() if shots_list is not None else None
+        _open_screenshot_optimizer(self, version_label, paths or None)
+
+    def _select_similar_screenshots(self, version_label, shots_list):
+        """
+        Group near-identical screenshots and select all but one per cluster.
+
+        Hashing runs in the background. Clustered screenshots are moved to the
+        top of the list, numbered by cluster, and every member except the
+        largest file (the most detailed shot) is checked for removal.
+
+        Args:
+            version_label: Version label (e.g., 'Retail', 'Classic')
+            shots_list: The version's VirtualScreenshotList
+        """
+        from Modules.screenshot_similarity import find_similar_screenshots
+
+        paths = shots_list.paths()
+        sizes = dict(zip(paths, shots_list.sizes()))
+        if not paths:
+            return
+        logger = self.backend_logger()
+
+        def worker():
+            try:
+                clusters = find_similar_screenshots(paths, logger=logger)
+            except Exception as e:
+                clusters = []
+                message = str(e)
+                self.root.after(0, lambda: self.log(localization._("similar_failed").format(version_label, message)))
+
+            def apply():
+                ordered, groups, redundant = [], [], []
+                clustered = set()
+                for number, members in enumerate(clusters):
+                    keep = max(members, key=lambda p: sizes.get(p, 0))
+                    for path in members:
+                        ordered.append(path)
+                        groups.append(number)
+                        clustered.add(path)
+                        if path != keep:
+                            redundant.append(path)
+                for path in paths:
+                    if path not in clustered:
+                        ordered.append(path)
+                        groups.append(-1)
+                shots_list.set_paths(ordered, [sizes.get(p, 0) for p in ordered], groups)
+                shots_list.set_selected(redundant)
+                self.log(localization._("similar_selected").format(version_label, len(clusters), len(redundant)))
+
+            try:
+                self.root.after(0, apply)
+            except Exception:
+                pass
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _process_selected_screenshots(self, version_label, shots_list):
         """
         Process (delete/trash) selected screenshot files from the Folder Cleaner tab.
         
         Args:
             version_label: Version label (e.g., 'Retail', 'Classic')
-            shots_vars: Dictionary mapping file paths to BooleanVar checkboxes
+            shots_list: The version tab's VirtualScreenshotList
         """
         from tkinter import messagebox
         from Modules.file_cleaner import delete_files
         
         # Get selected screenshot files
-        selected = [path for path, var in shots_vars.items() if var.get()]
+        selected = shots_list.selected_paths()
         
         if not selected:
             messagebox.showinfo(localization._("no_selection"), localization._("no_screenshots_selected"))
@@ -1637,37 +1776,13 @@ class WoWCleanupTool:
         processed, permanently_deleted, used_trash = delete_files(
             selected,
             use_trash=use_trash,
-            logger=self if self.verbose_var.get() else None
+            logger=self.backend_logger()
         )
         
         self.log(localization._("folder_processed_screenshots").format(version_label, processed))
         
-        # Check if Screenshots folder is now empty of image files and delete if so
-        if processed > 0:
-            # Get the Screenshots folder path for this version
-            screenshots_folder = None
-            if hasattr(self, 'folder_paths') and version_label in self.folder_paths:
-                screenshots_folder = self.folder_paths[version_label].get("Screenshots")
-            
-            if screenshots_folder and os.path.isdir(screenshots_folder):
-                # Check if there are any remaining image files
-                try:
-                    remaining_images = []
-                    for fname in os.listdir(screenshots_folder):
-                        fp = os.path.join(screenshots_folder, fname)
-                        if os.path.isfile(fp) and fname.lower().endswith((".jpg", ".jpeg", ".png", ".bmp", ".tga", ".gif")):
-                            remaining_images.append(fp)
-                    
-                    # If no image files remain, delete the Screenshots folder
-                    if not remaining_images:
-                        try:
-                            import shutil
-                            shutil.rmtree(screenshots_folder)
-                            self.log(localization._("folder_deleted_screenshots_folder").format(version_label))
-                        except Exception as e:
-                            self.log(localization._("folder_delete_screenshots_failed").format(version_label, e))
-                except Exception:
-                    pass
+        # Remove the Screenshots folder if nothing (not even an Archive) is left in it
+        self._sweep_empty_dirs(selected, "Screenshots")
         
         messagebox.showinfo(localization._("completed"), localization._("processed_screenshots_count").format(processed))
         
@@ -1681,15 +1796,6 @@ class WoWCleanupTool:
     def build_orphan_cleaner_tab(self, parent):
         return _build_orphan_cleaner_tab(self, parent)
 
-    def _orphan_tree_add_parent(self, label):
-        return tree_helpers.orphan_tree_add_parent(self, label)
-
-    def _orphan_tree_add_child_file(self, parent_id, path):
-        return tree_helpers.orphan_tree_add_child_file(self, parent_id, path)
-
-    def _orphan_tree_set_icon(self, iid):
-        return tree_helpers.orphan_tree_set_icon(self, iid)
-
     def _on_orphan_tree_click(self, event):
         return tree_helpers.on_orphan_tree_click(self, event)
 
@@ -1704,10 +1810,9 @@ class WoWCleanupTool:
 
     def scan_orphan_savedvars(self):
         # Clear UI state
+        tree_helpers.clear_results(self, self.orphan_tree)
         for n in self.orphan_tree.get_children(""):
             self.orphan_tree.delete(n)
-        self.orphan_checks.clear()
-        self.orphan_paths.clear()
         self.orphan_select_all_var.set(False)
 
         base = self.wow_path_var.get().strip()
@@ -1717,26 +1822,19 @@ class WoWCleanupTool:
 
         versions = self._enumerate_versions(base)
 
-        # Backend call (pure logic)
+        # Backend call (pure logic); the SavedVariables mtimes feed the stale addon report
+        sv_mtimes = {}
         orphan_data = scan_orphans(
             versions,
-            logger=self if self.verbose_var.get() else None,
+            logger=self.backend_logger(),
+            sv_mtimes=sv_mtimes,
         )
+        self.orphan_sv_mtimes = (versions, sv_mtimes)
 
-        total = 0
-
-        # Rebuild UI tree using backend results
-        for vpath, vlabel in versions:
-            v_orphans = orphan_data.get(vlabel)
-            if not v_orphans:
-                continue
-
-            pid = self._orphan_tree_add_parent(vlabel)
-            for fpath in v_orphans:
-                self._orphan_tree_add_child_file(pid, fpath)
-                total += 1
-
-            self.orphan_tree.item(pid, open=False)
+        # Rebuild UI tree using backend results; orphan rows are created on expand
+        store = ResultStore.from_results(versions, orphan_data)
+        tree_helpers.show_results(self, self.orphan_tree, store)
+        total = len(store)
 
         if total:
             self.orphan_scan_status.configure(
@@ -1750,11 +1848,8 @@ class WoWCleanupTool:
         self.log(localization._("orphan_scan").format(total))
 
     def process_selected_orphans(self):
-        selected = [
-            path
-            for iid, path in self.orphan_paths.items()
-            if self.orphan_checks.get(iid, False)
-        ]
+        view = tree_helpers.active_view(self, self.orphan_tree)
+        selected = view.store.checked_paths() if view else []
 
         if not selected:
             messagebox.showinfo(localization._("no_selection"), localization._("no_orphans_selected"))
@@ -1784,10 +1879,11 @@ class WoWCleanupTool:
         processed, permanently_deleted, used_trash = delete_orphans(
             selected,
             use_trash=use_trash_requested,
-            logger=self if self.verbose_var.get() else None,
+            logger=self.backend_logger(),
         )
 
         self.log(localization._("orphan_processed").format(processed))
+        self._sweep_empty_dirs(selected, "OrphanCleaner")
         messagebox.showinfo(localization._("completed"), localization._("processed_orphans_count").format(processed))
 
         # Refresh
@@ -1813,7 +1909,7 @@ class WoWCleanupTool:
             rebuilt, removed = rebuild_addons_txt(
                 vpath,
                 installed,
-                logger=self if self.verbose_var.get() else None,
+                logger=self.backend_logger(),
             )
 
             written_count = sum(len(v) for v in rebuilt.values())
@@ -1831,6 +1927,14 @@ class WoWCleanupTool:
             localization._("rebuilt_addons_summary").format(total_written, total_removed)
         )
 
+    # ------------- Analytics -------------
+    def build_analytics_tab(self, parent):
+        return _build_analytics_tab(self, parent)
+
+    # ------------- Duplicates -------------
+    def build_duplicates_tab(self, parent):
+        return _build_duplicates_tab(self, parent)
+
     # ------------- Help & Log -------------
     def build_optimization_suggestions_tab(self, parent):
         """Build the Optimization Suggestions tab with manual recommendations."""
@@ -2089,84 +2193,56 @@ class WoWCleanupTool:
                 if os.path.exists(docs):
                     default_dir = docs
             
-            # Get timestamp for default filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_filename = f"wow_cleanup_log_{timestamp}.txt"
+            mode = self.external_log_mode_var.get()
+            if mode == "fresh":
+                # Get timestamp for default filename
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                default_filename = f"wow_cleanup_log_{timestamp}.txt"
+                extension = ".txt"
+                filetypes = [("Text Files", "*.txt"), ("All Files", "*.*")]
+            else:
+                # Append mode exports into one archive index reused across sessions
+                default_filename = "wow_cleanup_log_archive.json"
+                extension = ".json"
+                filetypes = [(localization._("log_archive_files"), "*.json"), ("All Files", "*.*")]
             
             # Ask user where to save
             filepath = filedialog.asksaveasfilename(
                 title="Export Log",
                 initialdir=default_dir,
                 initialfile=default_filename,
-                defaultextension=".txt",
-                filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+                defaultextension=extension,
+                filetypes=filetypes
             )
             
             if not filepath:
                 return  # User cancelled
             
-            # Get log content
-            log_lines = self.logger.get_lines()
-            if not log_lines:
+            # Log content is streamed (spilled lines first), never held in full
+            if not self.logger.line_count():
                 messagebox.showinfo(localization._("export_log"), localization._("log_empty_nothing_export"))
                 return
             
-            # Determine mode
-            mode = self.external_log_mode_var.get()
             # Max sessions: 10 for verbose logging (more output), 20 for normal logging
             max_sessions = 10 if self.verbose_var.get() else 20
             
             if mode == "fresh":
                 # Fresh mode: overwrite file
                 with open(filepath, "w", encoding="utf-8") as f:
-                    for line in log_lines:
+                    for line in self.logger.iter_lines():
                         f.write(line + "\n")
             else:
-                # Append mode: add to existing file with session limit
-                existing_content = ""
-                if os.path.exists(filepath):
-                    try:
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            existing_content = f.read()
-                    except Exception:
-                        existing_content = ""
-                
-                # Parse existing sessions if file exists
-                if existing_content:
-                    # Split by session markers
-                    session_marker = "=" * 80
-                    sessions = []
-                    current_session = []
-                    
-                    for line in existing_content.split("\n"):
-                        if line.strip() == session_marker:
-                            if current_session:
-                                sessions.append("\n".join(current_session))
-                                current_session = []
-                        current_session.append(line)
-                    
-                    # Add last session if exists
-                    if current_session:
-                        sessions.append("\n".join(current_session))
-                    
-                    # Keep only the most recent (max_sessions - 1) to make room for new session
-                    if len(sessions) >= max_sessions:
-                        sessions = sessions[-(max_sessions - 1):]
-                    
-                    # Write back existing sessions
-                    with open(filepath, "w", encoding="utf-8") as f:
-                        for session in sessions:
-                            f.write(session)
-                            if not session.endswith("\n"):
-                                f.write("\n")
-                
-                # Append new session with separator
-                with open(filepath, "a", encoding="utf-8") as f:
-                    f.write("\n" + "="*80 + "\n")
-                    f.write(f"Session: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("="*80 + "\n")
-                    for line in log_lines:
-                        f.write(line + "\n")
+                # Append mode: write one new session segment and update the
+                # archive index; older sessions are not re-read or rewritten
+                if os.path.exists(filepath) and not is_archive_index(filepath):
+                    messagebox.showerror(localization._("export_error"), localization._("log_archive_invalid").format(filepath))
+                    return
+                archive = LogArchive(
+                    filepath,
+                    max_sessions=max_sessions,
+                    compress=bool(self.settings.get("log_archive_compress", True)),
+                )
+                archive.append_session(self.logger.iter_lines())
             
             messagebox.showinfo(localization._("export_log_title"), localization._("log_exported").format(filepath))
             
@@ -2186,34 +2262,10 @@ class WoWCleanupTool:
                 pass
 
     def log(self, text, always_log=False):
-        # If always_log is True, bypass verbose check and log regardless
-        if always_log:
-            try:
-                self.logger.log(text)
-            except Exception:
-                # Fallback: directly append to UI text widget
-                try:
-                    line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {text}"
-                    self.log_text.configure(state="normal")
-                    self.log_text.insert("end", line + "\n")
-                    self.log_text.see("end")
-                    self.log_text.configure(state="disabled")
-                except Exception:
-                    pass
-        else:
-            # Delegate to the external logger module
-            try:
-                self.logger.log(text)
-            except Exception:
-                # Fallback: directly append to UI text widget
-                try:
-                    line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {text}"
-                    self.log_text.configure(state="normal")
-                    self.log_text.insert("end", line + "\n")
-                    self.log_text.see("end")
-                    self.log_text.configure(state="disabled")
-                except Exception:
-                    pass
+        # Thread-safe: the logger queues the line and the Log tab picks it up
+        # on the main thread. `always_log` is kept for callers that bypass
+        # verbose checks; every line passed here is logged.
+        self.logger.log(text)
 
     # ------------- Defaults, Updates, Startup -------------
     def restore_defaults(self):
@@ -2393,4 +2445,7 @@ def main():
                 pass  # Ignore cleanup errors
 
 if __name__ == "__main__":
+    # Required for the screenshot process pool in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()